@@ -0,0 +1,141 @@
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from benchmarks.harness import (best_of, find_regressions, load_baseline, measure_allocations, print_table,
+                                save_baseline, time_calls)
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "energy.json")
+CURRENT_TIME = datetime(2025, 10, 16, 14, 0, 0)
+
+# Curvas de escala: cada cenário é medido para todos os tamanhos
+SCENARIOS = {
+    "shedding_overage": (10, 1000, 100000),
+    "schedule_list": (100, 10000, 100000),
+    "schedule_index": (100, 10000, 100000),
+    "device_priorities": (10, 100, 1000, 10000),
+}
+
+
+def make_arguments(scenario: str, size: int) -> dict:
+    device_priorities = {"Security": 1, "Refrigerator": 1, "Lights": 2, "Oven": 3, "TV": 2}
+    arguments = dict(
+        current_price=0.30,
+        price_threshold=0.20,
+        device_priorities=device_priorities,
+        current_time=CURRENT_TIME,
+        current_temperature=22.0,
+        desired_temperature_range=(20.0, 24.0),
+        energy_usage_limit=50.0,
+        total_energy_used_today=25.0,
+        scheduled_devices=[],
+    )
+
+    if scenario == "shedding_overage":
+        # Preço baixo mantém todos os dispositivos ligados para que o limite precise desligá-los
+        arguments["current_price"] = 0.10
+        arguments["device_priorities"] = {f"Device{i}": 2 for i in range(100)}
+        arguments["total_energy_used_today"] = arguments["energy_usage_limit"] + size
+    elif scenario in ("schedule_list", "schedule_index"):
+        start = CURRENT_TIME - timedelta(minutes=15 * (size // 2))
+        schedules = [DeviceSchedule(f"Device{i % 20}", start + timedelta(minutes=15 * i)) for i in range(size)]
+        arguments["scheduled_devices"] = schedules if scenario == "schedule_list" else ScheduleIndex(schedules)
+    elif scenario == "device_priorities":
+        arguments["device_priorities"] = {f"Device{i}": 1 + i % 3 for i in range(size)}
+        arguments["total_energy_used_today"] = 60.0
+    else:
+        raise ValueError(f"Unknown scenario: {scenario}")
+    return arguments
+
+
+def make_calls(scenario: str, size: int, calls: int) -> list:
+    energy_system = SmartEnergyManagementSystem()
+    arguments = make_arguments(scenario, size)
+    return [(lambda: energy_system.manage_energy(**arguments), 1)] * calls
+
+
+def calls_for(size: int, budget: int) -> int:
+    # Menos chamadas para tamanhos grandes, mantendo o tempo total de cada medição parecido
+    return max(5, min(2000, budget // size))
+
+
+def run_benchmarks(repeat: int = 3, budget: int = 2_000_000, allocations: bool = True) -> dict:
+    results = {}
+    for scenario, sizes in SCENARIOS.items():
+        for size in sizes:
+            calls = calls_for(size, budget)
+            time_calls(make_calls(scenario, size, calls))
+            metrics = best_of([time_calls(make_calls(scenario, size, calls)) for _ in range(repeat)])
+            if allocations:
+                call_list = make_calls(scenario, size, 1)
+                metrics.update(measure_allocations(lambda: [call() for call, _ in call_list]))
+            results[f"{scenario}/{size}"] = metrics
+    return results
+
+
+def profile_scenario(scenario: str, size: int, calls: int, top: int) -> None:
+    call_list = make_calls(scenario, size, calls)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for call, _ in call_list:
+        call()
+    profiler.disable()
+    print(f"\ncProfile: {scenario}/{size}")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+
+
+def trace_scenario(scenario: str, size: int, top: int) -> None:
+    call_list = make_calls(scenario, size, 1)
+    tracemalloc.start()
+    try:
+        for call, _ in call_list:
+            call()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    print(f"\ntracemalloc: {scenario}/{size}")
+    for statistic in snapshot.statistics("lineno")[:top]:
+        print(f"  {statistic}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark and profile SmartEnergyManagementSystem.manage_energy.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per benchmark (best is kept).")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="Allowed slowdown factor over the baseline, minus one.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Path of the stored baseline.")
+    parser.add_argument("--check", action="store_true", help="Fail if results regress against the baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline.")
+    parser.add_argument("--profile", action="store_true", help="Print a cProfile report per scenario.")
+    parser.add_argument("--tracemalloc", action="store_true", help="Print the top allocation sites per scenario.")
+    parser.add_argument("--top", type=int, default=10, help="Lines shown by --profile and --tracemalloc.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat)
+    print_table(results, "calls")
+
+    for scenario, sizes in SCENARIOS.items():
+        if args.profile:
+            profile_scenario(scenario, sizes[-1], calls_for(sizes[-1], 2_000_000), args.top)
+        if args.tracemalloc:
+            trace_scenario(scenario, sizes[-1], args.top)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+
+    if args.check:
+        regressions = find_regressions(results, load_baseline(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.EnergySimulator import EnergySimulator
+from src.energy.HomeProfile import HomeProfile
+
+DEVICE_POWER = {"Security": 0.1, "Refrigerator": 0.2, "Lights": 0.5, "Oven": 2.0, "Heating": 3.0,
+                "Cooling": 2.5, "Washer": 1.2, "Dryer": 2.2, "TV": 0.3, "EVCharger": 7.0}
+
+
+def generate_homes(homes: int, days: int, seed: int, start: datetime) -> tuple:
+    rng = random.Random(seed)
+    profiles = []
+    temperatures = []
+    for _ in range(homes):
+        device_priorities = {device: rng.randint(1, 3) for device in DEVICE_POWER if rng.random() < 0.8}
+        schedules = [DeviceSchedule(rng.choice(list(DEVICE_POWER)), start + timedelta(hours=rng.randrange(24 * days)))
+                     for _ in range(rng.randint(0, 3 * days))]
+        profiles.append(HomeProfile(device_priorities, rng.choice([0.2, 0.25, 0.3]), (18.0, 24.0),
+                                    rng.choice([20.0, 30.0, 45.0]), schedules))
+        offset = rng.uniform(-6, 6)
+        temperatures.append([21 + offset + 7 * math.sin(hour / 24 * 2 * math.pi) for hour in range(24 * days)])
+    prices = [0.15 + 0.15 * math.sin(hour / 24 * 2 * math.pi - 1) ** 2 for hour in range(24 * days)]
+    return profiles, prices, temperatures
+
+
+def naive_simulation(profiles, start, prices, temperatures) -> None:
+    energy_system = SmartEnergyManagementSystem()
+    for home, home_temperatures in zip(profiles, temperatures):
+        total = 0.0
+        for step, (price, temperature) in enumerate(zip(prices, home_temperatures)):
+            current_time = start + timedelta(hours=step)
+            if current_time.hour == 0:
+                total = 0.0
+            result = energy_system.manage_energy(price, home.price_threshold, home.device_priorities, current_time,
+                                                 temperature, home.desired_temperature_range,
+                                                 home.energy_usage_limit, total, home.scheduled_devices)
+            total += sum(DEVICE_POWER.get(device, 0.0) for device, on in result.device_status.items() if on)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark simulated home-days per second.")
+    parser.add_argument("--homes", type=int, default=500, help="Number of simulated homes.")
+    parser.add_argument("--days", type=int, default=7, help="Days of hourly series per home.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic homes.")
+    args = parser.parse_args(argv)
+
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    profiles, prices, temperatures = generate_homes(args.homes, args.days, args.seed, start)
+    home_days = args.homes * args.days
+
+    simulator = EnergySimulator(DEVICE_POWER)
+    began = time.perf_counter()
+    simulator.simulate_fleet(profiles, start, prices, temperatures)
+    simulated = time.perf_counter() - began
+
+    began = time.perf_counter()
+    naive_simulation(profiles, start, prices, temperatures)
+    naive = time.perf_counter() - began
+
+    print(f"{'engine':<24} {'home-days/s':>14} {'seconds':>10}")
+    print(f"{'EnergySimulator':<24} {home_days / simulated:>14.1f} {simulated:>10.3f}")
+    print(f"{'manage_energy loop':<24} {home_days / naive:>14.1f} {naive:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.FleetEnergyManager import FleetEnergyManager
+
+DEVICE_NAMES = ["Security", "Refrigerator", "Lights", "Heating", "Cooling", "Oven", "Washer", "TV", "Dryer"]
+
+
+def generate_fleet(homes: int, profiles: int, seed: int) -> dict:
+    # profiles == 0: cada casa com sua própria linha de prioridades
+    rng = random.Random(seed)
+    shared = [[rng.choice([None, 1, 2, 3]) for _ in DEVICE_NAMES] for _ in range(profiles)]
+    fleet = {
+        "current_prices": [], "price_thresholds": [], "current_hours": [], "current_temperatures": [],
+        "min_temperatures": [], "max_temperatures": [], "energy_usage_limits": [],
+        "total_energy_used_today": [], "device_priorities": [],
+    }
+    for _ in range(homes):
+        fleet["current_prices"].append(rng.uniform(0.05, 0.5))
+        fleet["price_thresholds"].append(rng.choice([0.2, 0.25]))
+        fleet["current_hours"].append(rng.randint(0, 23))
+        fleet["current_temperatures"].append(rng.uniform(10.0, 32.0))
+        fleet["min_temperatures"].append(18.0)
+        fleet["max_temperatures"].append(24.0)
+        limit = rng.choice([20.0, 40.0, 50.0])
+        fleet["energy_usage_limits"].append(limit)
+        fleet["total_energy_used_today"].append(rng.choice([limit - 5, limit - 1, limit, limit + 2.5]))
+        fleet["device_priorities"].append(list(rng.choice(shared)) if profiles
+                                          else [rng.choice([None, 1, 2, 3]) for _ in DEVICE_NAMES])
+    return fleet
+
+
+def scalar_fleet(energy_system: SmartEnergyManagementSystem, fleet: dict) -> list:
+    results = []
+    for home in range(len(fleet["current_prices"])):
+        results.append(energy_system.manage_energy(
+            current_price=fleet["current_prices"][home],
+            price_threshold=fleet["price_thresholds"][home],
+            device_priorities={name: priority for name, priority
+                               in zip(DEVICE_NAMES, fleet["device_priorities"][home]) if priority is not None},
+            current_time=datetime(2025, 10, 16, fleet["current_hours"][home], 30, 0),
+            current_temperature=fleet["current_temperatures"][home],
+            desired_temperature_range=(fleet["min_temperatures"][home], fleet["max_temperatures"][home]),
+            energy_usage_limit=fleet["energy_usage_limits"][home],
+            total_energy_used_today=fleet["total_energy_used_today"][home],
+            scheduled_devices=[],
+        ))
+    return results
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(homes: int, profile_counts: list[int], seed: int, repeat: int = 3) -> dict:
+    results = {}
+    energy_system = SmartEnergyManagementSystem()
+    manager = FleetEnergyManager(DEVICE_NAMES)
+    for profiles in profile_counts:
+        fleet = generate_fleet(homes, profiles, seed)
+        scalar = best_time(lambda: scalar_fleet(energy_system, fleet), repeat)
+        columnar = best_time(lambda: manager.manage_fleet(**fleet), repeat)
+        results[profiles] = (scalar, columnar)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare FleetEnergyManager.manage_fleet against calling manage_energy per home.")
+    parser.add_argument("--homes", type=int, default=100000, help="Number of homes in the fleet.")
+    parser.add_argument("--profiles", type=int, nargs="+", default=[0, 20, 1000],
+                        help="Distinct priority rows shared by the fleet (0: one per home).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is kept).")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic fleet.")
+    args = parser.parse_args(argv)
+
+    print(f"{'profiles':>9} {'scalar s':>10} {'fleet s':>10} {'speedup':>8}")
+    for profiles, (scalar, columnar) in run_benchmarks(args.homes, args.profiles, args.seed, args.repeat).items():
+        label = profiles or "distinct"
+        print(f"{label:>9} {scalar:>10.3f} {columnar:>10.3f} {scalar / columnar:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from benchmarks.harness import (best_of, find_regressions, load_baseline, measure_allocations, print_table,
+                                save_baseline, time_calls)
+from src.flight.BookingBatch import BookingBatch
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "flight.json")
+
+GROUP_SIZES = {
+    "solo": ((1, 2), (0.8, 0.2)),
+    "mixed": ((1, 2, 3, 4, 5, 6), (0.35, 0.25, 0.15, 0.1, 0.1, 0.05)),
+    "groups": ((4, 5, 6, 8, 10), (0.2, 0.3, 0.2, 0.2, 0.1)),
+}
+
+# Horas até a partida: (mínimo, máximo)
+DEPARTURE_WINDOWS = {
+    "last_minute": (0, 24),
+    "mixed": (0, 24 * 14),
+    "advance": (48, 24 * 90),
+}
+
+WORKLOADS = {
+    "bookings_solo_mixed": (0.0, "solo", "mixed"),
+    "bookings_groups_last_minute": (0.0, "groups", "last_minute"),
+    "cancellations_10pct_mixed": (0.1, "mixed", "mixed"),
+    "cancellations_50pct_advance": (0.5, "mixed", "advance"),
+}
+
+PATHS = ("scalar", "batch", "batch_fixed_point", "concurrent")
+
+
+def generate_workload(size: int, cancellation_ratio: float, group_sizes: str, departure_window: str,
+                      seed: int = 2025) -> BookingBatch:
+    rng = random.Random(seed)
+    sizes, weights = GROUP_SIZES[group_sizes]
+    min_hours, max_hours = DEPARTURE_WINDOWS[departure_window]
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+
+    passengers = rng.choices(sizes, weights, k=size)
+    return BookingBatch(
+        passengers=passengers,
+        booking_times=[booking_time] * size,
+        available_seats=[rng.randint(0, 12) for _ in range(size)],
+        current_prices=[rng.choice((99.9, 149.9, 249.9, 499.9, 899.9)) for _ in range(size)],
+        previous_sales=[rng.randrange(0, 200, 10) for _ in range(size)],
+        departure_times=[booking_time + timedelta(hours=rng.randint(min_hours, max_hours))
+                         for _ in range(size)],
+        reward_points_available=[rng.choice((0, 0, 0, 1000, 5000)) for _ in range(size)],
+        is_cancellations=[rng.random() < cancellation_ratio for _ in range(size)],
+    )
+
+
+def make_path(path: str, batch: BookingBatch, chunk_size: int, executor: ThreadPoolExecutor, workers: int):
+    system = FlightBookingSystem()
+    rows = list(batch.booking_rows())
+
+    if path == "scalar":
+        return [(lambda row=row: system.book_flight(*row), 1) for row in rows]
+
+    chunks = [chunk_batch(batch, start, start + chunk_size) for start in range(0, len(batch), chunk_size)]
+    if path == "batch":
+        return [(lambda chunk=chunk: system.book_flights(chunk), len(chunk)) for chunk in chunks]
+
+    if path == "batch_fixed_point":
+        fixed_point_system = FlightBookingSystem(fixed_point=True)
+        return [(lambda chunk=chunk: fixed_point_system.book_flights(chunk), len(chunk))
+                for chunk in (to_cents(chunk) for chunk in chunks)]
+
+    if path == "concurrent":
+        groups = [chunks[i:i + workers] for i in range(0, len(chunks), workers)]
+        return [(lambda group=group: list(executor.map(system.book_flights, group)),
+                 sum(len(chunk) for chunk in group)) for group in groups]
+
+    raise ValueError(f"Unknown path: {path}")
+
+
+def chunk_batch(batch: BookingBatch, start: int, stop: int) -> BookingBatch:
+    return BookingBatch(
+        batch.passengers[start:stop], batch.booking_times[start:stop], batch.available_seats[start:stop],
+        batch.current_prices[start:stop], batch.previous_sales[start:stop],
+        batch.departure_times[start:stop], batch.reward_points_available[start:stop],
+        batch.is_cancellations[start:stop],
+    )
+
+
+def to_cents(batch: BookingBatch) -> BookingBatch:
+    return BookingBatch(
+        batch.passengers, batch.booking_times, batch.available_seats,
+        [round(price * 100) for price in batch.current_prices], batch.previous_sales,
+        batch.departure_times, batch.reward_points_available, batch.is_cancellations,
+    )
+
+
+def run_benchmarks(size: int, seed: int, chunk_size: int = 256, workers: int = 4, repeat: int = 3,
+                   allocations: bool = True) -> dict:
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for workload, (cancellation_ratio, group_sizes, departure_window) in WORKLOADS.items():
+            batch = generate_workload(size, cancellation_ratio, group_sizes, departure_window, seed)
+            for path in PATHS:
+                # Aquecimento antes da medição
+                time_calls(make_path(path, batch, chunk_size, executor, workers))
+                metrics = best_of([time_calls(make_path(path, batch, chunk_size, executor, workers))
+                                   for _ in range(repeat)])
+                if allocations:
+                    calls = make_path(path, batch, chunk_size, executor, workers)
+                    metrics.update(measure_allocations(lambda: [call() for call, _ in calls]))
+                results[f"{workload}/{path}"] = metrics
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark FlightBookingSystem quote throughput and latency.")
+    parser.add_argument("--size", type=int, default=5000, help="Bookings per workload.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic workloads.")
+    parser.add_argument("--workers", type=int, default=4, help="Threads for the concurrent path.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per benchmark (best is kept).")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="Allowed slowdown factor over the baseline, minus one.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Path of the stored baseline.")
+    parser.add_argument("--check", action="store_true", help="Fail if results regress against the baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.size, args.seed, workers=args.workers, repeat=args.repeat)
+    print_table(results, "quotes")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+
+    if args.check:
+        regressions = find_regressions(results, load_baseline(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from benchmarks.harness import best_of, time_calls
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.PartitionRules import PartitionRules
+from src.fraud.PartitionedRuleDispatcher import PartitionedRuleDispatcher
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+def generate_items(transactions: int, partitions: int, history: int, seed: int) -> list:
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    items = []
+    for index in range(transactions):
+        timestamp = start + timedelta(seconds=index)
+        merchant = f"loja-{rng.randrange(partitions)}"
+        previous = [Transaction(rng.uniform(5, 500), timestamp - timedelta(minutes=rng.randint(1, 120)),
+                                rng.choice(["SP", "RJ"]), merchant) for _ in range(history)]
+        previous.sort(key=lambda transaction: transaction.timestamp)
+        items.append((Transaction(rng.choice([30.0, 900.0, 12000.0]), timestamp, rng.choice(["SP", "RJ"]), merchant),
+                      previous))
+    return items
+
+
+def partition_rules(partitions: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    return {f"loja-{index}": PartitionRules(large_amount=rng.choice([1000, 5000, 10000]),
+                                            max_hourly_count=rng.randint(2, 10),
+                                            velocity_rules=[VelocityRule(15,
+                                                                         max_amount=rng.choice([500, 2000]))])
+            for index in range(partitions)}
+
+
+def batch_calls(dispatcher: PartitionedRuleDispatcher, items: list, batch: int):
+    return [(lambda chunk=items[index:index + batch]: dispatcher.check_batch(chunk, ["Recife"]),
+             len(items[index:index + batch])) for index in range(0, len(items), batch)]
+
+
+def global_calls(items: list, batch: int):
+    # Mesmo formato das regras por partição, mas um único conjunto global
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(15, max_amount=2000)])
+
+    def run(chunk):
+        for transaction, previous in chunk:
+            fraud_system.check_for_fraud(transaction, previous, ["Recife"])
+    return [(lambda chunk=items[index:index + batch]: run(chunk), len(items[index:index + batch]))
+            for index in range(0, len(items), batch)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark partitioned fraud rule dispatch.")
+    parser.add_argument("--transactions", type=int, default=20000, help="Transactions per measurement.")
+    parser.add_argument("--partitions", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Numbers of merchant partitions to measure.")
+    parser.add_argument("--history", type=int, default=3, help="Previous transactions per check.")
+    parser.add_argument("--batch", type=int, default=1000, help="Transactions per check_batch call.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions; the best one is reported.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic workload.")
+    args = parser.parse_args(argv)
+
+    print(f"{'path':<36} {'tx/s':>12} {'p99 us':>10} {'compiled':>10}")
+    for partitions in args.partitions:
+        items = generate_items(args.transactions, partitions, args.history, args.seed)
+        dispatcher = PartitionedRuleDispatcher(partition_rules(partitions, args.seed))
+        metrics = best_of([time_calls(batch_calls(dispatcher, items, args.batch)) for _ in range(args.repeat)])
+        print(f"{f'check_batch, {partitions} partitions':<36} {metrics['throughput']:>12.0f} "
+              f"{metrics['p99_us']:>10.1f} {dispatcher.compilations:>10}")
+
+    items = generate_items(args.transactions, 1, args.history, args.seed)
+    metrics = best_of([time_calls(global_calls(items, args.batch)) for _ in range(args.repeat)])
+    print(f"{'check_for_fraud, global rules':<36} {metrics['throughput']:>12.0f} {metrics['p99_us']:>10.1f} {'-':>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from benchmarks.harness import percentile
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.ScoringClient import ScoringClient
+from src.fraud.ScoringServer import ScoringServer
+from src.fraud.Transaction import Transaction
+
+
+def _run_server(workers: int, path, port_queue, stop) -> None:
+    async def serve():
+        async with ScoringServer(FraudDetectionSystem(), ["Recife", "Manaus"], workers=workers) as server:
+            address = await server.start(path=path)
+            port_queue.put(address if path is None else path)
+            await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+            port_queue.put(server.requests)
+    asyncio.run(serve())
+
+
+def generate_requests(requests: int, accounts: int, seed: int) -> list[tuple[str, Transaction]]:
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    return [(f"conta-{rng.randrange(accounts)}",
+             Transaction(rng.choice([15.0, 80.0, 420.0, 12000.0]), start + timedelta(seconds=index),
+                         rng.choice(["SP", "RJ", "Recife", "BH"]), f"loja-{rng.randrange(500)}"))
+            for index in range(requests)]
+
+
+async def run_load(address, requests: list, connections: int, pipeline: int) -> tuple[list[float], float]:
+    if isinstance(address, str):
+        clients = [await ScoringClient.connect(address) for _ in range(connections)]
+    else:
+        clients = [await ScoringClient.connect(host=address[0], port=address[1]) for _ in range(connections)]
+    latencies = []
+
+    async def sender(client, share):
+        for account_id, transaction in share:
+            started = time.perf_counter_ns()
+            await client.score(account_id, transaction)
+            latencies.append((time.perf_counter_ns() - started) / 1000)
+
+    # connections * pipeline remetentes, cada um com um pedido em voo por vez
+    senders = connections * pipeline
+    began = time.perf_counter()
+    await asyncio.gather(*(sender(clients[index % connections], requests[index::senders])
+                           for index in range(senders)))
+    elapsed = time.perf_counter() - began
+    for client in clients:
+        await client.close()
+    return latencies, elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the fraud scoring server.")
+    parser.add_argument("--workers", type=int, default=2, help="Scoring worker processes (0 scores in the server loop).")
+    parser.add_argument("--connections", type=int, default=4, help="Persistent client connections.")
+    parser.add_argument("--pipeline", type=int, default=32, help="Requests in flight per connection.")
+    parser.add_argument("--requests", type=int, default=50000, help="Total requests.")
+    parser.add_argument("--accounts", type=int, default=10000, help="Distinct accounts.")
+    parser.add_argument("--tcp", action="store_true", help="Use localhost TCP instead of a Unix domain socket.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic requests.")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    path = None if args.tcp else os.path.join(directory, "scoring.sock")
+    context = multiprocessing.get_context()
+    address_queue = context.Queue()
+    stop = context.Event()
+    server = context.Process(target=_run_server, args=(args.workers, path, address_queue, stop))
+    server.start()
+    try:
+        address = address_queue.get(timeout=30)
+        requests = generate_requests(args.requests, args.accounts, args.seed)
+        latencies, elapsed = asyncio.run(run_load(address, requests, args.connections, args.pipeline))
+    finally:
+        stop.set()
+        served = address_queue.get(timeout=30)
+        server.join()
+        os.rmdir(directory)
+
+    print(f"transport:        {'tcp' if args.tcp else 'unix'}")
+    print(f"workers:          {args.workers}")
+    print(f"in flight:        {args.connections} connections x {args.pipeline}")
+    print(f"requests served:  {served}")
+    print(f"throughput:       {len(latencies) / elapsed:.0f} req/s")
+    print(f"latency p50:      {percentile(latencies, 0.50):.0f} us")
+    print(f"latency p99:      {percentile(latencies, 0.99):.0f} us")
+    print(f"latency p99.9:    {percentile(latencies, 0.999):.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
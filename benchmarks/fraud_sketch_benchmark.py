@@ -0,0 +1,121 @@
+import argparse
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from benchmarks.harness import time_calls
+from src.fraud.BlacklistScreen import BlacklistScreen
+from src.fraud.BloomFilter import BloomFilter
+from src.fraud.VelocityCounter import VelocityCounter
+from src.fraud.WindowedSketch import WindowedSketch
+
+
+def generate_events(events: int, keys: int, seed: int, start: datetime) -> list[tuple[str, datetime]]:
+    rng = random.Random(seed)
+    # Poucos lojistas concentram o tráfego, como num ataque de teste de cartões
+    hot = [f"merchant-{index}" for index in range(10)]
+    stream = []
+    timestamp = start
+    for _ in range(events):
+        timestamp += timedelta(milliseconds=rng.randint(1, 200))
+        key = rng.choice(hot) if rng.random() < 0.3 else f"merchant-{rng.randrange(keys)}"
+        stream.append((key, timestamp))
+    return stream
+
+
+class ExactVelocity:
+    def __init__(self, window_minutes: int):
+        self.window_minutes = window_minutes
+        self.counters: dict[str, VelocityCounter] = {}
+
+    def add(self, key: str, timestamp: datetime) -> None:
+        counter = self.counters.get(key)
+        if counter is None:
+            counter = self.counters[key] = VelocityCounter(self.window_minutes, exact=True)
+        counter.add(timestamp)
+
+    def estimate(self, key: str, now: datetime) -> int:
+        counter = self.counters.get(key)
+        return counter.count(now) if counter is not None else 0
+
+
+def velocity_calls(structure, stream, chunk: int = 1000):
+    def run(events):
+        for key, timestamp in events:
+            structure.estimate(key, timestamp)
+            structure.add(key, timestamp)
+    return [(lambda events=stream[index:index + chunk]: run(events), len(stream[index:index + chunk]))
+            for index in range(0, len(stream), chunk)]
+
+
+def blacklist_calls(blacklist, queries, chunk: int = 1000):
+    def run(items):
+        for item in items:
+            item in blacklist
+    return [(lambda items=queries[index:index + chunk]: run(items), len(queries[index:index + chunk]))
+            for index in range(0, len(queries), chunk)]
+
+
+def retained_kib(factory) -> tuple[object, float]:
+    # Memória que continua alocada após construir e alimentar a estrutura
+    tracemalloc.start()
+    try:
+        structure = factory()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return structure, current / 1024
+
+
+def feed(structure, stream):
+    for key, timestamp in stream:
+        structure.add(key, timestamp)
+    return structure
+
+
+def max_overestimate(sketch: WindowedSketch, exact: ExactVelocity, stream) -> int:
+    now = stream[-1][1]
+    return max(sketch.estimate(key, now) - exact.estimate(key, now) for key in {key for key, _ in stream[-5000:]})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sketches against exact fraud structures.")
+    parser.add_argument("--events", type=int, default=200000, help="Number of transactions in the stream.")
+    parser.add_argument("--keys", type=int, default=100000, help="Number of distinct merchants.")
+    parser.add_argument("--blacklist", type=int, default=100000, help="Number of blacklisted locations.")
+    parser.add_argument("--epsilon", type=float, default=0.0005, help="Count-min error bound over the window total.")
+    parser.add_argument("--error-rate", type=float, default=0.001, help="Bloom filter false positive rate.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic stream.")
+    args = parser.parse_args(argv)
+
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    stream = generate_events(args.events, args.keys, args.seed, start)
+
+    print(f"{'structure':<28} {'ops/s':>12} {'p99 us':>10} {'kept KiB':>10}")
+    structures = {}
+    for name, factory in (("count-min window", lambda: WindowedSketch(60, 5, args.epsilon)),
+                          ("exact counters", lambda: ExactVelocity(60))):
+        metrics = time_calls(velocity_calls(factory(), stream))
+        structures[name], kept = retained_kib(lambda: feed(factory(), stream))
+        print(f"{name:<28} {metrics['throughput']:>12.0f} {metrics['p99_us']:>10.1f} {kept:>10.1f}")
+    overestimate = max_overestimate(structures["count-min window"], structures["exact counters"], stream)
+    print(f"max overestimate on recent keys: {overestimate}")
+
+    rng = random.Random(args.seed)
+    queries = [f"location-{rng.randrange(args.blacklist * 20)}" for _ in range(args.events)]
+    print(f"{'blacklist':<28} {'lookups/s':>12} {'p99 us':>10} {'kept KiB':>10}")
+    for name, factory in (
+        ("bloom + exact set", lambda: BlacklistScreen((f"location-{index}" for index in range(args.blacklist)),
+                                                      args.error_rate)),
+        ("exact set", lambda: {f"location-{index}" for index in range(args.blacklist)}),
+        ("bloom only", lambda: BloomFilter.from_items((f"location-{index}" for index in range(args.blacklist)),
+                                                      args.error_rate)),
+    ):
+        blacklist, kept = retained_kib(factory)
+        metrics = time_calls(blacklist_calls(blacklist, queries))
+        print(f"{name:<28} {metrics['throughput']:>12.0f} {metrics['p99_us']:>10.1f} {kept:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
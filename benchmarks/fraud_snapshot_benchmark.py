@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from benchmarks.harness import time_calls
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.StateSnapshot import StateSnapshot, write_snapshot
+from src.fraud.Transaction import Transaction
+
+
+def account_records(accounts: int, seed: int) -> tuple[list[str], list[bytes]]:
+    rng = random.Random(seed)
+    fraud_system = FraudDetectionSystem()
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    # Alguns estados reais servem de modelo para todas as contas sintéticas
+    templates = []
+    for _ in range(16):
+        state = fraud_system.new_account_state()
+        for minute in sorted(rng.sample(range(120), rng.randint(1, 15))):
+            state.record(Transaction(rng.uniform(5, 500), start + timedelta(minutes=minute), "SP"))
+        templates.append(state.to_bytes())
+    account_ids = sorted(f"conta-{index:09d}" for index in range(accounts))
+    return account_ids, [templates[index % len(templates)] for index in range(accounts)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark fraud state snapshot write and restore.")
+    parser.add_argument("--accounts", type=int, default=1000000, help="Number of accounts in the snapshot.")
+    parser.add_argument("--lookups", type=int, default=100000, help="Random account restores after opening.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic accounts.")
+    args = parser.parse_args(argv)
+
+    account_ids, records = account_records(args.accounts, args.seed)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "fraud.snap")
+    try:
+        began = time.perf_counter()
+        write_snapshot(path, zip(account_ids, records), log_offset=args.accounts)
+        written = time.perf_counter() - began
+
+        began = time.perf_counter()
+        snapshot = StateSnapshot(path)
+        opened = time.perf_counter() - began
+
+        rng = random.Random(args.seed)
+        sample = [rng.choice(account_ids) for _ in range(args.lookups)]
+        metrics = time_calls([(lambda account_id=account_id: snapshot.get(account_id), 1)
+                              for account_id in sample])
+
+        print(f"accounts:          {args.accounts}")
+        print(f"snapshot size:     {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        print(f"write seconds:     {written:.3f}")
+        print(f"restore seconds:   {opened:.6f}")
+        print(f"account loads/s:   {metrics['throughput']:.0f} (p99 {metrics['p99_us']:.1f} us)")
+        snapshot.close()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+import json
+import math
+import os
+import time
+import tracemalloc
+
+CHECKED_METRICS = ("throughput", "p99_us", "peak_kib")
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_calls(calls) -> dict:
+    # calls: pares (função sem argumentos, unidades processadas); cada chamada é cronometrada
+    latencies = []
+    units = 0
+    start = time.perf_counter()
+    for call, call_units in calls:
+        call_start = time.perf_counter_ns()
+        call()
+        latencies.append((time.perf_counter_ns() - call_start) / 1000)
+        units += call_units
+    elapsed = time.perf_counter() - start
+    return {
+        "throughput": units / elapsed if elapsed > 0 else 0.0,
+        "p50_us": percentile(latencies, 0.50),
+        "p99_us": percentile(latencies, 0.99),
+    }
+
+
+def best_of(runs: list[dict]) -> dict:
+    # Melhor resultado de várias repetições para reduzir o ruído da máquina
+    return {
+        "throughput": max(run["throughput"] for run in runs),
+        "p50_us": min(run["p50_us"] for run in runs),
+        "p99_us": min(run["p99_us"] for run in runs),
+    }
+
+
+def measure_allocations(fn) -> dict:
+    tracemalloc.start()
+    try:
+        fn()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_kib": peak / 1024,
+        "live_blocks": sum(stat.count for stat in snapshot.statistics("filename")),
+    }
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path: str, results: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    # Regressão: métrica pior que o baseline por um fator maior que (1 + tolerance)
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in CHECKED_METRICS:
+            value = metrics.get(metric)
+            reference = expected.get(metric)
+            if value is None or not reference:
+                continue
+            if metric == "throughput":
+                if value * (1 + tolerance) < reference:
+                    regressions.append(f"{name}: {metric} {value:.1f} < baseline {reference:.1f}")
+            elif value > reference * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {value:.1f} > baseline {reference:.1f}")
+    return regressions
+
+
+def print_table(results: dict, unit: str) -> None:
+    print(f"{'benchmark':<44} {unit + '/s':>14} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10}")
+    for name, metrics in results.items():
+        print(f"{name:<44} {metrics['throughput']:>14.1f} {metrics['p50_us']:>10.1f} "
+              f"{metrics['p99_us']:>10.1f} {metrics.get('peak_kib', 0.0):>10.1f}")
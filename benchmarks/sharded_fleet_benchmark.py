@@ -0,0 +1,51 @@
+import argparse
+import multiprocessing
+import random
+import sys
+from datetime import datetime, timedelta
+from src.energy.HomeProfile import HomeProfile
+from src.energy.ShardedFleetExecutor import ShardedFleetExecutor
+
+DEVICES = ["Security", "Refrigerator", "Lights", "Oven", "TV", "Washer", "Dryer", "EVCharger", "Heating", "Cooling"]
+
+
+def generate_homes(homes: int, seed: int) -> list[HomeProfile]:
+    rng = random.Random(seed)
+    return [HomeProfile({device: rng.randint(1, 3) for device in DEVICES if rng.random() < 0.8},
+                        rng.choice([0.2, 0.25, 0.3]), (18.0, 24.0), rng.choice([20.0, 30.0, 45.0]))
+            for _ in range(homes)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sharded fleet ticks per second.")
+    parser.add_argument("--homes", type=int, default=20000, help="Number of homes in the fleet.")
+    parser.add_argument("--ticks", type=int, default=50, help="Ticks per measurement.")
+    parser.add_argument("--max-workers", type=int, default=multiprocessing.cpu_count(),
+                        help="Largest worker count to measure.")
+    parser.add_argument("--seed", type=int, default=2025, help="Seed for the synthetic fleet.")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    homes = generate_homes(args.homes, args.seed)
+    start = datetime(2025, 10, 16, 12, 0, 0)
+    ticks = [(rng.choice([0.1, 0.2, 0.3]), start + timedelta(minutes=5 * tick),
+              [rng.uniform(14.0, 28.0) for _ in homes], [rng.uniform(0.0, 0.5) for _ in homes])
+             for tick in range(args.ticks)]
+
+    print(f"{'workers':>8} {'ticks/s':>10} {'home-ticks/s':>14} {'speedup':>8}")
+    single = None
+    workers = 1
+    while workers <= max(1, args.max_workers):
+        with ShardedFleetExecutor(homes, workers=workers) as executor:
+            for current_price, current_time, temperatures, deltas in ticks:
+                executor.tick(current_price, current_time, temperatures, deltas)
+            ticks_per_second = executor.ticks_per_second
+        single = single or ticks_per_second
+        print(f"{workers:>8} {ticks_per_second:>10.1f} {ticks_per_second * args.homes:>14.1f} "
+              f"{ticks_per_second / single:>8.2f}")
+        workers *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
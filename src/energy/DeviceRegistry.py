@@ -0,0 +1,82 @@
+import struct
+from typing import Iterable
+from src.energy.DeviceStatusBits import DeviceStatusBits
+
+WIDTH_HEADER = struct.Struct("<H")
+
+
+class DeviceRegistry:
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = []
+        self._positions: dict[str, int] = {}
+        for name in names:
+            self.register(name)
+
+    def register(self, name: str) -> int:
+        position = self._positions.get(name)
+        if position is None:
+            position = len(self.names)
+            self._positions[name] = position
+            self.names.append(name)
+        return position
+
+    def position(self, name: str) -> int:
+        return self._positions[name]
+
+    @property
+    def row_bytes(self) -> int:
+        return (len(self.names) + 7) // 8
+
+    def compact(self, device_status: dict[str, bool]) -> DeviceStatusBits:
+        present = 0
+        on = 0
+        # Dispositivos desconhecidos precisam ser registrados antes, para que a largura
+        # dos registros não mude durante a compactação
+        positions = self._positions
+        for name, status in device_status.items():
+            bit = 1 << positions[name]
+            present |= bit
+            if status:
+                on |= bit
+        return DeviceStatusBits(self, present, on)
+
+    def pack(self, statuses: Iterable[DeviceStatusBits]) -> bytes:
+        # Registros de largura fixa: máscara de presença seguida da máscara de ligados
+        width = self.row_bytes
+        chunks = [WIDTH_HEADER.pack(width)]
+        for status in statuses:
+            chunks.append(status.present.to_bytes(width, "little"))
+            chunks.append(status.on.to_bytes(width, "little"))
+        return b"".join(chunks)
+
+    def unpack(self, data: bytes) -> list[DeviceStatusBits]:
+        width, = WIDTH_HEADER.unpack_from(data)
+        if width > self.row_bytes:
+            raise ValueError("Packed statuses reference devices unknown to this registry")
+        if width == 0:
+            # Sem dispositivos não há bytes por registro, e portanto nenhum estado a decodificar
+            return []
+        statuses = []
+        for offset in range(WIDTH_HEADER.size, len(data), 2 * width):
+            present = int.from_bytes(data[offset:offset + width], "little")
+            on = int.from_bytes(data[offset + width:offset + 2 * width], "little")
+            statuses.append(DeviceStatusBits(self, present, on))
+        return statuses
+
+    def unpack_fleet(self, data: bytes) -> list[DeviceStatusBits]:
+        # Linhas de FleetEnergyResult.pack_status: todos os dispositivos presentes, só os bits de ligados
+        width = self.row_bytes
+        if width == 0:
+            return []
+        present = (1 << len(self.names)) - 1
+        return [DeviceStatusBits(self, present, int.from_bytes(data[offset:offset + width], "little"))
+                for offset in range(0, len(data), width)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def __repr__(self) -> str:
+        return f"DeviceRegistry(devices={len(self.names)})"
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from typing import Sequence
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.SchedulePlan import SchedulePlan
+
+
+class DeviceSchedulePlanner:
+    def __init__(self, slot: timedelta = timedelta(minutes=15)):
+        self.slot = slot
+
+    def plan(
+        self,
+        price_forecast: Sequence[float],
+        start: datetime,
+        device_priorities: dict[str, int],
+        durations: dict[str, int],
+        device_power: dict[str, float],
+        energy_usage_limit: float,
+    ) -> SchedulePlan:
+
+        slot_times = [start + self.slot * index for index in range(len(price_forecast))]
+        first_day = start.date()
+        slot_days = [(time.date() - first_day).days for time in slot_times]
+        remaining_energy = [energy_usage_limit] * (slot_days[-1] + 1 if slot_days else 0)
+
+        # Uma única ordenação dos slots por preço, compartilhada por todos os dispositivos
+        cheapest_slots = sorted(range(len(price_forecast)), key=price_forecast.__getitem__)
+
+        chosen: list[tuple[int, str]] = []
+        unscheduled = []
+        total_cost = 0.0
+        # Prioridade 1 é a mais importante (como em manage_energy) e escolhe primeiro
+        for device in sorted(device_priorities, key=device_priorities.__getitem__):
+            needed = durations.get(device, 0)
+            power = device_power.get(device, 0.0)
+            if needed <= 0:
+                continue
+
+            picked = []
+            for slot in cheapest_slots:
+                day = slot_days[slot]
+                if remaining_energy[day] >= power:
+                    remaining_energy[day] -= power
+                    picked.append(slot)
+                    if len(picked) == needed:
+                        break
+
+            if len(picked) < needed:
+                # Sem espaço para a duração completa: devolve a energia reservada
+                for slot in picked:
+                    remaining_energy[slot_days[slot]] += power
+                unscheduled.append(device)
+                continue
+
+            for slot in picked:
+                chosen.append((slot, device))
+                total_cost += price_forecast[slot] * power
+
+        chosen.sort()
+        schedules = [DeviceSchedule(device, slot_times[slot]) for slot, device in chosen]
+        return SchedulePlan(schedules, total_cost, unscheduled)
@@ -0,0 +1,38 @@
+from collections.abc import Mapping
+from typing import Iterator
+
+
+class DeviceStatusBits(Mapping):
+    __slots__ = ("registry", "present", "on")
+
+    def __init__(self, registry, present: int, on: int):
+        self.registry = registry
+        self.present = present
+        self.on = on
+
+    def __getitem__(self, name: str) -> bool:
+        if name not in self.registry:
+            raise KeyError(name)
+        bit = 1 << self.registry.position(name)
+        if not self.present & bit:
+            raise KeyError(name)
+        return bool(self.on & bit)
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.registry.names
+        present = self.present
+        position = 0
+        while present:
+            if present & 1:
+                yield names[position]
+            present >>= 1
+            position += 1
+
+    def __len__(self) -> int:
+        return bin(self.present).count("1")
+
+    def to_dict(self) -> dict[str, bool]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"DeviceStatusBits({self.to_dict()})"
@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Optional, Union
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+class EnergyController:
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        scheduled_devices: Optional[Union[list[DeviceSchedule], ScheduleIndex]] = None,
+    ):
+        self._base_status: dict[tuple[bool, bool], dict[str, bool]] = {}
+        self.device_priorities = device_priorities
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        if not isinstance(scheduled_devices, ScheduleIndex):
+            scheduled_devices = ScheduleIndex(scheduled_devices or ())
+        self.scheduled_devices = scheduled_devices
+
+        self.device_status: dict[str, bool] = {}
+        self.energy_saving_mode = False
+        self.temperature_regulation_active = False
+        self.total_energy_used = 0.0
+
+        self._energy_system = SmartEnergyManagementSystem()
+        self._rule_inputs: Optional[tuple] = None
+        self._was_adjusted = False
+
+    def update(
+        self,
+        current_price: float,
+        current_time: datetime,
+        current_temperature: float,
+        total_energy_used_today: float,
+    ) -> dict[str, bool]:
+
+        energy_saving_mode = current_price > self.price_threshold
+        night_mode = current_time.hour >= 23 or current_time.hour < 6
+        if current_temperature < self.desired_temperature_range[0]:
+            temperature_state = -1
+        elif current_temperature > self.desired_temperature_range[1]:
+            temperature_state = 1
+        else:
+            temperature_state = 0
+
+        over_limit = total_energy_used_today >= self.energy_usage_limit
+        schedules = self.scheduled_devices.at(current_time)
+        rule_inputs = (energy_saving_mode, night_mode, temperature_state)
+
+        # Nenhuma regra mudou de saída e nada foi ajustado por limite ou agenda: sem deltas
+        if rule_inputs == self._rule_inputs and not over_limit and not schedules and not self._was_adjusted:
+            self.total_energy_used = total_energy_used_today
+            return {}
+
+        device_status = dict(self._base_status_for(energy_saving_mode, night_mode))
+        if temperature_state < 0:
+            device_status["Heating"] = True
+        elif temperature_state > 0:
+            device_status["Cooling"] = True
+        else:
+            device_status["Heating"] = False
+            device_status["Cooling"] = False
+
+        total_energy_used_today = self._energy_system.shed_to_limit(
+            self.device_priorities, device_status, total_energy_used_today, self.energy_usage_limit
+        )
+        for schedule in schedules:
+            device_status[schedule.device_name] = True
+
+        changes = {}
+        previous_status = self.device_status
+        for device, on in device_status.items():
+            if previous_status.get(device, False) != on:
+                changes[device] = on
+        for device, on in previous_status.items():
+            if on and device not in device_status:
+                changes[device] = False
+
+        self.device_status = device_status
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_state != 0
+        self.total_energy_used = total_energy_used_today
+        self._rule_inputs = rule_inputs
+        self._was_adjusted = over_limit or bool(schedules)
+        return changes
+
+    @property
+    def device_priorities(self) -> dict[str, int]:
+        return self._device_priorities
+
+    @device_priorities.setter
+    def device_priorities(self, device_priorities: dict[str, int]) -> None:
+        self._device_priorities = device_priorities
+        self._base_status.clear()
+        self._rule_inputs = None
+
+    @property
+    def result(self) -> EnergyManagementResult:
+        return EnergyManagementResult(dict(self.device_status), self.energy_saving_mode,
+                                      self.temperature_regulation_active, self.total_energy_used)
+
+    def _base_status_for(self, energy_saving_mode: bool, night_mode: bool) -> dict[str, bool]:
+        key = (energy_saving_mode, night_mode)
+        base_status = self._base_status.get(key)
+        if base_status is None:
+            base_status = {}
+            for device, priority in self.device_priorities.items():
+                base_status[device] = not (energy_saving_mode and priority > 1)
+                if night_mode and device not in ("Security", "Refrigerator"):
+                    base_status[device] = False
+            self._base_status[key] = base_status
+        return base_status
+
+    def __repr__(self) -> str:
+        return (f"EnergyController(devices={len(self.device_priorities)}, "
+                f"energy_saving_mode={self.energy_saving_mode}, "
+                f"temperature_regulation_active={self.temperature_regulation_active}, "
+                f"total_energy_used={self.total_energy_used})")
@@ -1,6 +1,8 @@
 from datetime import datetime
+from typing import Union
 from src.energy.DeviceSchedule import DeviceSchedule
 from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.ScheduleIndex import ScheduleIndex
 
 class SmartEnergyManagementSystem:
     def manage_energy(
@@ -13,7 +15,7 @@ class SmartEnergyManagementSystem:
         desired_temperature_range: tuple[float, float],
         energy_usage_limit: float,
         total_energy_used_today: float,
-        scheduled_devices: list[DeviceSchedule],
+        scheduled_devices: Union[list[DeviceSchedule], ScheduleIndex],
     ) -> EnergyManagementResult:
 
         device_status: dict[str, bool] = {}
@@ -47,25 +49,37 @@ class SmartEnergyManagementSystem:
             device_status["Cooling"] = False
 
 
-        devices_were_on = True
-        while total_energy_used_today >= energy_usage_limit and devices_were_on:
-            devices_to_turn_off = [
-                device for device, priority in device_priorities.items()
-                if device_status.get(device, False) and priority > 1
-            ]
-            
-            if not devices_to_turn_off:
-                devices_were_on = False
-                continue
+        total_energy_used_today = self.shed_to_limit(
+            device_priorities, device_status, total_energy_used_today, energy_usage_limit
+        )
 
-            for device in devices_to_turn_off:
-                 if total_energy_used_today < energy_usage_limit:
-                     break
-                 device_status[device] = False
-                 total_energy_used_today -= 1
+        if isinstance(scheduled_devices, ScheduleIndex):
+            scheduled_devices = scheduled_devices.at(current_time)
 
         for schedule in scheduled_devices:
             if schedule.scheduled_time == current_time:
                 device_status[schedule.device_name] = True
 
-        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
\ No newline at end of file
+        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
+
+    def shed_to_limit(
+        self,
+        device_priorities: dict[str, int],
+        device_status: dict[str, bool],
+        total_energy_used_today: float,
+        energy_usage_limit: float,
+    ) -> float:
+
+        if not total_energy_used_today >= energy_usage_limit:
+            return total_energy_used_today
+
+        # Cada dispositivo ligado com prioridade > 1 é desligado no máximo uma vez, na ordem
+        # de device_priorities, descontando 1 unidade até o consumo ficar abaixo do limite
+        for device, priority in device_priorities.items():
+            if device_status.get(device, False) and priority > 1:
+                if total_energy_used_today < energy_usage_limit:
+                    break
+                device_status[device] = False
+                total_energy_used_today -= 1
+
+        return total_energy_used_today
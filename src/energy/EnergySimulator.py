@@ -0,0 +1,151 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Sequence
+from src.energy.HomeProfile import HomeProfile
+from src.energy.ScheduleIndex import ScheduleIndex
+from src.energy.SimulationResult import SimulationResult
+
+
+class EnergySimulator:
+    def __init__(self, device_power: dict[str, float]):
+        self.device_power = device_power
+        self._axis_key = None
+        self._axis = None
+
+    def simulate(
+        self,
+        home: HomeProfile,
+        start: datetime,
+        prices: Sequence[float],
+        temperatures: Sequence[float],
+        step: timedelta = timedelta(hours=1),
+        initial_energy_used: float = 0.0,
+    ) -> SimulationResult:
+
+        if len(prices) != len(temperatures):
+            raise ValueError("prices and temperatures must have one entry per step")
+
+        schedules = home.scheduled_devices
+        if not isinstance(schedules, ScheduleIndex):
+            schedules = ScheduleIndex(schedules or ())
+
+        device_names = list(home.device_priorities)
+        for device in ("Heating", "Cooling", *(schedule.device_name for schedule in schedules)):
+            if device not in device_names:
+                device_names.append(device)
+        column = {device: index for index, device in enumerate(device_names)}
+        power = [self.device_power.get(device, 0.0) for device in device_names]
+        shed_order = [column[device] for device, priority in home.device_priorities.items() if priority > 1]
+        heating = column["Heating"]
+        cooling = column["Cooling"]
+
+        # Saídas das regras de preço, horário e temperatura calculadas para todo o eixo de tempo
+        low, high = home.desired_temperature_range
+        night_mode, new_day = self._time_axis(start, len(prices), step)
+        energy_saving_mode = bytearray(price > home.price_threshold for price in prices)
+        temperature_states = [-1 if t < low else (1 if t > high else 0) for t in temperatures]
+        temperature_regulation_active = bytearray(state != 0 for state in temperature_states)
+
+        scheduled_steps: dict[int, list[int]] = {}
+        for schedule in schedules:
+            index, remainder = divmod(schedule.scheduled_time - start, step)
+            if not remainder and 0 <= index < len(prices):
+                scheduled_steps.setdefault(index, []).append(column[schedule.device_name])
+
+        limit = home.energy_usage_limit
+        total = initial_energy_used
+        base_cache: dict[tuple, tuple] = {}
+        shed_cache: dict[tuple, tuple] = {}
+        device_status = []
+        step_energy = array("d", bytes(8 * len(prices)))
+        total_energy_used = array("d", bytes(8 * len(prices)))
+
+        for index in range(len(prices)):
+            if new_day[index]:
+                total = 0.0
+
+            key = (energy_saving_mode[index], night_mode[index], temperature_states[index])
+            cached = base_cache.get(key)
+            if cached is None:
+                cached = self._base_status(home, column, key, heating, cooling, power, shed_order)
+                base_cache[key] = cached
+            status, consumption, shed_candidates = cached
+
+            if total >= limit and shed_candidates:
+                # Quantos dispositivos o laço de manage_energy desligaria a partir deste total
+                shed = 0
+                remaining = total
+                while shed < len(shed_candidates) and remaining >= limit:
+                    remaining -= 1
+                    shed += 1
+                shed_key = (key, shed)
+                shed_status = shed_cache.get(shed_key)
+                if shed_status is None:
+                    reduced = bytearray(status)
+                    for device in shed_candidates[:shed]:
+                        reduced[device] = 0
+                    shed_status = (bytes(reduced), sum(watts for on, watts in zip(reduced, power) if on))
+                    shed_cache[shed_key] = shed_status
+                status, consumption = shed_status
+
+            matches = scheduled_steps.get(index)
+            if matches:
+                scheduled = bytearray(status)
+                for device in matches:
+                    scheduled[device] = 1
+                status = bytes(scheduled)
+                consumption = sum(watts for on, watts in zip(status, power) if on)
+
+            total += consumption
+            device_status.append(status)
+            step_energy[index] = consumption
+            total_energy_used[index] = total
+
+        return SimulationResult(device_names, device_status, energy_saving_mode, temperature_regulation_active,
+                                step_energy, total_energy_used)
+
+    def simulate_fleet(
+        self,
+        homes: Sequence[HomeProfile],
+        start: datetime,
+        prices: Sequence[float],
+        temperatures: Sequence[Sequence[float]],
+        step: timedelta = timedelta(hours=1),
+    ) -> list[SimulationResult]:
+
+        if len(homes) != len(temperatures):
+            raise ValueError("temperatures must have one series per home")
+        return [self.simulate(home, start, prices, home_temperatures, step)
+                for home, home_temperatures in zip(homes, temperatures)]
+
+    def _time_axis(self, start: datetime, steps: int, step: timedelta) -> tuple:
+        key = (start, steps, step)
+        if self._axis_key != key:
+            times = [start + step * index for index in range(steps)]
+            night_mode = bytearray(time.hour >= 23 or time.hour < 6 for time in times)
+            new_day = bytearray(index > 0 and times[index].date() != times[index - 1].date()
+                                for index in range(steps))
+            self._axis_key = key
+            self._axis = (night_mode, new_day)
+        return self._axis
+
+    def _base_status(self, home: HomeProfile, column: dict[str, int], key: tuple,
+                     heating: int, cooling: int, power: list[float], shed_order: list[int]) -> tuple:
+        energy_saving_mode, night_mode, temperature_state = key
+        status = bytearray(len(column))
+        for device, priority in home.device_priorities.items():
+            on = not (energy_saving_mode and priority > 1)
+            if night_mode and device not in ("Security", "Refrigerator"):
+                on = False
+            status[column[device]] = on
+
+        if temperature_state < 0:
+            status[heating] = 1
+        elif temperature_state > 0:
+            status[cooling] = 1
+        else:
+            status[heating] = 0
+            status[cooling] = 0
+
+        shed_candidates = [device for device in shed_order if status[device]]
+        return bytes(status), sum(watts for on, watts in zip(status, power) if on), shed_candidates
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+
+class EnergyUpdate:
+    def __init__(
+        self,
+        home_id: str,
+        timestamp: datetime,
+        changes: dict[str, bool],
+        result: Optional[EnergyManagementResult] = None,
+    ):
+        self.home_id = home_id
+        self.timestamp = timestamp
+        self.changes = changes
+        self.result = result
+
+    def __repr__(self) -> str:
+        return (f"EnergyUpdate(home_id={self.home_id!r}, timestamp='{self.timestamp}', "
+                f"changes={self.changes}, result={self.result})")
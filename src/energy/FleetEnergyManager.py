@@ -0,0 +1,156 @@
+from array import array
+from itertools import zip_longest
+from typing import Optional, Sequence
+from src.energy.FleetEnergyResult import FleetEnergyResult
+
+ALWAYS_ON_DEVICES = ("Security", "Refrigerator")
+
+
+class FleetEnergyManager:
+    def __init__(self, device_names: Sequence[str]):
+        self.device_names = list(device_names)
+        for device in ("Heating", "Cooling"):
+            if device not in self.device_names:
+                self.device_names.append(device)
+        self.heating = self.device_names.index("Heating")
+        self.cooling = self.device_names.index("Cooling")
+        self._status_tables = [_status_table(1 if name in ALWAYS_ON_DEVICES else 0) for name in self.device_names]
+
+    def manage_fleet(
+        self,
+        current_prices: Sequence[float],
+        price_thresholds: Sequence[float],
+        current_hours: Sequence[int],
+        current_temperatures: Sequence[float],
+        min_temperatures: Sequence[float],
+        max_temperatures: Sequence[float],
+        energy_usage_limits: Sequence[float],
+        total_energy_used_today: Sequence[float],
+        device_priorities: Sequence[Sequence[Optional[int]]],
+    ) -> FleetEnergyResult:
+
+        homes = len(current_prices)
+        columns = (price_thresholds, current_hours, current_temperatures, min_temperatures,
+                   max_temperatures, energy_usage_limits, total_energy_used_today, device_priorities)
+        if any(len(column) != homes for column in columns):
+            raise ValueError("All fleet columns must have one entry per home")
+
+        # Regras de preço, horário e temperatura avaliadas coluna a coluna
+        energy_saving_mode = bytearray(price > threshold for price, threshold in zip(current_prices, price_thresholds))
+        night_mode = bytearray(hour >= 23 or hour < 6 for hour in current_hours)
+        heating_on = bytearray(t < low for t, low in zip(current_temperatures, min_temperatures))
+        cooling_on = bytearray(not heat and t > high
+                               for heat, t, high in zip(heating_on, current_temperatures, max_temperatures))
+        temperature_regulation_active = bytearray(heat or cool for heat, cool in zip(heating_on, cooling_on))
+        total_energy_used = array("d", total_energy_used_today)
+
+        devices = len(self.device_names)
+        # Linhas de prioridade iguais formam um único perfil; o trabalho por dispositivo é feito
+        # sobre os perfis distintos e depois espalhado para as casas
+        profiles = dict.fromkeys(map(tuple, device_priorities))
+        if max(map(len, profiles), default=0) > devices:
+            raise ValueError("Priority row has more entries than known devices")
+        distinct = len(profiles) == homes
+        if distinct:
+            profile_of = range(homes)
+        else:
+            for index, key in enumerate(profiles):
+                profiles[key] = index
+            profile_of = list(map(profiles.__getitem__, map(tuple, device_priorities)))
+        profile_bytes = bytes(profile_of) if len(profiles) <= 256 else None
+        priority_columns = list(zip_longest(*profiles))
+
+        # Cada coluna de bytes vira um inteiro grande; como nenhum código passa de um byte,
+        # somas e multiplicações combinam as colunas casa a casa sem laço em Python
+        modes = _column_int(energy_saving_mode) * 2 + _column_int(night_mode)
+        temperature = _column_int(heating_on) * 2 + _column_int(cooling_on)
+
+        status_columns = []
+        for device in range(devices):
+            priorities = priority_columns[device] if device < len(priority_columns) else (None,) * len(profiles)
+            classes = {priority: _priority_class(priority) for priority in set(priorities)}
+            profile_classes = bytes(map(classes.__getitem__, priorities))
+            if distinct:
+                home_classes = profile_classes
+            elif profile_bytes is not None:
+                home_classes = profile_bytes.translate(profile_classes.ljust(256, b"\0"))
+            else:
+                home_classes = bytes(map(profile_classes.__getitem__, profile_of))
+
+            column = _column_bytes(_column_int(home_classes) * 4 + modes, homes).translate(self._status_tables[device])
+            if device == self.heating or device == self.cooling:
+                table = _TEMPERATURE_TABLES[device == self.heating]
+                column = _column_bytes(_column_int(column) * 4 + temperature, homes).translate(table)
+            status_columns.append(column)
+
+        # Transposição das colunas para uma linha por casa
+        interleaved = bytearray(homes * devices)
+        for device, column in enumerate(status_columns):
+            interleaved[device::devices] = column
+        device_status = [interleaved[offset:offset + devices] for offset in range(0, homes * devices, devices)]
+
+        # O desligamento por limite segue a ordem de prioridades de cada casa e continua casa a casa,
+        # apenas para as casas que atingiram o limite; perfis compartilhados têm a ordem pré-calculada
+        if profile_bytes is not None:
+            shed_orders = [[device for device, priority in enumerate(key) if priority is not None and priority > 1]
+                           for key in profiles]
+        for home, (total, limit) in enumerate(zip(total_energy_used_today, energy_usage_limits)):
+            if total < limit:
+                continue
+            status = device_status[home]
+            if profile_bytes is not None:
+                for device in shed_orders[profile_bytes[home]]:
+                    if status[device]:
+                        if total < limit:
+                            break
+                        status[device] = 0
+                        total -= 1
+            else:
+                for device, priority in enumerate(device_priorities[home]):
+                    if priority is not None and priority > 1 and status[device]:
+                        if total < limit:
+                            break
+                        status[device] = 0
+                        total -= 1
+            total_energy_used[home] = total
+
+        return FleetEnergyResult(self.device_names, device_status, energy_saving_mode,
+                                 temperature_regulation_active, total_energy_used)
+
+
+def _priority_class(priority: Optional[int]) -> int:
+    if priority is None:
+        return 0
+    return 1 if priority <= 1 else 2
+
+
+def _status_table(always_on: int) -> bytes:
+    # Código = classe da prioridade * 4 + economia * 2 + noite
+    table = bytearray(256)
+    for priority_class in (1, 2):
+        for saving in (0, 1):
+            for night in (0, 1):
+                on = 0 if saving and priority_class == 2 else 1
+                table[priority_class * 4 + saving * 2 + night] = on and (always_on if night else 1)
+    return bytes(table)
+
+
+def _temperature_table(heating_side: int) -> bytes:
+    # Código = estado base * 4 + aquecimento * 2 + resfriamento; o dispositivo acionado liga,
+    # o outro mantém o estado base e, sem regulação, ambos desligam
+    table = bytearray(256)
+    for base in (0, 1):
+        table[base * 4 + 2] = 1 if heating_side else base
+        table[base * 4 + 1] = base if heating_side else 1
+    return bytes(table)
+
+
+_TEMPERATURE_TABLES = (_temperature_table(0), _temperature_table(1))
+
+
+def _column_int(column) -> int:
+    return int.from_bytes(column, "big")
+
+
+def _column_bytes(value: int, length: int) -> bytes:
+    return value.to_bytes(length, "big")
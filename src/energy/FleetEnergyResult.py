@@ -0,0 +1,40 @@
+from array import array
+
+
+class FleetEnergyResult:
+    def __init__(
+        self,
+        device_names: list[str],
+        device_status: list[bytearray],
+        energy_saving_mode: bytearray,
+        temperature_regulation_active: bytearray,
+        total_energy_used: array,
+    ):
+        self.device_names = device_names
+        self.device_status = device_status
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.total_energy_used = total_energy_used
+
+    def __len__(self) -> int:
+        return len(self.device_status)
+
+    def status_for(self, home: int) -> dict[str, bool]:
+        return {name: bool(on) for name, on in zip(self.device_names, self.device_status[home])}
+
+    def pack_status(self) -> bytes:
+        # Bits de todas as casas, contíguos, com (dispositivos + 7) // 8 bytes por casa
+        width = (len(self.device_names) + 7) // 8
+        packed = bytearray(width * len(self.device_status))
+        for home, status in enumerate(self.device_status):
+            offset = home * width
+            for device, on in enumerate(status):
+                if on:
+                    packed[offset + (device >> 3)] |= 1 << (device & 7)
+        return bytes(packed)
+
+    def __repr__(self) -> str:
+        return (f"FleetEnergyResult(homes={len(self)}, "
+                f"devices={len(self.device_names)}, "
+                f"energy_saving_homes={sum(self.energy_saving_mode)}, "
+                f"temperature_regulation_homes={sum(self.temperature_regulation_active)})")
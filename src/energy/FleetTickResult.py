@@ -0,0 +1,34 @@
+from array import array
+from src.energy.DeviceRegistry import DeviceRegistry
+from src.energy.DeviceStatusBits import DeviceStatusBits
+
+
+class FleetTickResult:
+    def __init__(
+        self,
+        registry: DeviceRegistry,
+        status_bits: bytes,
+        energy_saving_mode: bytearray,
+        temperature_regulation_active: bytearray,
+        total_energy_used: array,
+    ):
+        self.registry = registry
+        self.status_bits = status_bits
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.total_energy_used = total_energy_used
+
+    def __len__(self) -> int:
+        return len(self.total_energy_used)
+
+    def status_for(self, home: int) -> DeviceStatusBits:
+        width = self.registry.row_bytes
+        offset = 2 * width * home
+        present = int.from_bytes(self.status_bits[offset:offset + width], "little")
+        on = int.from_bytes(self.status_bits[offset + width:offset + 2 * width], "little")
+        return DeviceStatusBits(self.registry, present, on)
+
+    def __repr__(self) -> str:
+        return (f"FleetTickResult(homes={len(self)}, "
+                f"energy_saving_homes={sum(self.energy_saving_mode)}, "
+                f"temperature_regulation_homes={sum(self.temperature_regulation_active)})")
@@ -0,0 +1,25 @@
+from typing import Optional, Union
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+class HomeProfile:
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        scheduled_devices: Optional[Union[list[DeviceSchedule], ScheduleIndex]] = None,
+    ):
+        self.device_priorities = device_priorities
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        self.scheduled_devices = scheduled_devices
+
+    def __repr__(self) -> str:
+        return (f"HomeProfile(devices={len(self.device_priorities)}, "
+                f"price_threshold={self.price_threshold}, "
+                f"desired_temperature_range={self.desired_temperature_range}, "
+                f"energy_usage_limit={self.energy_usage_limit})")
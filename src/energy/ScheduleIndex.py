@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Iterable, Iterator
+from src.energy.DeviceSchedule import DeviceSchedule
+
+
+class ScheduleIndex:
+    def __init__(self, schedules: Iterable[DeviceSchedule] = ()):
+        self._by_time: dict[datetime, list[DeviceSchedule]] = {}
+        self._size = 0
+        for schedule in schedules:
+            self.add(schedule)
+
+    def add(self, schedule: DeviceSchedule) -> None:
+        bucket = self._by_time.get(schedule.scheduled_time)
+        if bucket is None:
+            self._by_time[schedule.scheduled_time] = [schedule]
+        else:
+            bucket.append(schedule)
+        self._size += 1
+
+    def remove(self, schedule: DeviceSchedule) -> None:
+        bucket = self._by_time.get(schedule.scheduled_time)
+        if bucket is None or schedule not in bucket:
+            raise ValueError(f"{schedule} is not in the index")
+        bucket.remove(schedule)
+        if not bucket:
+            del self._by_time[schedule.scheduled_time]
+        self._size -= 1
+
+    def at(self, scheduled_time: datetime) -> list[DeviceSchedule]:
+        return self._by_time.get(scheduled_time, [])
+
+    def __contains__(self, schedule: DeviceSchedule) -> bool:
+        return schedule in self._by_time.get(schedule.scheduled_time, ())
+
+    def __iter__(self) -> Iterator[DeviceSchedule]:
+        for bucket in self._by_time.values():
+            yield from bucket
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"ScheduleIndex(schedules={self._size}, timestamps={len(self._by_time)})"
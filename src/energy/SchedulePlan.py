@@ -0,0 +1,17 @@
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+class SchedulePlan:
+    def __init__(self, schedules: list[DeviceSchedule], total_cost: float, unscheduled: list[str]):
+        self.schedules = schedules
+        self.total_cost = total_cost
+        self.unscheduled = unscheduled
+
+    def as_index(self) -> ScheduleIndex:
+        return ScheduleIndex(self.schedules)
+
+    def __repr__(self) -> str:
+        return (f"SchedulePlan(schedules={len(self.schedules)}, "
+                f"total_cost={self.total_cost:.2f}, "
+                f"unscheduled={self.unscheduled})")
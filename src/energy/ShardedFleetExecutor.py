@@ -0,0 +1,201 @@
+import multiprocessing
+import time
+from array import array
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+from src.energy.DeviceRegistry import DeviceRegistry
+from src.energy.EnergyController import EnergyController
+from src.energy.FleetTickResult import FleetTickResult
+from src.energy.HomeProfile import HomeProfile
+from src.energy.ScheduleIndex import ScheduleIndex
+
+TICK = "tick"
+STOP = "stop"
+
+
+class _Layout:
+    # Blocos de memória compartilhada: entradas (temperatura, energia consumida desde o último tick)
+    # e saídas (bits de presença/ligados por casa, flags por casa, energia restante)
+    def __init__(self, homes: int, row_bytes: int):
+        self.homes = homes
+        self.row_bytes = row_bytes
+        self.temperatures = 0
+        self.energy_deltas = 8 * homes
+        self.input_size = 16 * homes
+        self.totals = 0
+        self.status = 8 * homes
+        self.flags = self.status + 2 * row_bytes * homes
+        self.output_size = self.flags + homes
+
+
+def _shard_worker(connection, profiles: list[HomeProfile], first_home: int, registry: DeviceRegistry,
+                  input_name: str, output_name: str, homes: int) -> None:
+    input_memory = shared_memory.SharedMemory(name=input_name)
+    output_memory = shared_memory.SharedMemory(name=output_name)
+    layout = _Layout(homes, registry.row_bytes)
+    temperatures = input_memory.buf[layout.temperatures:layout.temperatures + 8 * homes].cast("d")
+    energy_deltas = input_memory.buf[layout.energy_deltas:layout.energy_deltas + 8 * homes].cast("d")
+    totals = output_memory.buf[layout.totals:layout.totals + 8 * homes].cast("d")
+    status = output_memory.buf[layout.status:layout.flags]
+    flags = output_memory.buf[layout.flags:layout.output_size]
+
+    controllers = [EnergyController(profile.device_priorities, profile.price_threshold,
+                                    profile.desired_temperature_range, profile.energy_usage_limit,
+                                    profile.scheduled_devices) for profile in profiles]
+    usage = [0.0] * len(profiles)
+    written: list[Optional[dict]] = [None] * len(profiles)
+    day = None
+    width = registry.row_bytes
+    try:
+        while True:
+            command = connection.recv()
+            if command[0] == STOP:
+                break
+
+            _, current_price, current_time = command
+            if current_time.date() != day:
+                day = current_time.date()
+                usage = [0.0] * len(profiles)
+
+            for local, controller in enumerate(controllers):
+                home = first_home + local
+                usage[local] += energy_deltas[home]
+                controller.update(current_price, current_time, temperatures[home], usage[local])
+
+                totals[home] = controller.total_energy_used
+                flags[home] = controller.energy_saving_mode | (controller.temperature_regulation_active << 1)
+                # O controlador só substitui o dicionário quando reavalia as regras
+                if written[local] is not controller.device_status:
+                    written[local] = controller.device_status
+                    present = 0
+                    on = 0
+                    for name, device_on in controller.device_status.items():
+                        bit = 1 << registry.position(name)
+                        present |= bit
+                        if device_on:
+                            on |= bit
+                    offset = 2 * width * home
+                    status[offset:offset + width] = present.to_bytes(width, "little")
+                    status[offset + width:offset + 2 * width] = on.to_bytes(width, "little")
+
+            connection.send(len(controllers))
+    finally:
+        for view in (temperatures, energy_deltas, totals, status, flags):
+            view.release()
+        input_memory.close()
+        output_memory.close()
+        connection.close()
+
+
+class ShardedFleetExecutor:
+    def __init__(self, homes: Sequence[HomeProfile], workers: Optional[int] = None):
+        self.homes = len(homes)
+        self.workers = max(1, min(workers or multiprocessing.cpu_count(), self.homes or 1))
+        self.ticks = 0
+        self.elapsed_seconds = 0.0
+
+        self.registry = DeviceRegistry(["Heating", "Cooling"])
+        for profile in homes:
+            for device in profile.device_priorities:
+                self.registry.register(device)
+            schedules = profile.scheduled_devices
+            if not isinstance(schedules, ScheduleIndex):
+                schedules = schedules or ()
+            for schedule in schedules:
+                self.registry.register(schedule.device_name)
+
+        self._layout = _Layout(self.homes, self.registry.row_bytes)
+        self._input = shared_memory.SharedMemory(create=True, size=max(1, self._layout.input_size))
+        self._output = shared_memory.SharedMemory(create=True, size=max(1, self._layout.output_size))
+        self._output.buf[:self._layout.output_size] = bytes(self._layout.output_size)
+
+        context = multiprocessing.get_context()
+        self._connections = []
+        self._processes = []
+        shard_size = -(-self.homes // self.workers) if self.homes else 0
+        for first_home in range(0, self.homes, shard_size or 1):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_shard_worker,
+                args=(child_end, list(homes[first_home:first_home + shard_size]), first_home, self.registry,
+                      self._input.name, self._output.name, self.homes),
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def tick(
+        self,
+        current_price: float,
+        current_time: datetime,
+        temperatures: Sequence[float],
+        energy_deltas: Sequence[float],
+    ) -> FleetTickResult:
+
+        if len(temperatures) != self.homes or len(energy_deltas) != self.homes:
+            raise ValueError("temperatures and energy_deltas must have one entry per home")
+
+        started = time.perf_counter()
+        layout = self._layout
+        self._input.buf[layout.temperatures:layout.temperatures + 8 * self.homes] = array("d", temperatures).tobytes()
+        self._input.buf[layout.energy_deltas:layout.energy_deltas + 8 * self.homes] = \
+            array("d", energy_deltas).tobytes()
+
+        for connection in self._connections:
+            connection.send((TICK, current_price, current_time))
+        for connection in self._connections:
+            connection.recv()
+
+        output = self._output.buf
+        total_energy_used = array("d")
+        total_energy_used.frombytes(bytes(output[layout.totals:layout.totals + 8 * self.homes]))
+        flags = bytes(output[layout.flags:layout.output_size])
+        result = FleetTickResult(
+            self.registry,
+            bytes(output[layout.status:layout.flags]),
+            bytearray(flag & 1 for flag in flags),
+            bytearray(flag >> 1 for flag in flags),
+            total_energy_used,
+        )
+
+        self.ticks += 1
+        self.elapsed_seconds += time.perf_counter() - started
+        return result
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def close(self) -> None:
+        for connection in self._connections:
+            try:
+                connection.send((STOP,))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._processes = []
+        if self._input is not None:
+            self._input.close()
+            self._input.unlink()
+            self._output.close()
+            self._output.unlink()
+            self._input = None
+            self._output = None
+
+    def __enter__(self) -> "ShardedFleetExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"ShardedFleetExecutor(homes={self.homes}, "
+                f"workers={len(self._processes)}, "
+                f"ticks_per_second={self.ticks_per_second:.1f})")
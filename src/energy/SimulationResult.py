@@ -0,0 +1,34 @@
+from array import array
+
+
+class SimulationResult:
+    def __init__(
+        self,
+        device_names: list[str],
+        device_status: list[bytes],
+        energy_saving_mode: bytearray,
+        temperature_regulation_active: bytearray,
+        step_energy: array,
+        total_energy_used: array,
+    ):
+        self.device_names = device_names
+        self.device_status = device_status
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.step_energy = step_energy
+        self.total_energy_used = total_energy_used
+
+    def __len__(self) -> int:
+        return len(self.device_status)
+
+    def status_at(self, step: int) -> dict[str, bool]:
+        return {name: bool(on) for name, on in zip(self.device_names, self.device_status[step])}
+
+    @property
+    def total_energy(self) -> float:
+        return sum(self.step_energy)
+
+    def __repr__(self) -> str:
+        return (f"SimulationResult(steps={len(self)}, "
+                f"devices={len(self.device_names)}, "
+                f"total_energy={self.total_energy:.2f})")
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+METER = "meter"
+PRICE = "price"
+TEMPERATURE = "temperature"
+
+
+class TelemetryEvent:
+    def __init__(self, kind: str, timestamp: datetime, value: float, home_id: Optional[str] = None):
+        if kind not in (METER, PRICE, TEMPERATURE):
+            raise ValueError(f"Unknown telemetry event kind: {kind}")
+        self.kind = kind
+        self.timestamp = timestamp
+        self.value = value
+        self.home_id = home_id
+
+    def __repr__(self) -> str:
+        return (f"TelemetryEvent(kind='{self.kind}', timestamp='{self.timestamp}', "
+                f"value={self.value}, home_id={self.home_id!r})")
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import date
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+from src.energy.EnergyController import EnergyController
+from src.energy.EnergyUpdate import EnergyUpdate
+from src.energy.HomeProfile import HomeProfile
+from src.energy.TelemetryEvent import METER, PRICE, TelemetryEvent
+
+
+class _HomeState:
+    __slots__ = ("controller", "price", "temperature", "total_energy_used_today", "day")
+
+    def __init__(self, profile: HomeProfile):
+        self.controller = EnergyController(profile.device_priorities, profile.price_threshold,
+                                           profile.desired_temperature_range, profile.energy_usage_limit,
+                                           profile.scheduled_devices)
+        self.price: Optional[float] = None
+        self.temperature: Optional[float] = None
+        self.total_energy_used_today = 0.0
+        self.day: Optional[date] = None
+
+
+class TelemetryPipeline:
+    def __init__(self, homes: dict[str, HomeProfile], full_results: bool = False):
+        self.full_results = full_results
+        self.global_price: Optional[float] = None
+        self.dropped_events = 0
+        self._homes = {home_id: _HomeState(profile) for home_id, profile in homes.items()}
+
+    def process(self, events: Iterable[TelemetryEvent]) -> Iterator[EnergyUpdate]:
+        for event in events:
+            yield from self.handle(event)
+
+    async def aprocess(self, events: AsyncIterable[TelemetryEvent]) -> AsyncIterator[EnergyUpdate]:
+        async for event in events:
+            for update in self.handle(event):
+                yield update
+
+    async def forward(self, events: AsyncIterable[TelemetryEvent], queue: asyncio.Queue) -> None:
+        # Com uma fila limitada, put() suspende a leitura de eventos até o consumidor liberar espaço
+        async for update in self.aprocess(events):
+            await queue.put(update)
+
+    def handle(self, event: TelemetryEvent) -> list[EnergyUpdate]:
+        if event.home_id is None:
+            if event.kind != PRICE:
+                self.dropped_events += 1
+                return []
+            self.global_price = event.value
+            updates = []
+            for home_id, state in self._homes.items():
+                if state.price is None:
+                    update = self._evaluate(home_id, state, event)
+                    if update is not None:
+                        updates.append(update)
+            return updates
+
+        state = self._homes.get(event.home_id)
+        if state is None:
+            self.dropped_events += 1
+            return []
+
+        if event.kind == METER:
+            # Leituras de um dia já encerrado não contam para o consumo de hoje
+            if state.day is not None and event.timestamp.date() < state.day:
+                self.dropped_events += 1
+                return []
+            self._roll_day(state, event)
+            state.total_energy_used_today += event.value
+        elif event.kind == PRICE:
+            state.price = event.value
+        else:
+            state.temperature = event.value
+
+        update = self._evaluate(event.home_id, state, event)
+        return [] if update is None else [update]
+
+    def total_energy_used_today(self, home_id: str) -> float:
+        return self._homes[home_id].total_energy_used_today
+
+    def _roll_day(self, state: _HomeState, event: TelemetryEvent) -> None:
+        day = event.timestamp.date()
+        if state.day is None or day > state.day:
+            state.day = day
+            state.total_energy_used_today = 0.0
+
+    def _evaluate(self, home_id: str, state: _HomeState, event: TelemetryEvent) -> Optional[EnergyUpdate]:
+        self._roll_day(state, event)
+        price = state.price if state.price is not None else self.global_price
+        if price is None or state.temperature is None:
+            return None
+
+        changes = state.controller.update(price, event.timestamp, state.temperature,
+                                          state.total_energy_used_today)
+        if self.full_results:
+            return EnergyUpdate(home_id, event.timestamp, changes, state.controller.result)
+        if changes:
+            return EnergyUpdate(home_id, event.timestamp, changes)
+        return None
+
+    def __repr__(self) -> str:
+        return (f"TelemetryPipeline(homes={len(self._homes)}, "
+                f"global_price={self.global_price}, "
+                f"dropped_events={self.dropped_events})")
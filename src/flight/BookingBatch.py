@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional, Sequence
+
+
+class BookingBatch:
+    def __init__(
+        self,
+        passengers: Sequence[int],
+        booking_times: Sequence[datetime],
+        available_seats: Sequence[int],
+        current_prices: Sequence[float],
+        previous_sales: Sequence[int],
+        departure_times: Sequence[datetime],
+        reward_points_available: Sequence[int],
+        is_cancellations: Optional[Sequence[bool]] = None,
+    ):
+        if is_cancellations is None:
+            is_cancellations = [False] * len(passengers)
+
+        columns = (passengers, booking_times, available_seats, current_prices,
+                   previous_sales, departure_times, reward_points_available, is_cancellations)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All booking columns must have the same length")
+
+        self.passengers = passengers
+        self.booking_times = booking_times
+        self.available_seats = available_seats
+        self.current_prices = current_prices
+        self.previous_sales = previous_sales
+        self.departure_times = departure_times
+        self.reward_points_available = reward_points_available
+        self.is_cancellations = is_cancellations
+
+    def __len__(self) -> int:
+        return len(self.passengers)
+
+    def rows(self):
+        return zip(self.passengers, self.booking_times, self.available_seats, self.current_prices,
+                   self.previous_sales, self.departure_times, self.reward_points_available)
+
+    def booking_rows(self):
+        return zip(self.passengers, self.booking_times, self.available_seats, self.current_prices,
+                   self.previous_sales, self.is_cancellations, self.departure_times,
+                   self.reward_points_available)
+
+    def __repr__(self) -> str:
+        return f"BookingBatch(size={len(self)})"
@@ -0,0 +1,62 @@
+from array import array
+from itertools import islice
+from typing import Iterator
+from src.flight.BookingBatch import BookingBatch
+from src.flight.FlightBookingSystem import (FULL_REFUND_WINDOW, fixed_point_fare,
+                                            fixed_point_refund, float_fare, float_refund)
+from src.flight.RefundChunk import RefundChunk
+
+
+class BulkRefundProcessor:
+    def __init__(self, chunk_size: int = 10000, fixed_point: bool = False):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+        self.fixed_point = fixed_point
+
+    def process_refunds(self, batch: BookingBatch) -> Iterator[RefundChunk]:
+        rows = batch.rows()
+        start = 0
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            if self.fixed_point:
+                yield self._refund_chunk_fixed_point(start, chunk)
+            else:
+                yield self._refund_chunk(start, chunk)
+            start += len(chunk)
+
+    def _refund_chunk(self, start: int, chunk: list) -> RefundChunk:
+        refund_amounts = array("d", bytes(8 * len(chunk)))
+        full_refund = array("b", bytes(len(chunk)))
+
+        for i, (passengers, booking_time, available_seats, current_price,
+                previous_sales, departure_time, reward_points) in enumerate(chunk):
+            if passengers > available_seats:
+                continue
+
+            time_difference = departure_time - booking_time
+            final_price = float_fare(passengers, current_price, previous_sales,
+                                     time_difference, reward_points)
+            refund_amounts[i] = float_refund(final_price, time_difference)
+            full_refund[i] = time_difference.total_seconds() / 3600 >= 48
+
+        return RefundChunk(start, refund_amounts, full_refund)
+
+    def _refund_chunk_fixed_point(self, start: int, chunk: list) -> RefundChunk:
+        refund_amounts = array("q", bytes(8 * len(chunk)))
+        full_refund = array("b", bytes(len(chunk)))
+
+        for i, (passengers, booking_time, available_seats, current_price,
+                previous_sales, departure_time, reward_points) in enumerate(chunk):
+            if passengers > available_seats:
+                continue
+
+            time_difference = departure_time - booking_time
+            final_price = fixed_point_fare(passengers, current_price, previous_sales,
+                                           time_difference, reward_points)
+            refund_amounts[i] = fixed_point_refund(final_price, time_difference)
+            full_refund[i] = time_difference >= FULL_REFUND_WINDOW
+
+        return RefundChunk(start, refund_amounts, full_refund)
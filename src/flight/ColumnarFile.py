@@ -0,0 +1,47 @@
+import json
+import struct
+import sys
+from array import array
+from typing import Optional
+
+MAGIC = b"COLS"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+
+
+def write_columns(path: str, columns: dict[str, array]) -> None:
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length")
+
+    metadata = json.dumps({
+        "rows": lengths.pop() if lengths else 0,
+        "byteorder": sys.byteorder,
+        "columns": [[name, column.typecode] for name, column in columns.items()],
+    }).encode()
+
+    with open(path, "wb") as output_file:
+        output_file.write(HEADER.pack(MAGIC, VERSION, len(metadata)))
+        output_file.write(metadata)
+        for column in columns.values():
+            column.tofile(output_file)
+
+
+def read_columns(path: str, names: Optional[list[str]] = None) -> dict[str, array]:
+    with open(path, "rb") as input_file:
+        magic, version, metadata_size = HEADER.unpack(input_file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a columnar file")
+        metadata = json.loads(input_file.read(metadata_size))
+
+        columns = {}
+        for name, typecode in metadata["columns"]:
+            column = array(typecode)
+            if names is None or name in names:
+                column.fromfile(input_file, metadata["rows"])
+                if metadata["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                columns[name] = column
+            else:
+                input_file.seek(column.itemsize * metadata["rows"], 1)
+        return columns
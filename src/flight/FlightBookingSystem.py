@@ -1,7 +1,67 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.flight.BookingBatch import BookingBatch
 from src.flight.BookingResult import BookingResult
+from src.flight.ItineraryLeg import ItineraryLeg
+from src.flight.ItineraryResult import ItineraryResult
+
+LAST_MINUTE_WINDOW = timedelta(hours=24)
+FULL_REFUND_WINDOW = timedelta(hours=48)
+LAST_MINUTE_FEE_CENTS = 10000
+
+
+def round_half_up(numerator: int, denominator: int) -> int:
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def float_fare(passengers: int, current_price: float, previous_sales: int,
+               time_difference: timedelta, reward_points_available: int) -> float:
+    # Mesma ordem de operações do cálculo original para reproduzir os mesmos floats
+    final_price = current_price * ((previous_sales / 100.0) * 0.8) * passengers
+
+    if time_difference.total_seconds() / 3600 < 24:
+        final_price += 100
+    if passengers > 4:
+        final_price *= 0.95
+    if reward_points_available > 0:
+        final_price -= reward_points_available * 0.01
+    if final_price < 0:
+        final_price = 0
+
+    return final_price
+
+
+def float_refund(final_price: float, time_difference: timedelta) -> float:
+    if time_difference.total_seconds() / 3600 >= 48:
+        return final_price
+    return final_price * 0.5
+
+
+def fixed_point_fare(passengers: int, current_price: int, previous_sales: int,
+                     time_difference: timedelta, reward_points_available: int) -> int:
+    # Preços em centavos inteiros: fator (vendas / 100) * 0.8 == vendas * 8 / 1000
+    final_price = round_half_up(current_price * previous_sales * passengers * 8, 1000)
+
+    if time_difference < LAST_MINUTE_WINDOW:
+        final_price += LAST_MINUTE_FEE_CENTS
+    if passengers > 4:
+        final_price = round_half_up(final_price * 95, 100)
+    if reward_points_available > 0:
+        # 1 ponto vale 0.01, ou seja, exatamente 1 centavo
+        final_price -= reward_points_available
+
+    return final_price if final_price > 0 else 0
+
+
+def fixed_point_refund(final_price: int, time_difference: timedelta) -> int:
+    if time_difference >= FULL_REFUND_WINDOW:
+        return final_price
+    return round_half_up(final_price, 2)
+
 
 class FlightBookingSystem:
+    def __init__(self, fixed_point: bool = False):
+        self.fixed_point = fixed_point
+
     def book_flight(
                     self, 
                     passengers: int, 
@@ -14,41 +74,149 @@ class FlightBookingSystem:
                     reward_points_available: int
                 ) -> BookingResult:
 
-        final_price = 0.0
-        refund_amount = 0.0
-        confirmation = False
-        points_used = False
+        if self.fixed_point:
+            return self._book_flight_fixed_point(passengers, booking_time, available_seats, current_price,
+                                                 previous_sales, is_cancellation, departure_time,
+                                                 reward_points_available)
 
         if passengers > available_seats:
-            return BookingResult(confirmation, final_price, refund_amount, points_used)
+            return BookingResult(False, 0.0, 0.0, False)
+
+        time_difference = departure_time - booking_time
+        final_price = float_fare(passengers, current_price, previous_sales,
+                                 time_difference, reward_points_available)
+
+        if is_cancellation:
+            return BookingResult(False, 0, float_refund(final_price, time_difference), False)
+
+        return BookingResult(True, final_price, 0.0, reward_points_available > 0)
+
+    def _book_flight_fixed_point(
+                    self,
+                    passengers: int,
+                    booking_time: datetime,
+                    available_seats: int,
+                    current_price: int,
+                    previous_sales: int,
+                    is_cancellation: bool,
+                    departure_time: datetime,
+                    reward_points_available: int
+                ) -> BookingResult:
 
-        price_factor = (previous_sales / 100.0) * 0.8
-        final_price = current_price * price_factor * passengers
+        if passengers > available_seats:
+            return BookingResult(False, 0, 0, False)
 
         time_difference = departure_time - booking_time
-        hours_to_departure = time_difference.total_seconds() / 3600
-        
-        if hours_to_departure < 24:
-            final_price += 100
+        final_price = fixed_point_fare(passengers, current_price, previous_sales,
+                                       time_difference, reward_points_available)
+
+        if is_cancellation:
+            return BookingResult(False, 0, fixed_point_refund(final_price, time_difference), False)
 
-        if passengers > 4:
-            final_price *= 0.95  
+        return BookingResult(True, final_price, 0, reward_points_available > 0)
+
+    def book_itinerary(
+                    self,
+                    passengers: int,
+                    booking_time: datetime,
+                    legs: list[ItineraryLeg],
+                    is_cancellation: bool,
+                    reward_points_available: int
+                ) -> ItineraryResult:
 
-        if reward_points_available > 0:
-            final_price -= reward_points_available * 0.01
-            points_used = True
-        
-        if final_price < 0:
-            final_price = 0
+        if not legs:
+            raise ValueError("An itinerary needs at least one leg")
+
+        # Todas as pernas são confirmadas juntas ou nenhuma é
+        if any(passengers > leg.available_seats for leg in legs):
+            empty = 0 if self.fixed_point else 0.0
+            return ItineraryResult([BookingResult(False, empty, empty, False) for _ in legs],
+                                   BookingResult(False, empty, empty, False))
+
+        if self.fixed_point:
+            remaining_discount = reward_points_available if reward_points_available > 0 else 0
+        else:
+            remaining_discount = reward_points_available * 0.01 if reward_points_available > 0 else 0.0
+
+        fare = fixed_point_fare if self.fixed_point else float_fare
+        refund = fixed_point_refund if self.fixed_point else float_refund
+        leg_prices = []
+        leg_points_used = []
+        for leg in legs:
+            time_difference = leg.departure_time - booking_time
+            final_price = fare(passengers, leg.current_price, leg.previous_sales, time_difference, 0)
+
+            # Os pontos são aplicados uma única vez, consumidos na ordem das pernas
+            points_used = remaining_discount > 0
+            if points_used and final_price > 0:
+                deduction = min(remaining_discount, final_price)
+                final_price -= deduction
+                remaining_discount -= deduction
+            if final_price < 0:
+                final_price = 0
+
+            leg_prices.append((final_price, time_difference))
+            leg_points_used.append(points_used)
 
         if is_cancellation:
-            if hours_to_departure >= 48:
-                refund_amount = final_price
+            leg_results = []
+            for final_price, time_difference in leg_prices:
+                refund_amount = refund(final_price, time_difference)
+                leg_results.append(BookingResult(False, 0, refund_amount, False))
+
+            total_refund = sum(result.refund_amount for result in leg_results)
+            return ItineraryResult(leg_results, BookingResult(False, 0, total_refund, False))
+
+        for leg in legs:
+            leg.available_seats -= passengers
+
+        leg_results = [BookingResult(True, final_price, 0 if self.fixed_point else 0.0, points_used)
+                       for (final_price, _), points_used in zip(leg_prices, leg_points_used)]
+        total_price = sum(final_price for final_price, _ in leg_prices)
+        return ItineraryResult(leg_results, BookingResult(True, total_price, 0 if self.fixed_point else 0.0,
+                                                          reward_points_available > 0))
+
+    def book_flights(self, batch: BookingBatch) -> list[BookingResult]:
+        if self.fixed_point:
+            return self._book_flights_fixed_point(batch)
+
+        results = []
+        append = results.append
+
+        for (passengers, booking_time, available_seats, current_price, previous_sales,
+             is_cancellation, departure_time, reward_points_available) in batch.booking_rows():
+            if passengers > available_seats:
+                append(BookingResult(False, 0.0, 0.0, False))
+                continue
+
+            time_difference = departure_time - booking_time
+            final_price = float_fare(passengers, current_price, previous_sales,
+                                     time_difference, reward_points_available)
+
+            if is_cancellation:
+                append(BookingResult(False, 0, float_refund(final_price, time_difference), False))
+            else:
+                append(BookingResult(True, final_price, 0.0, reward_points_available > 0))
+
+        return results
+
+    def _book_flights_fixed_point(self, batch: BookingBatch) -> list[BookingResult]:
+        results = []
+        append = results.append
+
+        for (passengers, booking_time, available_seats, current_price, previous_sales,
+             is_cancellation, departure_time, reward_points_available) in batch.booking_rows():
+            if passengers > available_seats:
+                append(BookingResult(False, 0, 0, False))
+                continue
+
+            time_difference = departure_time - booking_time
+            final_price = fixed_point_fare(passengers, current_price, previous_sales,
+                                           time_difference, reward_points_available)
+
+            if is_cancellation:
+                append(BookingResult(False, 0, fixed_point_refund(final_price, time_difference), False))
             else:
-                refund_amount = final_price * 0.5
-            
-            return BookingResult(False, 0, refund_amount, False)
-            
-        confirmation = True
+                append(BookingResult(True, final_price, 0, reward_points_available > 0))
 
-        return BookingResult(confirmation, final_price, refund_amount, points_used)
\ No newline at end of file
+        return results
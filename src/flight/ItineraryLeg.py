@@ -0,0 +1,15 @@
+from datetime import datetime
+
+
+class ItineraryLeg:
+    def __init__(self, available_seats: int, current_price: float, previous_sales: int, departure_time: datetime):
+        self.available_seats = available_seats
+        self.current_price = current_price
+        self.previous_sales = previous_sales
+        self.departure_time = departure_time
+
+    def __repr__(self) -> str:
+        return (f"ItineraryLeg(available_seats={self.available_seats}, "
+                f"current_price={self.current_price}, "
+                f"previous_sales={self.previous_sales}, "
+                f"departure_time='{self.departure_time}')")
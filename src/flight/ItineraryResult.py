@@ -0,0 +1,10 @@
+from src.flight.BookingResult import BookingResult
+
+
+class ItineraryResult:
+    def __init__(self, legs: list[BookingResult], total: BookingResult):
+        self.legs = legs
+        self.total = total
+
+    def __repr__(self) -> str:
+        return f"ItineraryResult(legs={self.legs}, total={self.total})"
@@ -0,0 +1,20 @@
+from array import array
+
+
+class RefundChunk:
+    def __init__(self, start: int, refund_amounts: array, full_refund: array):
+        self.start = start
+        self.refund_amounts = refund_amounts
+        self.full_refund = full_refund
+
+    def __len__(self) -> int:
+        return len(self.refund_amounts)
+
+    @property
+    def total_refund(self) -> float:
+        return sum(self.refund_amounts)
+
+    def __repr__(self) -> str:
+        return (f"RefundChunk(start={self.start}, "
+                f"size={len(self)}, "
+                f"total_refund={self.total_refund:.2f})")
@@ -0,0 +1,159 @@
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from multiprocessing import shared_memory
+from typing import Callable, Optional
+from src.flight.BookingBatch import BookingBatch
+from src.flight.ColumnarFile import write_columns
+from src.flight.FlightBookingSystem import fixed_point_fare, fixed_point_refund, float_fare, float_refund
+from src.flight.RepricingProgress import RepricingProgress
+
+# (nome, typecode no modo float, typecode no modo centavos)
+INPUT_COLUMNS = (
+    ("passengers", "q", "q"),
+    ("available_seats", "q", "q"),
+    ("current_price", "d", "q"),
+    ("previous_sales", "q", "q"),
+    ("microseconds_to_departure", "q", "q"),
+    ("reward_points_available", "q", "q"),
+    ("is_cancellation", "q", "q"),
+)
+OUTPUT_COLUMNS = (
+    ("confirmation", "q", "q"),
+    ("total_price", "d", "q"),
+    ("refund_amount", "d", "q"),
+    ("points_used", "q", "q"),
+)
+
+
+def _column_views(buffer, columns, rows: int, fixed_point: bool) -> dict:
+    # Todas as colunas têm itens de 8 bytes, o que mantém os offsets alinhados
+    views = {}
+    for index, (name, float_typecode, fixed_typecode) in enumerate(columns):
+        offset = index * rows * 8
+        views[name] = buffer[offset:offset + rows * 8].cast(fixed_typecode if fixed_point else float_typecode)
+    return views
+
+
+def _reprice_shard(input_name: str, output_name: str, rows: int, start: int, stop: int,
+                   fixed_point: bool) -> int:
+    input_memory = shared_memory.SharedMemory(name=input_name)
+    output_memory = shared_memory.SharedMemory(name=output_name)
+    inputs = _column_views(input_memory.buf, INPUT_COLUMNS, rows, fixed_point)
+    outputs = _column_views(output_memory.buf, OUTPUT_COLUMNS, rows, fixed_point)
+    try:
+        _reprice_rows(inputs, outputs, start, stop, fixed_point)
+    finally:
+        for view in (*inputs.values(), *outputs.values()):
+            view.release()
+        input_memory.close()
+        output_memory.close()
+    return stop - start
+
+
+def _reprice_rows(inputs: dict, outputs: dict, start: int, stop: int, fixed_point: bool) -> None:
+    passengers_column = inputs["passengers"]
+    seats_column = inputs["available_seats"]
+    price_column = inputs["current_price"]
+    sales_column = inputs["previous_sales"]
+    departure_column = inputs["microseconds_to_departure"]
+    points_column = inputs["reward_points_available"]
+    cancellation_column = inputs["is_cancellation"]
+    confirmation_column = outputs["confirmation"]
+    total_column = outputs["total_price"]
+    refund_column = outputs["refund_amount"]
+    points_used_column = outputs["points_used"]
+
+    fare = fixed_point_fare if fixed_point else float_fare
+    refund = fixed_point_refund if fixed_point else float_refund
+
+    for i in range(start, stop):
+        passengers = passengers_column[i]
+        if passengers > seats_column[i]:
+            continue
+
+        # timedelta em microssegundos inteiros reproduz exatamente o intervalo original
+        time_difference = timedelta(microseconds=departure_column[i])
+        reward_points = points_column[i]
+        final_price = fare(passengers, price_column[i], sales_column[i], time_difference, reward_points)
+
+        if cancellation_column[i]:
+            refund_column[i] = refund(final_price, time_difference)
+        else:
+            confirmation_column[i] = 1
+            total_column[i] = final_price
+            points_used_column[i] = 1 if reward_points > 0 else 0
+
+
+class RepricingJob:
+    def __init__(self, workers: Optional[int] = None, shard_size: int = 50000, fixed_point: bool = False):
+        if shard_size <= 0:
+            raise ValueError("shard_size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.fixed_point = fixed_point
+
+    def run(
+        self,
+        batch: BookingBatch,
+        output_path: str,
+        progress: Optional[Callable[[RepricingProgress], None]] = None,
+    ) -> RepricingProgress:
+
+        rows = len(batch)
+        started = time.perf_counter()
+        input_memory = shared_memory.SharedMemory(create=True, size=max(1, rows * 8 * len(INPUT_COLUMNS)))
+        output_memory = shared_memory.SharedMemory(create=True, size=max(1, rows * 8 * len(OUTPUT_COLUMNS)))
+        try:
+            self._write_inputs(input_memory.buf, batch, rows)
+            output_memory.buf[:rows * 8 * len(OUTPUT_COLUMNS)] = bytes(rows * 8 * len(OUTPUT_COLUMNS))
+
+            rows_done = 0
+            shards = [(start, min(start + self.shard_size, rows)) for start in range(0, rows, self.shard_size)]
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_reprice_shard, input_memory.name, output_memory.name, rows,
+                                           start, stop, self.fixed_point) for start, stop in shards]
+                for future in as_completed(futures):
+                    rows_done += future.result()
+                    if progress is not None:
+                        progress(RepricingProgress(rows_done, rows, time.perf_counter() - started))
+
+            self._write_outputs(output_memory.buf, rows, output_path)
+        finally:
+            input_memory.close()
+            input_memory.unlink()
+            output_memory.close()
+            output_memory.unlink()
+
+        return RepricingProgress(rows, rows, time.perf_counter() - started)
+
+    def _write_inputs(self, buffer, batch: BookingBatch, rows: int) -> None:
+        microseconds_to_departure = []
+        for booking_time, departure_time in zip(batch.booking_times, batch.departure_times):
+            time_difference = departure_time - booking_time
+            microseconds_to_departure.append(
+                (time_difference.days * 86400 + time_difference.seconds) * 10**6 + time_difference.microseconds
+            )
+
+        values = {
+            "passengers": batch.passengers,
+            "available_seats": batch.available_seats,
+            "current_price": batch.current_prices,
+            "previous_sales": batch.previous_sales,
+            "microseconds_to_departure": microseconds_to_departure,
+            "reward_points_available": batch.reward_points_available,
+            "is_cancellation": [int(value) for value in batch.is_cancellations],
+        }
+        for index, (name, float_typecode, fixed_typecode) in enumerate(INPUT_COLUMNS):
+            column = array(fixed_typecode if self.fixed_point else float_typecode, values[name])
+            buffer[index * rows * 8:(index + 1) * rows * 8] = column.tobytes()
+
+    def _write_outputs(self, buffer, rows: int, output_path: str) -> None:
+        columns = {}
+        for index, (name, float_typecode, fixed_typecode) in enumerate(OUTPUT_COLUMNS):
+            column = array(fixed_typecode if self.fixed_point else float_typecode)
+            column.frombytes(bytes(buffer[index * rows * 8:(index + 1) * rows * 8]))
+            columns[name] = column
+        write_columns(output_path, columns)
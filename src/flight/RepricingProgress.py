@@ -0,0 +1,14 @@
+class RepricingProgress:
+    def __init__(self, rows_done: int, rows_total: int, elapsed_seconds: float):
+        self.rows_done = rows_done
+        self.rows_total = rows_total
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_done / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"RepricingProgress(rows_done={self.rows_done}, "
+                f"rows_total={self.rows_total}, "
+                f"rows_per_second={self.rows_per_second:.1f})")
@@ -0,0 +1,73 @@
+import struct
+from datetime import datetime
+from typing import Iterable, Optional
+from src.fraud.AmountStatistics import AmountStatistics
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityCounter import VelocityCounter, from_micros, to_micros
+from src.fraud.VelocityFeatures import VelocityFeatures
+
+STATE_HEADER = struct.Struct("<B?qH")
+
+
+class AccountState:
+    __slots__ = ("velocity", "last_timestamp", "last_location", "amount_statistics")
+
+    def __init__(
+        self,
+        windows: Iterable[int] = (60,),
+        exact: bool = False,
+        amount_statistics: Optional[AmountStatistics] = None,
+    ):
+        self.velocity = {window: VelocityCounter(window, exact) for window in windows}
+        self.amount_statistics = amount_statistics
+        self.last_timestamp: Optional[datetime] = None
+        self.last_location: Optional[str] = None
+
+    def record(self, transaction: Transaction) -> None:
+        for counter in self.velocity.values():
+            counter.add(transaction.timestamp, transaction.amount)
+        if self.amount_statistics is not None:
+            self.amount_statistics.update(transaction.amount)
+        self.last_timestamp = transaction.timestamp
+        self.last_location = transaction.location
+
+    def velocity_features(self, now: datetime) -> VelocityFeatures:
+        counts = {}
+        amounts = {}
+        for window, counter in self.velocity.items():
+            counts[window] = counter.count(now)
+            amounts[window] = counter.amount(now)
+        return VelocityFeatures(counts, amounts)
+
+    def to_bytes(self) -> bytes:
+        # Cabeçalho fixo, local em UTF-8 e em seguida cada contador e as estatísticas de valores
+        location = (self.last_location or "").encode()
+        last_timestamp = -1 if self.last_timestamp is None else to_micros(self.last_timestamp)
+        parts = [STATE_HEADER.pack(len(self.velocity), self.amount_statistics is not None, last_timestamp,
+                                   len(location)), location]
+        parts.extend(counter.pack() for counter in self.velocity.values())
+        if self.amount_statistics is not None:
+            parts.append(self.amount_statistics.pack())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "AccountState":
+        counters, has_statistics, last_timestamp, location_size = STATE_HEADER.unpack_from(data)
+        offset = STATE_HEADER.size
+        state = cls(())
+        location = bytes(data[offset:offset + location_size]).decode()
+        offset += location_size
+        for _ in range(counters):
+            counter, offset = VelocityCounter.unpack(data, offset)
+            state.velocity[counter.window_minutes] = counter
+        if has_statistics:
+            state.amount_statistics, offset = AmountStatistics.unpack(data, offset)
+        if last_timestamp != -1:
+            state.last_timestamp = from_micros(last_timestamp)
+            state.last_location = location
+        return state
+
+    def __repr__(self) -> str:
+        return (f"AccountState(windows={list(self.velocity)}, "
+                f"last_timestamp='{self.last_timestamp}', "
+                f"last_location='{self.last_location}')")
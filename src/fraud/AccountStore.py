@@ -0,0 +1,157 @@
+import heapq
+import sqlite3
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+from src.fraud.AccountState import AccountState
+from src.fraud.AccountStoreMetrics import AccountStoreMetrics
+from src.fraud.StateSnapshot import StateSnapshot
+
+
+class AccountStore:
+    def __init__(
+        self,
+        new_state: Callable[[], AccountState] = AccountState,
+        path: str = ":memory:",
+        max_accounts: int = 100000,
+        max_idle: Optional[timedelta] = None,
+        snapshot: Optional[StateSnapshot] = None,
+    ):
+        if max_accounts <= 0:
+            raise ValueError("max_accounts must be positive")
+        self.new_state = new_state
+        self.path = path
+        self.max_accounts = max_accounts
+        self.max_idle = max_idle
+        self.snapshot = snapshot
+        self.metrics = AccountStoreMetrics()
+        # Contas quentes em memória, da menos para a mais recentemente usada
+        self._hot: OrderedDict[str, AccountState] = OrderedDict()
+        # O arquivo é só um cache de estados frios: durabilidade não é necessária
+        self._connection = sqlite3.connect(path)
+        if path != ":memory:":
+            # Com WAL a leitura de um snapshot em outro processo não bloqueia a gravação das contas frias
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS accounts (account_id TEXT PRIMARY KEY, state BLOB)")
+
+    def get(self, account_id: str) -> AccountState:
+        state = self._hot.get(account_id)
+        if state is not None:
+            self._hot.move_to_end(account_id)
+            self.metrics.hits += 1
+            return state
+
+        started = time.perf_counter()
+        row = self._connection.execute("SELECT state FROM accounts WHERE account_id = ?", (account_id,)).fetchone()
+        record = None
+        if row is not None:
+            record = row[0]
+            # A conta volta a ser quente: a linha sai do arquivo para não ser contada como fria
+            with self._connection:
+                self._connection.execute("DELETE FROM accounts WHERE account_id = ?", (account_id,))
+        if record is None and self.snapshot is not None:
+            # Contas ainda não tocadas desde a restauração são lidas sob demanda do snapshot mapeado
+            record = self.snapshot.record(account_id)
+            if record is not None:
+                self.metrics.restored += 1
+        if record is not None:
+            state = AccountState.from_bytes(record)
+            self.metrics.record_reload(time.perf_counter() - started)
+        else:
+            state = self.new_state()
+            self.metrics.created += 1
+
+        self._hot[account_id] = state
+        if len(self._hot) > self.max_accounts:
+            self._spill([self._hot.popitem(last=False)])
+            self.metrics.evictions += 1
+        return state
+
+    def evict_idle(self, now: datetime) -> int:
+        if self.max_idle is None:
+            return 0
+        cutoff = now - self.max_idle
+        idle = []
+        # A ordem LRU acompanha o horário das transações: para na primeira conta ativa
+        for account_id, state in self._hot.items():
+            if state.last_timestamp is not None and state.last_timestamp >= cutoff:
+                break
+            idle.append(account_id)
+        self._spill([(account_id, self._hot.pop(account_id)) for account_id in idle])
+        self.metrics.idle_evictions += len(idle)
+        return len(idle)
+
+    def flush(self) -> None:
+        self._spill(list(self._hot.items()))
+        self._hot.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def _spill(self, accounts: list[tuple[str, AccountState]]) -> None:
+        if not accounts:
+            return
+        rows = [(account_id, state.to_bytes()) for account_id, state in accounts]
+        self.metrics.spilled_bytes += sum(len(state) for _, state in rows)
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO accounts VALUES (?, ?)", rows)
+
+    def spilled_copy(self) -> Optional[bytes]:
+        # Um banco em memória não pode ser lido por outro processo nem por uma conexão herdada via fork:
+        # o processo de snapshot recebe uma cópia serializada, tirada antes do fork. A cópia inteira das
+        # contas frias é feita na thread que chama o snapshot e pausa o processamento enquanto dura;
+        # com muitas contas frias, use um arquivo
+        if self.path != ":memory:":
+            return None
+        return self._connection.serialize()
+
+    def snapshot_items(self, spilled: Optional[bytes] = None) -> Iterator[tuple[str, bytes]]:
+        # A leitura do sqlite começa já aqui, não no primeiro item: com WAL ela fixa as contas frias
+        # deste instante, e gravações posteriores do processamento não aparecem no snapshot
+        if spilled is not None:
+            connection = sqlite3.connect(":memory:")
+            connection.deserialize(spilled)
+        elif self.path == ":memory:":
+            connection = self._connection
+        else:
+            connection = sqlite3.connect(self.path)
+        rows = connection.execute("SELECT account_id, state FROM accounts ORDER BY account_id")
+        return self._merge_snapshot_items(connection, rows)
+
+    def _merge_snapshot_items(self, connection: sqlite3.Connection,
+                              rows: Iterator[tuple[str, bytes]]) -> Iterator[tuple[str, bytes]]:
+        # Mescla em ordem de conta: memória, depois arquivo, depois o snapshot de origem
+        sources = [
+            ((account_id, 0, self._hot[account_id].to_bytes()) for account_id in sorted(self._hot)),
+            ((account_id, 1, state) for account_id, state in rows),
+        ]
+        if self.snapshot is not None:
+            sources.append((account_id, 2, state) for account_id, state in self.snapshot.items())
+        previous = None
+        try:
+            for account_id, _, state in heapq.merge(*sources, key=lambda item: (item[0], item[1])):
+                if account_id != previous:
+                    previous = account_id
+                    yield account_id, state
+        finally:
+            if connection is not self._connection:
+                connection.close()
+
+    @property
+    def spilled_accounts(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM accounts").fetchone()[0]
+
+    def __contains__(self, account_id: str) -> bool:
+        return account_id in self._hot
+
+    def __len__(self) -> int:
+        return len(self._hot)
+
+    def __repr__(self) -> str:
+        return (f"AccountStore(path='{self.path}', "
+                f"hot_accounts={len(self._hot)}, "
+                f"max_accounts={self.max_accounts}, "
+                f"max_idle='{self.max_idle}')")
@@ -0,0 +1,30 @@
+class AccountStoreMetrics:
+    def __init__(self):
+        self.hits = 0
+        self.created = 0
+        self.reloads = 0
+        self.restored = 0
+        self.evictions = 0
+        self.idle_evictions = 0
+        self.spilled_bytes = 0
+        self.reload_seconds = 0.0
+        self.max_reload_seconds = 0.0
+
+    def record_reload(self, seconds: float) -> None:
+        self.reloads += 1
+        self.reload_seconds += seconds
+        self.max_reload_seconds = max(self.max_reload_seconds, seconds)
+
+    @property
+    def mean_reload_seconds(self) -> float:
+        return self.reload_seconds / self.reloads if self.reloads else 0.0
+
+    def __repr__(self) -> str:
+        return (f"AccountStoreMetrics(hits={self.hits}, "
+                f"created={self.created}, "
+                f"reloads={self.reloads}, "
+                f"restored={self.restored}, "
+                f"evictions={self.evictions}, "
+                f"idle_evictions={self.idle_evictions}, "
+                f"mean_reload_us={self.mean_reload_seconds * 1e6:.1f}, "
+                f"max_reload_us={self.max_reload_seconds * 1e6:.1f})")
@@ -0,0 +1,45 @@
+from typing import Optional
+from src.fraud.AmountStatistics import AmountStatistics
+from src.fraud.Transaction import Transaction
+
+
+class AmountAnomalyRule:
+    def __init__(
+        self,
+        z_threshold: float = 3.0,
+        window: Optional[int] = 50,
+        alpha: Optional[float] = None,
+        min_history: int = 10,
+        min_stddev: float = 1.0,
+        risk_score: int = 25,
+    ):
+        self.z_threshold = z_threshold
+        self.window = window
+        self.alpha = alpha
+        self.min_history = min_history
+        self.min_stddev = min_stddev
+        self.risk_score = risk_score
+        # Valida a configuração da janela ou do decaimento já na criação da regra
+        self.new_statistics()
+
+    def new_statistics(self) -> AmountStatistics:
+        return AmountStatistics(self.window, self.alpha)
+
+    def statistics_for(self, previous_transactions: list[Transaction]) -> AmountStatistics:
+        statistics = self.new_statistics()
+        history = previous_transactions if self.alpha is not None else previous_transactions[-self.window:]
+        for transaction in history:
+            statistics.update(transaction.amount)
+        return statistics
+
+    def is_triggered(self, statistics: AmountStatistics, amount: float) -> bool:
+        if statistics.count < self.min_history:
+            return False
+        return statistics.z_score(amount, self.min_stddev) > self.z_threshold
+
+    def __repr__(self) -> str:
+        return (f"AmountAnomalyRule(z_threshold={self.z_threshold}, "
+                f"window={self.window}, "
+                f"alpha={self.alpha}, "
+                f"min_history={self.min_history}, "
+                f"risk_score={self.risk_score})")
@@ -0,0 +1,103 @@
+import math
+import struct
+from array import array
+from typing import Optional
+
+STATISTICS_HEADER = struct.Struct("<IdqddI")
+
+
+class AmountStatistics:
+    __slots__ = ("window", "alpha", "count", "mean", "_m2", "_amounts", "_next")
+
+    def __init__(self, window: Optional[int] = 50, alpha: Optional[float] = None):
+        if alpha is not None:
+            if not 0 < alpha <= 1:
+                raise ValueError("alpha must be in (0, 1]")
+            window = None
+        elif window is None or window <= 0:
+            raise ValueError("A positive window or an alpha is required")
+        self.window = window
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        # Últimos N valores num anel fixo, usados para remover o valor que sai da janela
+        self._amounts = array("d", bytes(8 * window)) if window else None
+        self._next = 0
+
+    def update(self, amount: float) -> None:
+        if self.alpha is not None:
+            self._update_decayed(amount)
+            return
+
+        if self.count == self.window:
+            self._remove(self._amounts[self._next])
+        self._amounts[self._next] = amount
+        self._next = (self._next + 1) % self.window
+
+        # Atualização de Welford
+        self.count += 1
+        delta = amount - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (amount - self.mean)
+
+    def _remove(self, amount: float) -> None:
+        self.count -= 1
+        if not self.count:
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = amount - self.mean
+        self.mean -= delta / self.count
+        self._m2 = max(0.0, self._m2 - delta * (amount - self.mean))
+
+    def _update_decayed(self, amount: float) -> None:
+        # Média e variância com decaimento exponencial (atualização incremental de West)
+        self.count += 1
+        if self.count == 1:
+            self.mean = amount
+            self._m2 = 0.0
+            return
+        delta = amount - self.mean
+        self.mean += self.alpha * delta
+        self._m2 = (1 - self.alpha) * (self._m2 + self.alpha * delta * delta)
+
+    def pack(self) -> bytes:
+        header = STATISTICS_HEADER.pack(self.window or 0, self.alpha or 0.0, self.count, self.mean, self._m2,
+                                        self._next)
+        return header + (self._amounts.tobytes() if self._amounts is not None else b"")
+
+    @classmethod
+    def unpack(cls, data, offset: int = 0) -> tuple["AmountStatistics", int]:
+        window, alpha, count, mean, m2, next_index = STATISTICS_HEADER.unpack_from(data, offset)
+        offset += STATISTICS_HEADER.size
+        statistics = cls(window or None, alpha or None)
+        if window:
+            statistics._amounts = array("d")
+            statistics._amounts.frombytes(data[offset:offset + 8 * window])
+            offset += 8 * window
+        statistics.count = count
+        statistics.mean = mean
+        statistics._m2 = m2
+        statistics._next = next_index
+        return statistics, offset
+
+    @property
+    def variance(self) -> float:
+        if self.alpha is not None:
+            return self._m2
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def z_score(self, amount: float, min_stddev: float = 0.0) -> float:
+        stddev = max(self.stddev, min_stddev)
+        if not stddev:
+            return 0.0 if amount == self.mean else math.copysign(math.inf, amount - self.mean)
+        return (amount - self.mean) / stddev
+
+    def __repr__(self) -> str:
+        return (f"AmountStatistics(window={self.window}, alpha={self.alpha}, "
+                f"count={self.count}, mean={self.mean:.2f}, stddev={self.stddev:.2f})")
@@ -0,0 +1,27 @@
+from typing import Iterable
+from src.fraud.BloomFilter import BloomFilter
+
+
+class BlacklistScreen:
+    def __init__(self, locations: Iterable[str], error_rate: float = 0.001):
+        self.locations = frozenset(locations)
+        self.bloom = BloomFilter.from_items(self.locations, error_rate)
+        self.screened = 0
+        self.false_positives = 0
+
+    def __contains__(self, location: str) -> bool:
+        # O filtro descarta a maioria das consultas; só os positivos vão para o conjunto exato
+        if location not in self.bloom:
+            self.screened += 1
+            return False
+        if location in self.locations:
+            return True
+        self.false_positives += 1
+        return False
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def __repr__(self) -> str:
+        return (f"BlacklistScreen(locations={len(self.locations)}, "
+                f"screened={self.screened}, false_positives={self.false_positives})")
@@ -0,0 +1,52 @@
+import math
+from typing import Iterable
+from src.fraud.CountMinSketch import key_hashes
+
+
+class BloomFilter:
+    __slots__ = ("capacity", "error_rate", "size", "hash_count", "bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Tamanho ótimo: m = -n ln(p) / ln(2)^2 bits e k = m/n ln(2) funções de hash
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], error_rate: float = 0.001) -> "BloomFilter":
+        items = list(items)
+        bloom = cls(max(1, len(items)), error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str):
+        first, second = key_hashes(item)
+        size = self.size
+        return ((first + index * second) % size for index in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def __repr__(self) -> str:
+        return (f"BloomFilter(capacity={self.capacity}, error_rate={self.error_rate}, "
+                f"size={self.size}, hash_count={self.hash_count})")
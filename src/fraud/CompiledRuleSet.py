@@ -0,0 +1,75 @@
+from typing import Optional, Sequence
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FleetVelocity import FleetVelocity
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.MultiWindowVelocity import MultiWindowVelocity
+from src.fraud.PartitionRules import PartitionRules
+from src.fraud.RuleEvaluator import BlacklistedLocations, RuleEvaluator
+from src.fraud.Transaction import Transaction
+
+
+class CompiledRuleSet:
+    __slots__ = ("evaluator", "velocity", "__weakref__")
+
+    def __init__(
+        self,
+        rules: PartitionRules,
+        amount_rule: Optional[AmountAnomalyRule] = None,
+        fleet_velocity: Optional[FleetVelocity] = None,
+    ):
+        # Os limites são copiados na compilação; mudanças posteriores em `rules` exigem recompilar
+        self.evaluator = RuleEvaluator(rules.large_amount, rules.max_hourly_count, rules.location_change_minutes,
+                                       rules.velocity_rules, amount_rule, fleet_velocity)
+        self.velocity = MultiWindowVelocity(self.evaluator.windows)
+
+    @staticmethod
+    def signature(rules: PartitionRules) -> tuple:
+        # Partições com os mesmos limites compartilham um único conjunto compilado
+        return (rules.large_amount, rules.max_hourly_count, rules.location_change_minutes,
+                tuple([(rule.window_minutes, rule.max_count, rule.max_amount, rule.risk_score, rule.block)
+                       for rule in rules.velocity_rules]))
+
+    def evaluate_batch(
+        self,
+        items: Sequence[tuple[Transaction, list[Transaction]]],
+        blacklisted_locations: BlacklistedLocations,
+    ) -> list[FraudCheckResult]:
+        results: list = [None] * len(items)
+        self.evaluate_into(items, range(len(items)), results, blacklisted_locations)
+        return results
+
+    def evaluate_into(
+        self,
+        items: Sequence[tuple[Transaction, list[Transaction]]],
+        indices: Sequence[int],
+        results: list,
+        blacklisted_locations: BlacklistedLocations,
+    ) -> None:
+        # Avalia só as posições do grupo e grava cada resultado na posição original do lote
+        evaluate = self.evaluator.evaluate
+        amount_rule = self.evaluator.amount_rule
+        extract = self.velocity.extract
+
+        for index in indices:
+            current_transaction, previous_transactions = items[index]
+            statistics = None
+            if amount_rule is not None:
+                statistics = amount_rule.statistics_for(previous_transactions)
+            last_timestamp = last_location = None
+            if previous_transactions:
+                last_transaction = previous_transactions[-1]
+                last_timestamp = last_transaction.timestamp
+                last_location = last_transaction.location
+            results[index] = evaluate(current_transaction, extract(current_transaction, previous_transactions),
+                                      last_timestamp, last_location, statistics, blacklisted_locations)
+
+    def evaluate(
+        self,
+        current_transaction: Transaction,
+        previous_transactions: list[Transaction],
+        blacklisted_locations: BlacklistedLocations,
+    ) -> FraudCheckResult:
+        return self.evaluate_batch([(current_transaction, previous_transactions)], blacklisted_locations)[0]
+
+    def __repr__(self) -> str:
+        return f"CompiledRuleSet(evaluator={self.evaluator})"
@@ -0,0 +1,52 @@
+import math
+from array import array
+
+HASH_MASK = (1 << 64) - 1
+
+
+def key_hashes(key: str) -> tuple[int, int]:
+    # Hashing duplo: h1 + i * h2 gera as posições de todas as linhas.
+    # hash() de str é cacheado pelo interpretador, mas só é estável dentro do mesmo processo
+    return hash(key) & HASH_MASK, hash((key, 0x9E3779B9)) & HASH_MASK | 1
+
+
+class CountMinSketch:
+    __slots__ = ("epsilon", "delta", "width", "depth", "table")
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.epsilon = epsilon
+        self.delta = delta
+        # Estimativa excede o valor real em no máximo epsilon * total com probabilidade 1 - delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = array("I", bytes(4 * self.width * self.depth))
+
+    def positions(self, key: str) -> list[int]:
+        first, second = key_hashes(key)
+        width = self.width
+        positions = []
+        for offset in range(0, width * self.depth, width):
+            positions.append(offset + first % width)
+            first += second
+        return positions
+
+    def add(self, key: str, count: int = 1) -> None:
+        table = self.table
+        for position in self.positions(key):
+            table[position] += count
+
+    def estimate(self, key: str) -> int:
+        table = self.table
+        return min([table[position] for position in self.positions(key)])
+
+    def clear(self) -> None:
+        self.table = array("I", bytes(4 * self.width * self.depth))
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.itemsize * len(self.table)
+
+    def __repr__(self) -> str:
+        return f"CountMinSketch(epsilon={self.epsilon}, delta={self.delta}, width={self.width}, depth={self.depth})"
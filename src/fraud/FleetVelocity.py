@@ -0,0 +1,54 @@
+from typing import Optional
+from src.fraud.Transaction import Transaction
+from src.fraud.WindowedSketch import WindowedSketch
+
+
+class FleetVelocity:
+    def __init__(
+        self,
+        window_minutes: int = 60,
+        max_location_count: Optional[int] = None,
+        max_merchant_count: Optional[int] = None,
+        risk_score: int = 20,
+        bucket_minutes: int = 5,
+        epsilon: float = 0.001,
+        delta: float = 0.01,
+    ):
+        if max_location_count is None and max_merchant_count is None:
+            raise ValueError("A fleet velocity rule needs max_location_count or max_merchant_count")
+        self.window_minutes = window_minutes
+        self.max_location_count = max_location_count
+        self.max_merchant_count = max_merchant_count
+        self.risk_score = risk_score
+        # Contagens de toda a frota em memória fixa, independente do número de locais e lojistas
+        self.locations = WindowedSketch(window_minutes, bucket_minutes, epsilon, delta)
+        self.merchants = WindowedSketch(window_minutes, bucket_minutes, epsilon, delta)
+
+    def location_count(self, transaction: Transaction) -> int:
+        return self.locations.estimate(transaction.location, transaction.timestamp)
+
+    def merchant_count(self, transaction: Transaction) -> int:
+        if transaction.merchant is None:
+            return 0
+        return self.merchants.estimate(transaction.merchant, transaction.timestamp)
+
+    def is_triggered(self, transaction: Transaction) -> bool:
+        return ((self.max_location_count is not None
+                 and self.location_count(transaction) > self.max_location_count)
+                or (self.max_merchant_count is not None
+                    and self.merchant_count(transaction) > self.max_merchant_count))
+
+    def record(self, transaction: Transaction) -> None:
+        self.locations.add(transaction.location, transaction.timestamp)
+        if transaction.merchant is not None:
+            self.merchants.add(transaction.merchant, transaction.timestamp)
+
+    @property
+    def nbytes(self) -> int:
+        return self.locations.nbytes + self.merchants.nbytes
+
+    def __repr__(self) -> str:
+        return (f"FleetVelocity(window_minutes={self.window_minutes}, "
+                f"max_location_count={self.max_location_count}, "
+                f"max_merchant_count={self.max_merchant_count}, "
+                f"risk_score={self.risk_score})")
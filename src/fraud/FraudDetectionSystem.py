@@ -1,48 +1,116 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional
+from src.fraud.AccountState import AccountState
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FleetVelocity import FleetVelocity
 from src.fraud.Transaction import Transaction
 from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.MultiWindowVelocity import MultiWindowVelocity
+from src.fraud.OrderedHistory import OrderedHistory
+from src.fraud.RuleEvaluator import VELOCITY_WINDOW_MINUTES, BlacklistedLocations, RuleEvaluator
+from src.fraud.VelocityRule import VelocityRule
+
+# VELOCITY_WINDOW_MINUTES e BlacklistedLocations continuam importáveis daqui
+__all__ = ["VELOCITY_WINDOW_MINUTES", "BlacklistedLocations", "FraudDetectionSystem"]
+
+# Os armazenamentos (sqlite, mmap, memória compartilhada) só são importados por quem os usa
+if TYPE_CHECKING:
+    from src.fraud.AccountStore import AccountStore
+    from src.fraud.StateSnapshot import StateSnapshot
 
 
 class FraudDetectionSystem:
+    def __init__(
+        self,
+        velocity_rules: Optional[list[VelocityRule]] = None,
+        fleet_velocity: Optional[FleetVelocity] = None,
+        amount_rule: Optional[AmountAnomalyRule] = None,
+    ):
+        self.velocity_rules = velocity_rules or []
+        self.fleet_velocity = fleet_velocity
+        self.amount_rule = amount_rule
+        self.rules = RuleEvaluator(velocity_rules=self.velocity_rules, amount_rule=amount_rule,
+                                   fleet_velocity=fleet_velocity)
+        self.velocity = MultiWindowVelocity(self.rules.windows)
+
+    def new_account_state(self, exact: bool = False) -> AccountState:
+        amount_statistics = self.amount_rule.new_statistics() if self.amount_rule is not None else None
+        return AccountState(self.velocity.windows, exact, amount_statistics)
+
+    def new_account_store(
+        self,
+        path: str = ":memory:",
+        max_accounts: int = 100000,
+        max_idle: Optional[timedelta] = None,
+        exact: bool = False,
+        snapshot: Optional["StateSnapshot"] = None,
+    ) -> "AccountStore":
+        from src.fraud.AccountStore import AccountStore
+
+        return AccountStore(lambda: self.new_account_state(exact), path, max_accounts, max_idle, snapshot)
+
+    def new_ordered_history(self, allowed_lateness: timedelta = timedelta(minutes=5)) -> OrderedHistory:
+        retention = timedelta(minutes=max(self.velocity.windows))
+        min_events = 0
+        if self.amount_rule is not None:
+            if self.amount_rule.alpha is not None:
+                retention = None
+            else:
+                min_events = self.amount_rule.window
+        return OrderedHistory(allowed_lateness, retention, min_events)
+
     def check_for_fraud(
         self,
         current_transaction: Transaction,
         previous_transactions: list[Transaction],
-        blacklisted_locations: list[str],
+        blacklisted_locations: BlacklistedLocations,
     ) -> FraudCheckResult:
-
-        is_fraudulent = False
-        is_blocked = False
-        verification_required = False
-        risk_score = 0
-
-        if current_transaction.amount > 10000:
-            is_fraudulent = True
-            verification_required = True
-            risk_score += 50
-
-        recent_transaction_count = 0
-        for transaction in previous_transactions:
-            time_difference = current_transaction.timestamp - transaction.timestamp
-            time_diff_minutes = time_difference.total_seconds() / 60
-            if time_diff_minutes <= 60:
-                recent_transaction_count += 1
-        
-        if recent_transaction_count > 10:
-            is_blocked = True
-            risk_score += 30
-
+        statistics = None
+        if self.amount_rule is not None:
+            statistics = self.amount_rule.statistics_for(previous_transactions)
+        last_timestamp = last_location = None
         if previous_transactions:
             last_transaction = previous_transactions[-1]
-            time_since_last = current_transaction.timestamp - last_transaction.timestamp
-            minutes_since_last = time_since_last.total_seconds() / 60
-            
-            if minutes_since_last < 30 and last_transaction.location != current_transaction.location:
-                is_fraudulent = True
-                verification_required = True
-                risk_score += 20
-
-        if current_transaction.location in blacklisted_locations:
-            is_blocked = True
-            risk_score = 100
-
-        return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score)
+            last_timestamp = last_transaction.timestamp
+            last_location = last_transaction.location
+
+        velocity = self.velocity.extract(current_transaction, previous_transactions)
+        return self.rules.evaluate(current_transaction, velocity, last_timestamp, last_location, statistics,
+                                   blacklisted_locations)
+
+    def check_account(
+        self,
+        current_transaction: Transaction,
+        account_state: AccountState,
+        blacklisted_locations: BlacklistedLocations,
+    ) -> FraudCheckResult:
+        # Contadores por conta substituem a varredura do histórico completo
+        velocity = account_state.velocity_features(current_transaction.timestamp)
+        result = self.rules.evaluate(current_transaction, velocity, account_state.last_timestamp,
+                                     account_state.last_location, account_state.amount_statistics,
+                                     blacklisted_locations)
+        account_state.record(current_transaction)
+        return result
+
+    def check_ordered(
+        self,
+        current_transaction: Transaction,
+        history: OrderedHistory,
+        blacklisted_locations: BlacklistedLocations,
+    ) -> Optional[FraudCheckResult]:
+        # Eventos atrasados são avaliados contra os anteriores no horário do evento, não na chegada
+        index = history.insert(current_transaction)
+        if index is None:
+            return None
+        return self.check_for_fraud(current_transaction, history.before(index), blacklisted_locations)
+
+    def check_stored(
+        self,
+        account_id: str,
+        current_transaction: Transaction,
+        store: "AccountStore",
+        blacklisted_locations: BlacklistedLocations,
+    ) -> FraudCheckResult:
+        result = self.check_account(current_transaction, store.get(account_id), blacklisted_locations)
+        store.evict_idle(current_transaction.timestamp)
+        return result
@@ -0,0 +1,36 @@
+from typing import Iterable
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityFeatures import VelocityFeatures
+
+
+class MultiWindowVelocity:
+    def __init__(self, windows: Iterable[int] = (5, 60, 1440)):
+        self.windows = tuple(sorted(set(windows)))
+        if not self.windows:
+            raise ValueError("At least one window is required")
+
+    def extract(self, current_transaction: Transaction, previous_transactions: list[Transaction]) -> VelocityFeatures:
+        windows = self.windows
+        # Cada transação cai na menor janela que a contém; as maiores são obtidas por soma acumulada
+        counts = [0] * len(windows)
+        amounts = [0.0] * len(windows)
+        current_timestamp = current_transaction.timestamp
+
+        for transaction in previous_transactions:
+            time_diff_minutes = (current_timestamp - transaction.timestamp).total_seconds() / 60
+            for index, window in enumerate(windows):
+                if time_diff_minutes <= window:
+                    counts[index] += 1
+                    amounts[index] += transaction.amount
+                    break
+
+        count_by_window = {}
+        amount_by_window = {}
+        running_count = 0
+        running_amount = 0.0
+        for index, window in enumerate(windows):
+            running_count += counts[index]
+            running_amount += amounts[index]
+            count_by_window[window] = running_count
+            amount_by_window[window] = running_amount
+        return VelocityFeatures(count_by_window, amount_by_window)
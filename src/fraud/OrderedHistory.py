@@ -0,0 +1,71 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Optional
+from src.fraud.Transaction import Transaction
+
+
+class OrderedHistory:
+    def __init__(
+        self,
+        allowed_lateness: timedelta = timedelta(minutes=5),
+        retention: Optional[timedelta] = timedelta(minutes=60),
+        min_events: int = 0,
+    ):
+        self.allowed_lateness = allowed_lateness
+        self.retention = retention
+        self.min_events = min_events
+        # Transações ordenadas por horário do evento, com os horários em paralelo para o bisect
+        self.transactions: list[Transaction] = []
+        self._timestamps: list[datetime] = []
+        self.max_timestamp: Optional[datetime] = None
+        self.late_events = 0
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        if self.max_timestamp is None:
+            return None
+        return self.max_timestamp - self.allowed_lateness
+
+    def insert(self, transaction: Transaction) -> Optional[int]:
+        timestamp = transaction.timestamp
+        watermark = self.watermark
+        if watermark is not None and timestamp < watermark:
+            self.late_events += 1
+            return None
+
+        # Empates ficam depois dos eventos que chegaram antes
+        index = bisect_right(self._timestamps, timestamp)
+        self._timestamps.insert(index, timestamp)
+        self.transactions.insert(index, transaction)
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+            index -= self._prune()
+        return index
+
+    def before(self, index: int) -> list[Transaction]:
+        # Só o trecho que as regras enxergam: a retenção em tempo e ao menos min_events eventos
+        if self.retention is None or not index:
+            return self.transactions[:index]
+        start = bisect_left(self._timestamps, self._timestamps[index] - self.retention, 0, index)
+        start = min(start, max(0, index - self.min_events))
+        return self.transactions[start:index]
+
+    def _prune(self) -> int:
+        if self.retention is None:
+            return 0
+        # Nenhum evento aceito daqui em diante precisa de horários anteriores a watermark - retenção
+        expired = bisect_left(self._timestamps, self.watermark - self.retention)
+        expired = min(expired, len(self._timestamps) - self.min_events)
+        if expired <= 0:
+            return 0
+        del self._timestamps[:expired]
+        del self.transactions[:expired]
+        return expired
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def __repr__(self) -> str:
+        return (f"OrderedHistory(transactions={len(self.transactions)}, "
+                f"watermark='{self.watermark}', "
+                f"late_events={self.late_events})")
@@ -0,0 +1,22 @@
+from typing import Optional
+from src.fraud.VelocityRule import VelocityRule
+
+
+class PartitionRules:
+    def __init__(
+        self,
+        large_amount: float = 10000,
+        max_hourly_count: int = 10,
+        location_change_minutes: float = 30,
+        velocity_rules: Optional[list[VelocityRule]] = None,
+    ):
+        self.large_amount = large_amount
+        self.max_hourly_count = max_hourly_count
+        self.location_change_minutes = location_change_minutes
+        self.velocity_rules = velocity_rules or []
+
+    def __repr__(self) -> str:
+        return (f"PartitionRules(large_amount={self.large_amount}, "
+                f"max_hourly_count={self.max_hourly_count}, "
+                f"location_change_minutes={self.location_change_minutes}, "
+                f"velocity_rules={self.velocity_rules})")
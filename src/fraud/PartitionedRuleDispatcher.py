@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from operator import attrgetter
+from weakref import WeakValueDictionary
+from typing import Hashable, Optional, Sequence
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.CompiledRuleSet import CompiledRuleSet
+from src.fraud.FleetVelocity import FleetVelocity
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.PartitionRules import PartitionRules
+from src.fraud.RuleEvaluator import BlacklistedLocations
+from src.fraud.Transaction import Transaction
+
+MAX_COMPILED_RULE_SETS = 16384
+
+
+class PartitionedRuleDispatcher:
+    def __init__(
+        self,
+        rules: Optional[dict[Hashable, PartitionRules]] = None,
+        default_rules: Optional[PartitionRules] = None,
+        partition_by: str = "merchant",
+        max_compiled: int = MAX_COMPILED_RULE_SETS,
+        amount_rule: Optional[AmountAnomalyRule] = None,
+        fleet_velocity: Optional[FleetVelocity] = None,
+    ):
+        if partition_by not in ("merchant", "channel"):
+            raise ValueError("partition_by must be 'merchant' or 'channel'")
+        if max_compiled <= 0:
+            raise ValueError("max_compiled must be positive")
+        self.rules = rules if rules is not None else {}
+        self.default_rules = default_rules or PartitionRules()
+        self.partition_by = partition_by
+        self.max_compiled = max_compiled
+        # Regras de toda a frota: valem para todas as partições, como em FraudDetectionSystem
+        self.amount_rule = amount_rule
+        self.fleet_velocity = fleet_velocity
+        self.compilations = 0
+        self.evictions = 0
+        self._partition_key = attrgetter(partition_by)
+        # (assinatura, conjunto compilado) por partição, do menos para o mais recentemente usado
+        self._compiled: OrderedDict[Hashable, tuple[tuple, CompiledRuleSet]] = OrderedDict()
+        # Conjuntos compilados por assinatura de limites; somem quando nenhuma partição em cache os usa
+        self._by_signature: WeakValueDictionary = WeakValueDictionary()
+        self._default: Optional[tuple[tuple, CompiledRuleSet]] = None
+
+    def set_rules(self, partition: Hashable, rules: PartitionRules) -> None:
+        self.rules[partition] = rules
+        self._compiled.pop(partition, None)
+
+    def _compile(self, signature: tuple, rules: PartitionRules) -> CompiledRuleSet:
+        compiled = self._by_signature.get(signature)
+        if compiled is None:
+            compiled = self._by_signature[signature] = CompiledRuleSet(rules, self.amount_rule, self.fleet_velocity)
+            self.compilations += 1
+        return compiled
+
+    def rule_set(self, partition: Hashable) -> CompiledRuleSet:
+        # A assinatura é recalculada a cada consulta: regras alteradas no lugar, sem set_rules, são recompiladas
+        rules = self.rules.get(partition)
+        if rules is None:
+            # Partições sem regras próprias compartilham o conjunto padrão e não ocupam o cache
+            self._compiled.pop(partition, None)
+            signature = CompiledRuleSet.signature(self.default_rules)
+            if self._default is None or self._default[0] != signature:
+                self._default = (signature, self._compile(signature, self.default_rules))
+            return self._default[1]
+        signature = CompiledRuleSet.signature(rules)
+        cached = self._compiled.get(partition)
+        if cached is not None and cached[0] == signature:
+            self._compiled.move_to_end(partition)
+            return cached[1]
+        compiled = self._compile(signature, rules)
+        self._compiled[partition] = (signature, compiled)
+        self._compiled.move_to_end(partition)
+        if len(self._compiled) > self.max_compiled:
+            self._compiled.popitem(last=False)
+            self.evictions += 1
+        return compiled
+
+    def check_batch(
+        self,
+        items: Sequence[tuple[Transaction, list[Transaction]]],
+        blacklisted_locations: BlacklistedLocations,
+    ) -> list[FraudCheckResult]:
+        # Cada partição é resolvida (e sua assinatura conferida) uma vez por lote
+        partition_key = self._partition_key
+        resolved: dict[Hashable, CompiledRuleSet] = {}
+        compiled_sets = []
+        for transaction, _ in items:
+            partition = partition_key(transaction)
+            compiled = resolved.get(partition)
+            if compiled is None:
+                compiled = resolved[partition] = self.rule_set(partition)
+            compiled_sets.append(compiled)
+
+        results: list[Optional[FraudCheckResult]] = [None] * len(items)
+        if self.fleet_velocity is not None:
+            # A contagem da frota depende da ordem: avalia na ordem original, em trechos da mesma partição
+            start = 0
+            for index in range(1, len(items) + 1):
+                if index == len(items) or compiled_sets[index] is not compiled_sets[start]:
+                    compiled_sets[start].evaluate_into(items, range(start, index), results, blacklisted_locations)
+                    start = index
+            return results
+
+        # Agrupa pelo conjunto compilado da partição: partições com os mesmos limites são avaliadas juntas
+        groups: dict[int, tuple[CompiledRuleSet, list[int]]] = {}
+        for index, compiled in enumerate(compiled_sets):
+            group = groups.get(id(compiled))
+            if group is None:
+                groups[id(compiled)] = (compiled, [index])
+            else:
+                group[1].append(index)
+        for compiled, indices in groups.values():
+            compiled.evaluate_into(items, indices, results, blacklisted_locations)
+        return results
+
+    def check(
+        self,
+        current_transaction: Transaction,
+        previous_transactions: list[Transaction],
+        blacklisted_locations: BlacklistedLocations,
+    ) -> FraudCheckResult:
+        return self.rule_set(self._partition_key(current_transaction)).evaluate(
+            current_transaction, previous_transactions, blacklisted_locations)
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def __repr__(self) -> str:
+        return (f"PartitionedRuleDispatcher(partition_by='{self.partition_by}', "
+                f"partitions={len(self.rules)}, "
+                f"compiled={len(self._compiled)}, "
+                f"evictions={self.evictions})")
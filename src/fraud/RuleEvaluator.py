@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.AmountStatistics import AmountStatistics
+from src.fraud.BlacklistScreen import BlacklistScreen
+from src.fraud.FleetVelocity import FleetVelocity
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityFeatures import VelocityFeatures
+from src.fraud.VelocityRule import VelocityRule
+
+if TYPE_CHECKING:
+    from src.fraud.SharedBlacklist import SharedBlacklist
+
+VELOCITY_WINDOW_MINUTES = 60
+
+# Qualquer contêiner com `in`: lista, pré-filtro Bloom ou tabela em memória compartilhada
+BlacklistedLocations = Union[list[str], BlacklistScreen, "SharedBlacklist"]
+
+
+class RuleEvaluator:
+    __slots__ = ("large_amount", "max_hourly_count", "location_change_minutes", "velocity_rules", "amount_rule",
+                 "fleet_velocity")
+
+    def __init__(
+        self,
+        large_amount: float = 10000,
+        max_hourly_count: int = 10,
+        location_change_minutes: float = 30,
+        velocity_rules: Iterable[VelocityRule] = (),
+        amount_rule: Optional[AmountAnomalyRule] = None,
+        fleet_velocity: Optional[FleetVelocity] = None,
+    ):
+        self.large_amount = large_amount
+        self.max_hourly_count = max_hourly_count
+        self.location_change_minutes = location_change_minutes
+        # Regras de velocidade achatadas em tuplas: sem consultas de atributo por transação
+        self.velocity_rules = tuple(
+            (rule.window_minutes, rule.max_count, rule.max_amount, rule.risk_score, rule.block)
+            for rule in velocity_rules
+        )
+        self.amount_rule = amount_rule
+        self.fleet_velocity = fleet_velocity
+
+    @property
+    def windows(self) -> list[int]:
+        return [VELOCITY_WINDOW_MINUTES] + [window for window, *_ in self.velocity_rules]
+
+    def evaluate(
+        self,
+        current_transaction: Transaction,
+        velocity: VelocityFeatures,
+        last_timestamp: Optional[datetime],
+        last_location: Optional[str],
+        amount_statistics: Optional[AmountStatistics],
+        blacklisted_locations: BlacklistedLocations,
+    ) -> FraudCheckResult:
+        # Corpo único das regras: o histórico completo, o estado por conta e as partições só mudam
+        # a forma de obter a velocidade, a última transação e as estatísticas de valores
+        is_fraudulent = False
+        is_blocked = False
+        verification_required = False
+        risk_score = 0
+
+        if current_transaction.amount > self.large_amount:
+            is_fraudulent = True
+            verification_required = True
+            risk_score += 50
+
+        amount_rule = self.amount_rule
+        if amount_rule is not None and amount_statistics is not None:
+            if amount_rule.is_triggered(amount_statistics, current_transaction.amount):
+                verification_required = True
+                risk_score += amount_rule.risk_score
+
+        counts = velocity.counts
+        if counts[VELOCITY_WINDOW_MINUTES] > self.max_hourly_count:
+            is_blocked = True
+            risk_score += 30
+
+        for window, max_count, max_amount, rule_score, block in self.velocity_rules:
+            if ((max_count is not None and counts[window] > max_count)
+                    or (max_amount is not None and velocity.amounts[window] > max_amount)):
+                verification_required = True
+                risk_score += rule_score
+                if block:
+                    is_blocked = True
+
+        fleet_velocity = self.fleet_velocity
+        if fleet_velocity is not None:
+            if fleet_velocity.is_triggered(current_transaction):
+                verification_required = True
+                risk_score += fleet_velocity.risk_score
+            fleet_velocity.record(current_transaction)
+
+        if last_timestamp is not None:
+            minutes_since_last = (current_transaction.timestamp - last_timestamp).total_seconds() / 60
+            if minutes_since_last < self.location_change_minutes and last_location != current_transaction.location:
+                is_fraudulent = True
+                verification_required = True
+                risk_score += 20
+
+        if current_transaction.location in blacklisted_locations:
+            is_blocked = True
+            risk_score = 100
+
+        return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score)
+
+    def __repr__(self) -> str:
+        return (f"RuleEvaluator(large_amount={self.large_amount}, "
+                f"max_hourly_count={self.max_hourly_count}, "
+                f"location_change_minutes={self.location_change_minutes}, "
+                f"velocity_rules={len(self.velocity_rules)}, "
+                f"amount_rule={self.amount_rule is not None}, "
+                f"fleet_velocity={self.fleet_velocity is not None})")
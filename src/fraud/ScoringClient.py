@@ -0,0 +1,69 @@
+import asyncio
+import itertools
+from typing import Optional
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.ScoringProtocol import FRAME_HEADER, decode_response, encode_request
+from src.fraud.Transaction import Transaction
+
+
+class ScoringClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        # Pedidos em voo por id: as respostas podem chegar fora de ordem entre shards
+        self._pending: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0) -> "ScoringClient":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def score(self, account_id: str, transaction: Transaction) -> FraudCheckResult:
+        request_id = next(self._ids) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(encode_request(request_id, account_id, transaction))
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self) -> None:
+        error: Exception = ConnectionError("Scoring server closed the connection")
+        try:
+            while True:
+                header = await self._reader.readexactly(FRAME_HEADER.size)
+                payload = await self._reader.readexactly(FRAME_HEADER.unpack(header)[0])
+                request_id, result = decode_response(payload)
+                future = self._pending.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if result is None:
+                    future.set_exception(ValueError(f"Scoring server rejected request {request_id}"))
+                else:
+                    future.set_result(result)
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            error = ConnectionError(str(exc) or "Scoring server closed the connection")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"ScoringClient(pending={len(self._pending)})"
@@ -0,0 +1,84 @@
+import struct
+from typing import Optional
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityCounter import from_micros, to_micros
+
+# Cada quadro: tamanho do payload (uint32) seguido do payload
+FRAME_HEADER = struct.Struct("<I")
+# Requisição: id, valor, horário em microssegundos e tamanhos de conta, local e lojista (0xFFFF = sem lojista)
+REQUEST_HEADER = struct.Struct("<IdqHHH")
+# Resposta: id, flags (fraudulenta, bloqueada, verificação) e pontuação de risco
+RESPONSE = struct.Struct("<IBh")
+NO_MERCHANT = 0xFFFF
+MAX_FRAME_SIZE = 1 << 20
+
+FRAUDULENT = 1
+BLOCKED = 2
+VERIFICATION_REQUIRED = 4
+# Pedido malformado ou que falhou ao ser avaliado: a resposta não traz decisão
+ERROR = 8
+
+
+def encode_request(request_id: int, account_id: str, transaction: Transaction) -> bytes:
+    account = account_id.encode()
+    location = transaction.location.encode()
+    merchant = transaction.merchant.encode() if transaction.merchant is not None else b""
+    header = REQUEST_HEADER.pack(request_id, transaction.amount, to_micros(transaction.timestamp), len(account),
+                                 len(location), NO_MERCHANT if transaction.merchant is None else len(merchant))
+    payload = b"".join((header, account, location, merchant))
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def check_request(payload) -> tuple[int, float, int, int, int, int]:
+    # Só cabeçalho e tamanhos: barato o bastante para o loop de eventos, antes de escolher o shard
+    if len(payload) < REQUEST_HEADER.size:
+        raise ValueError("Request payload is shorter than its header")
+    header = REQUEST_HEADER.unpack_from(payload)
+    account_size, location_size, merchant_size = header[3:]
+    strings_size = account_size + location_size + (0 if merchant_size == NO_MERCHANT else merchant_size)
+    if len(payload) != REQUEST_HEADER.size + strings_size:
+        raise ValueError("Request payload size does not match its header")
+    return header
+
+
+def decode_request(payload) -> tuple[int, str, Transaction]:
+    # Pedidos malformados (curtos, com tamanhos inconsistentes, UTF-8 inválido ou horário fora do intervalo)
+    # levantam ValueError
+    request_id, amount, timestamp, account_size, location_size, merchant_size = check_request(payload)
+    offset = REQUEST_HEADER.size
+    try:
+        account_id = bytes(payload[offset:offset + account_size]).decode()
+        offset += account_size
+        location = bytes(payload[offset:offset + location_size]).decode()
+        offset += location_size
+        merchant: Optional[str] = None
+        if merchant_size != NO_MERCHANT:
+            merchant = bytes(payload[offset:offset + merchant_size]).decode()
+        return request_id, account_id, Transaction(amount, from_micros(timestamp), location, merchant)
+    except (OverflowError, struct.error) as error:
+        raise ValueError("Malformed request payload") from error
+
+
+def request_id_of(payload) -> int:
+    # Melhor esforço para responder a um pedido malformado: 0 se nem o id cabe no payload
+    return int.from_bytes(payload[:4], "little") if len(payload) >= 4 else 0
+
+
+def encode_error(request_id: int) -> bytes:
+    return FRAME_HEADER.pack(RESPONSE.size) + RESPONSE.pack(request_id, ERROR, 0)
+
+
+def encode_response(request_id: int, result: FraudCheckResult) -> bytes:
+    flags = ((FRAUDULENT if result.is_fraudulent else 0)
+             | (BLOCKED if result.is_blocked else 0)
+             | (VERIFICATION_REQUIRED if result.verification_required else 0))
+    return FRAME_HEADER.pack(RESPONSE.size) + RESPONSE.pack(request_id, flags, result.risk_score)
+
+
+def decode_response(payload) -> tuple[int, Optional[FraudCheckResult]]:
+    request_id, flags, risk_score = RESPONSE.unpack_from(payload)
+    if flags & ERROR:
+        return request_id, None
+    return request_id, FraudCheckResult(bool(flags & FRAUDULENT), bool(flags & BLOCKED),
+                                        bool(flags & VERIFICATION_REQUIRED), risk_score)
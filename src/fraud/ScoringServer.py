@@ -0,0 +1,209 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional, Union
+from src.fraud.AccountStore import AccountStore
+from src.fraud.FraudDetectionSystem import BlacklistedLocations, FraudDetectionSystem
+from src.fraud.ScoringProtocol import (FRAME_HEADER, MAX_FRAME_SIZE, REQUEST_HEADER, check_request, decode_request,
+                                       encode_error, encode_response, request_id_of)
+
+
+def _score(fraud_system: FraudDetectionSystem, store: AccountStore, blacklisted_locations: BlacklistedLocations,
+           payload: bytes) -> bytes:
+    try:
+        request_id, account_id, transaction = decode_request(payload)
+    except ValueError:
+        return encode_error(request_id_of(payload))
+    try:
+        result = fraud_system.check_stored(account_id, transaction, store, blacklisted_locations)
+    except Exception:
+        # Uma falha ao avaliar um pedido vira resposta de erro: o shard e os pedidos seguintes continuam
+        return encode_error(request_id)
+    return encode_response(request_id, result)
+
+
+def _scoring_worker(connection, fraud_system: FraudDetectionSystem, blacklisted_locations: BlacklistedLocations,
+                    max_accounts: int, max_idle: Optional[timedelta]) -> None:
+    # Cada worker é o único dono do estado das contas do seu shard
+    store = fraud_system.new_account_store(max_accounts=max_accounts, max_idle=max_idle)
+    try:
+        while True:
+            batch = connection.recv()
+            if batch is None:
+                break
+            connection.send([(tag, _score(fraud_system, store, blacklisted_locations, payload))
+                             for tag, payload in batch])
+    finally:
+        connection.close()
+
+
+def shard_for(payload: bytes, shards: int) -> int:
+    account_size = REQUEST_HEADER.unpack_from(payload)[3]
+    return zlib.crc32(payload[REQUEST_HEADER.size:REQUEST_HEADER.size + account_size]) % shards
+
+
+class ScoringServer:
+    def __init__(
+        self,
+        fraud_system: FraudDetectionSystem,
+        blacklisted_locations: Optional[BlacklistedLocations] = None,
+        workers: int = 2,
+        max_accounts: int = 100000,
+        max_idle: Optional[timedelta] = None,
+    ):
+        if workers < 0:
+            raise ValueError("workers must not be negative")
+        self.fraud_system = fraud_system
+        self.blacklisted_locations = blacklisted_locations if blacklisted_locations is not None else []
+        self.workers = workers
+        self.max_accounts = max_accounts
+        self.max_idle = max_idle
+        self.address: Optional[Union[str, tuple]] = None
+        self.requests = 0
+        self._server = None
+        self._path: Optional[str] = None
+        self._writers: dict[int, asyncio.StreamWriter] = {}
+        self._tags = itertools.count()
+        self._connections = []
+        self._senders = []
+        self._processes = []
+        self._threads = []
+        self._store: Optional[AccountStore] = None
+
+    async def start(self, path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0):
+        loop = asyncio.get_running_loop()
+        if self.workers:
+            for _ in range(self.workers):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_scoring_worker,
+                    args=(child, self.fraud_system, self.blacklisted_locations, self.max_accounts, self.max_idle),
+                    daemon=True)
+                process.start()
+                child.close()
+                # Uma thread por shard drena as respostas para que o envio de lotes nunca trave
+                thread = threading.Thread(target=self._read_responses, args=(parent, loop), daemon=True)
+                thread.start()
+                self._connections.append(parent)
+                # Envio bloqueante fora do loop; uma única thread por shard preserva a ordem dos lotes
+                self._senders.append(ThreadPoolExecutor(max_workers=1))
+                self._processes.append(process)
+                self._threads.append(thread)
+        else:
+            self._store = self.fraud_system.new_account_store(max_accounts=self.max_accounts, max_idle=self.max_idle)
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=path)
+            self._path = self.address = path
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        tag = next(self._tags)
+        self._writers[tag] = writer
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = await reader.read(1 << 16)
+                if not chunk:
+                    break
+                buffer += chunk
+                # Vários quadros por leitura: os pedidos em pipeline são despachados em lote
+                offset = 0
+                batches = [[] for _ in self._connections]
+                while len(buffer) - offset >= FRAME_HEADER.size:
+                    size = FRAME_HEADER.unpack_from(buffer, offset)[0]
+                    if size > MAX_FRAME_SIZE:
+                        raise ValueError(f"Frame of {size} bytes exceeds the limit")
+                    end = offset + FRAME_HEADER.size + size
+                    if end > len(buffer):
+                        break
+                    payload = bytes(buffer[offset + FRAME_HEADER.size:end])
+                    offset = end
+                    self.requests += 1
+                    if self._store is not None:
+                        writer.write(_score(self.fraud_system, self._store, self.blacklisted_locations, payload))
+                        continue
+                    # Cabeçalhos inválidos são respondidos aqui; a decodificação completa fica com o shard
+                    try:
+                        check_request(payload)
+                    except ValueError:
+                        writer.write(encode_error(request_id_of(payload)))
+                        continue
+                    batches[shard_for(payload, len(batches))].append((tag, payload))
+                del buffer[:offset]
+                sends = [loop.run_in_executor(sender, connection.send, batch)
+                         for connection, sender, batch in zip(self._connections, self._senders, batches) if batch]
+                if sends:
+                    await asyncio.gather(*sends)
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._writers.pop(tag, None)
+            writer.close()
+
+    def _read_responses(self, connection, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            try:
+                responses = connection.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                loop.call_soon_threadsafe(self._deliver, responses)
+            except RuntimeError:
+                return
+
+    def _deliver(self, responses: list[tuple[int, bytes]]) -> None:
+        for tag, response in responses:
+            writer = self._writers.get(tag)
+            if writer is not None and not writer.is_closing():
+                writer.write(response)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        loop = asyncio.get_running_loop()
+        for connection, sender in zip(self._connections, self._senders):
+            try:
+                await loop.run_in_executor(sender, connection.send, None)
+            except (BrokenPipeError, OSError):
+                pass
+            sender.shutdown()
+        for process in self._processes:
+            process.join()
+        for thread in self._threads:
+            thread.join()
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._senders = []
+        self._processes = []
+        self._threads = []
+        if self._path is not None and os.path.exists(self._path):
+            os.remove(self._path)
+            self._path = None
+
+    async def __aenter__(self) -> "ScoringServer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return (f"ScoringServer(address={self.address!r}, "
+                f"workers={self.workers}, "
+                f"requests={self.requests})")
@@ -0,0 +1,199 @@
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from hashlib import blake2b
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, Iterator, Optional
+
+TABLE_MAGIC = b"FRBL"
+TABLE_HEADER = struct.Struct("<4sIQQ")
+CONTROL_SIZE = 8
+
+
+def stable_hash(key: bytes) -> int:
+    # Diferente de hash(), é igual em todos os processos, inclusive com spawn
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+def open_segment(name: str, create: bool = False, size: int = 0, track: bool = True) -> shared_memory.SharedMemory:
+    # Até o 3.12 todo processo que abre um segmento o registra no próprio resource_tracker, que o remove
+    # quando o processo termina; leitores não podem ser donos dos segmentos da blacklist
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=track)
+    memory = shared_memory.SharedMemory(name=name, create=create, size=size)
+    if not track:
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+def unlink_segment(memory: shared_memory.SharedMemory) -> None:
+    if sys.version_info < (3, 13):
+        # unlink() sempre cancela o registro: registra antes para que o par feche mesmo sem rastreamento
+        resource_tracker.register(memory._name, "shared_memory")
+    memory.unlink()
+
+
+def build_table(locations: Iterable[str]) -> bytes:
+    keys = sorted({location.encode() for location in locations})
+    slot_count = 8
+    while slot_count < 2 * len(keys):
+        slot_count *= 2
+    mask = slot_count - 1
+    hashes = array("Q", bytes(8 * slot_count))
+    # Referência da chave: deslocamento << 32 | tamanho; 0 marca slot vazio (a área de chaves começa em 1)
+    references = array("Q", bytes(8 * slot_count))
+    blob = bytearray(b"\x00")
+    for key in keys:
+        key_hash = stable_hash(key)
+        slot = key_hash & mask
+        while references[slot]:
+            slot = (slot + 1) & mask
+        hashes[slot] = key_hash
+        references[slot] = len(blob) << 32 | len(key)
+        blob += key
+    keys_offset = TABLE_HEADER.size + 16 * slot_count
+    header = TABLE_HEADER.pack(TABLE_MAGIC, slot_count, len(keys), keys_offset)
+    return header + hashes.tobytes() + references.tobytes() + bytes(blob)
+
+
+class SharedBlacklist:
+    def __init__(self, name: str, create: bool = False, locations: Iterable[str] = ()):
+        self.name = name
+        self.owner = create
+        # Segmento de controle com o número da geração atual; cada geração tem seu próprio segmento
+        self._control = open_segment(name, create, CONTROL_SIZE, track=create)
+        self._pointer = self._control.buf.cast("Q")
+        self._generation = 0
+        self._pinned = 0
+        self._memory: Optional[shared_memory.SharedMemory] = None
+        self._view = None
+        if create:
+            self._pointer[0] = 0
+            self.publish(locations)
+        else:
+            self._refresh()
+
+    @property
+    def generation(self) -> int:
+        return self._pointer[0]
+
+    def publish(self, locations: Iterable[str]) -> int:
+        if not self.owner:
+            raise PermissionError("Only the process that created the blacklist can publish")
+        table = build_table(locations)
+        previous = self._pointer[0]
+        generation = previous + 1
+        memory = open_segment(self._segment_name(generation), create=True, size=len(table))
+        memory.buf[:len(table)] = table
+        memory.close()
+        # Troca atômica: leitores passam a ver a nova geração na próxima consulta
+        self._pointer[0] = generation
+        self._refresh()
+        if previous:
+            # Leitores que ainda mapeiam a geração anterior continuam válidos após o unlink
+            self._unlink_segment(previous)
+        return generation
+
+    @contextmanager
+    def pinned(self) -> Iterator[int]:
+        # Todas as consultas dentro do bloco leem a mesma geração, mesmo que o dono publique outra
+        if self._pointer[0] != self._generation:
+            self._refresh()
+        self._pinned += 1
+        try:
+            yield self._generation
+        finally:
+            self._pinned -= 1
+
+    def __contains__(self, location: str) -> bool:
+        if self._pointer[0] != self._generation and not self._pinned:
+            self._refresh()
+        key = location.encode()
+        key_hash = stable_hash(key)
+        view = self._view
+        slot = key_hash & self._mask
+        while True:
+            reference = self._references[slot]
+            if not reference:
+                return False
+            if self._hashes[slot] == key_hash:
+                start = self._keys_offset + (reference >> 32)
+                if view[start:start + (reference & 0xFFFFFFFF)] == key:
+                    return True
+            slot = (slot + 1) & self._mask
+
+    def __len__(self) -> int:
+        if self._pointer[0] != self._generation and not self._pinned:
+            self._refresh()
+        return self._count
+
+    def _refresh(self) -> None:
+        while True:
+            generation = self._pointer[0]
+            try:
+                memory = open_segment(self._segment_name(generation), track=self.owner)
+            except FileNotFoundError:
+                # O dono já publicou outra geração e removeu esta; relê o ponteiro
+                if self._pointer[0] == generation:
+                    raise
+                continue
+            break
+        magic, slot_count, count, keys_offset = TABLE_HEADER.unpack_from(memory.buf)
+        if magic != TABLE_MAGIC:
+            memory.close()
+            raise ValueError(f"Segment {memory.name} is not a shared blacklist table")
+        self._release()
+        self._memory = memory
+        self._view = memory.buf
+        hashes_offset = TABLE_HEADER.size
+        references_offset = hashes_offset + 8 * slot_count
+        self._hashes = self._view[hashes_offset:references_offset].cast("Q")
+        self._references = self._view[references_offset:keys_offset].cast("Q")
+        self._mask = slot_count - 1
+        self._count = count
+        self._keys_offset = keys_offset
+        self._generation = generation
+
+    def _release(self) -> None:
+        if self._memory is None:
+            return
+        self._hashes.release()
+        self._references.release()
+        self._view = None
+        self._memory.close()
+        self._memory = None
+
+    def _segment_name(self, generation: int) -> str:
+        return f"{self.name}_{generation}"
+
+    def _unlink_segment(self, generation: int) -> None:
+        try:
+            memory = open_segment(self._segment_name(generation), track=False)
+        except FileNotFoundError:
+            return
+        memory.close()
+        unlink_segment(memory)
+
+    def close(self) -> None:
+        self._release()
+        if self._pointer is not None:
+            self._pointer.release()
+            self._pointer = None
+            self._control.close()
+
+    def unlink(self) -> None:
+        generation = self._generation
+        self._release()
+        self._unlink_segment(generation)
+        unlink_segment(self._control)
+        self.close()
+
+    def __reduce__(self):
+        # Ao ser enviado para outro processo, reabre os segmentos pelo nome em vez de copiar a tabela
+        return SharedBlacklist, (self.name,)
+
+    def __repr__(self) -> str:
+        return (f"SharedBlacklist(name='{self.name}', "
+                f"generation={self._generation}, "
+                f"locations={self._count if self._memory is not None else 0})")
@@ -0,0 +1,109 @@
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterable, Iterator, Optional
+from src.fraud.AccountState import AccountState
+
+SNAPSHOT_MAGIC = b"FRSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sIQQQQ")
+
+
+def write_snapshot(path: str, accounts: Iterable[tuple[str, bytes]], log_offset: int) -> int:
+    # accounts: pares (conta, estado serializado) em ordem crescente de conta
+    key_offsets = array("Q", [0])
+    record_offsets = array("Q", [SNAPSHOT_HEADER.size])
+    keys = bytearray()
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as snapshot_file:
+        snapshot_file.write(bytes(SNAPSHOT_HEADER.size))
+        for account_id, state in accounts:
+            keys += account_id.encode()
+            key_offsets.append(len(keys))
+            snapshot_file.write(state)
+            record_offsets.append(record_offsets[-1] + len(state))
+
+        # Chaves e índices vêm depois dos registros, alinhados em 8 bytes para o cast do memoryview
+        keys_offset = record_offsets[-1]
+        snapshot_file.write(keys)
+        snapshot_file.write(bytes(-len(keys) % 8))
+        index_offset = keys_offset + len(keys) + (-len(keys) % 8)
+        snapshot_file.write(key_offsets.tobytes())
+        snapshot_file.write(record_offsets.tobytes())
+
+        count = len(key_offsets) - 1
+        snapshot_file.seek(0)
+        snapshot_file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count, log_offset,
+                                                 keys_offset, index_offset))
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary, path)
+    return count
+
+
+class StateSnapshot:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, log_offset, keys_offset, index_offset = SNAPSHOT_HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Not a fraud state snapshot: {path}")
+        self.count = count
+        self.log_offset = log_offset
+        self._keys_offset = keys_offset
+        # Índices lidos direto do arquivo mapeado, sem cópia nem desserialização
+        self._view = view = memoryview(self._map)
+        self._key_offsets = view[index_offset:index_offset + 8 * (count + 1)].cast("Q")
+        record_start = index_offset + 8 * (count + 1)
+        self._record_offsets = view[record_start:record_start + 8 * (count + 1)].cast("Q")
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys_offset + self._key_offsets[index]
+        return self._map[start:self._keys_offset + self._key_offsets[index + 1]]
+
+    def _find(self, account_id: str) -> Optional[int]:
+        target = account_id.encode()
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key(low) == target:
+            return low
+        return None
+
+    def record(self, account_id: str) -> Optional[bytes]:
+        index = self._find(account_id)
+        if index is None:
+            return None
+        return self._map[self._record_offsets[index]:self._record_offsets[index + 1]]
+
+    def get(self, account_id: str) -> Optional[AccountState]:
+        record = self.record(account_id)
+        return AccountState.from_bytes(record) if record is not None else None
+
+    def items(self) -> Iterator[tuple[str, bytes]]:
+        for index in range(self.count):
+            yield (self._key(index).decode(),
+                   self._map[self._record_offsets[index]:self._record_offsets[index + 1]])
+
+    def close(self) -> None:
+        for attribute in ("_key_offsets", "_record_offsets", "_view"):
+            if hasattr(self, attribute):
+                getattr(self, attribute).release()
+        self._map.close()
+        self._file.close()
+
+    def __contains__(self, account_id: str) -> bool:
+        return self._find(account_id) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(path='{self.path}', accounts={self.count}, log_offset={self.log_offset})"
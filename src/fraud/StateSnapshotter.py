@@ -0,0 +1,84 @@
+import multiprocessing
+import time
+from typing import Optional
+from src.fraud.AccountStore import AccountStore
+from src.fraud.StateSnapshot import write_snapshot
+
+
+def _write_store_snapshot(store: AccountStore, path: str, log_offset: int, spilled: Optional[bytes] = None,
+                          reading=None) -> None:
+    items = store.snapshot_items(spilled)
+    if reading is not None:
+        reading.set()
+    write_snapshot(path, items, log_offset)
+
+
+class StateSnapshotter:
+    def __init__(self, store: AccountStore, path: str, every_events: int = 1000000):
+        if every_events <= 0:
+            raise ValueError("every_events must be positive")
+        self.store = store
+        self.path = path
+        self.every_events = every_events
+        self.last_log_offset: Optional[int] = None
+        self.snapshots = 0
+        self.last_duration = 0.0
+        self._process = None
+        self._started = 0.0
+        # Com fork o filho recebe uma cópia copy-on-write do estado e grava sem pausar o processamento
+        self.background = "fork" in multiprocessing.get_all_start_methods()
+
+    @property
+    def in_progress(self) -> bool:
+        if self._process is not None and not self._process.is_alive():
+            self._finish()
+        return self._process is not None
+
+    def snapshot(self, log_offset: int) -> bool:
+        if self.in_progress:
+            return False
+        self.last_log_offset = log_offset
+        self._started = time.perf_counter()
+        if not self.background:
+            _write_store_snapshot(self.store, self.path, log_offset)
+            self._record_duration()
+            return True
+        context = multiprocessing.get_context("fork")
+        reading = context.Event()
+        # O filho nunca usa a conexão sqlite do pai: abre a sua ou lê a cópia do banco em memória
+        self._process = context.Process(target=_write_store_snapshot,
+                                        args=(self.store, self.path, log_offset, self.store.spilled_copy(), reading),
+                                        daemon=True)
+        self._process.start()
+        # Nenhuma conta é despejada ou recarregada até o filho abrir a leitura das contas frias:
+        # o snapshot corresponde exatamente a log_offset
+        while not reading.wait(0.05):
+            if not self._process.is_alive():
+                break
+        return True
+
+    def maybe_snapshot(self, log_offset: int) -> bool:
+        if self.last_log_offset is not None and log_offset - self.last_log_offset < self.every_events:
+            return False
+        return self.snapshot(log_offset)
+
+    def wait(self) -> None:
+        if self._process is not None:
+            self._process.join()
+            self._finish()
+
+    def _finish(self) -> None:
+        process, self._process = self._process, None
+        if process.exitcode != 0:
+            raise RuntimeError(f"Snapshot process failed with exit code {process.exitcode}")
+        self._record_duration()
+
+    def _record_duration(self) -> None:
+        self.snapshots += 1
+        self.last_duration = time.perf_counter() - self._started
+
+    def __repr__(self) -> str:
+        return (f"StateSnapshotter(path='{self.path}', "
+                f"every_events={self.every_events}, "
+                f"snapshots={self.snapshots}, "
+                f"last_log_offset={self.last_log_offset})")
@@ -1,10 +1,21 @@
 from datetime import datetime
+from typing import Optional
 
 class Transaction:
-    def __init__(self, amount: float, timestamp: datetime, location: str):
+    def __init__(
+        self,
+        amount: float,
+        timestamp: datetime,
+        location: str,
+        merchant: Optional[str] = None,
+        channel: Optional[str] = None,
+    ):
         self.amount = amount
         self.timestamp = timestamp
         self.location = location
+        self.merchant = merchant
+        self.channel = channel
 
     def __repr__(self) -> str:
-        return f"Transaction(amount={self.amount}, timestamp='{self.timestamp}', location='{self.location}')"
\ No newline at end of file
+        return (f"Transaction(amount={self.amount}, timestamp='{self.timestamp}', location='{self.location}', "
+                f"merchant='{self.merchant}', channel='{self.channel}')")
\ No newline at end of file
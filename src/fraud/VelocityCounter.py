@@ -0,0 +1,143 @@
+import struct
+from array import array
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+COUNTER_HEADER = struct.Struct("<?IqIdI")
+
+
+def minute_index(timestamp: datetime) -> int:
+    return timestamp.toordinal() * 1440 + timestamp.hour * 60 + timestamp.minute
+
+
+def to_micros(timestamp: datetime) -> int:
+    return (timestamp - datetime.min) // timedelta(microseconds=1)
+
+
+def from_micros(micros: int) -> datetime:
+    return datetime.min + timedelta(microseconds=micros)
+
+
+class VelocityCounter:
+    __slots__ = ("window_minutes", "exact", "_counts", "_amounts", "_latest_minute", "_count", "_amount", "_events")
+
+    def __init__(self, window_minutes: int = 60, exact: bool = False):
+        self.window_minutes = window_minutes
+        self.exact = exact
+        self._count = 0
+        self._amount = 0.0
+        if exact:
+            # Modo exato: apenas as transações ainda dentro da janela, ordenadas por horário
+            self._events: deque = deque()
+        else:
+            # Anel de buckets por minuto cobrindo [minuto atual - janela, minuto atual]
+            self._counts = array("I", bytes(4 * (window_minutes + 1)))
+            self._amounts = array("d", bytes(8 * (window_minutes + 1)))
+            self._latest_minute = None
+
+    def add(self, timestamp: datetime, amount: float = 0.0) -> None:
+        if self.exact:
+            events = self._events
+            if events and timestamp < events[-1][0]:
+                # Fora de ordem: entra na posição do horário para a expiração pela esquerda continuar exata
+                events.insert(bisect_right(events, timestamp, key=itemgetter(0)), (timestamp, amount))
+            else:
+                events.append((timestamp, amount))
+            self._count += 1
+            self._amount += amount
+            return
+
+        minute = minute_index(timestamp)
+        self._advance(minute)
+        if minute <= self._latest_minute - len(self._counts):
+            return
+        bucket = minute % len(self._counts)
+        self._counts[bucket] += 1
+        self._amounts[bucket] += amount
+        self._count += 1
+        self._amount += amount
+
+    def count(self, now: datetime) -> int:
+        self._expire(now)
+        return self._count
+
+    def amount(self, now: datetime) -> float:
+        self._expire(now)
+        return self._amount
+
+    def _expire(self, now: datetime) -> None:
+        if not self.exact:
+            self._advance(minute_index(now))
+            return
+
+        events = self._events
+        while events and (now - events[0][0]).total_seconds() / 60 > self.window_minutes:
+            _, amount = events.popleft()
+            self._count -= 1
+            self._amount -= amount
+        if not events:
+            self._amount = 0.0
+
+    def _advance(self, minute: int) -> None:
+        latest = self._latest_minute
+        if latest is None or minute - latest >= len(self._counts):
+            for bucket in range(len(self._counts)):
+                self._counts[bucket] = 0
+                self._amounts[bucket] = 0.0
+            self._count = 0
+            self._amount = 0.0
+            self._latest_minute = minute
+            return
+
+        while latest < minute:
+            latest += 1
+            bucket = latest % len(self._counts)
+            self._count -= self._counts[bucket]
+            self._amount -= self._amounts[bucket]
+            self._counts[bucket] = 0
+            self._amounts[bucket] = 0.0
+        self._latest_minute = latest
+        if not self._count:
+            self._amount = 0.0
+
+    def pack(self) -> bytes:
+        if self.exact:
+            timestamps = array("q", (to_micros(timestamp) for timestamp, _ in self._events))
+            amounts = array("d", (amount for _, amount in self._events))
+            header = COUNTER_HEADER.pack(True, self.window_minutes, -1, self._count, self._amount, len(timestamps))
+            return header + timestamps.tobytes() + amounts.tobytes()
+        # Só os buckets não vazios: contas pouco ativas ocupam poucos bytes
+        buckets = array("I", (bucket for bucket, count in enumerate(self._counts) if count))
+        counts = array("I", (self._counts[bucket] for bucket in buckets))
+        amounts = array("d", (self._amounts[bucket] for bucket in buckets))
+        latest = -1 if self._latest_minute is None else self._latest_minute
+        header = COUNTER_HEADER.pack(False, self.window_minutes, latest, self._count, self._amount, len(buckets))
+        return header + buckets.tobytes() + counts.tobytes() + amounts.tobytes()
+
+    @classmethod
+    def unpack(cls, data, offset: int = 0) -> tuple["VelocityCounter", int]:
+        exact, window_minutes, latest, count, amount, size = COUNTER_HEADER.unpack_from(data, offset)
+        offset += COUNTER_HEADER.size
+        counter = cls(window_minutes, exact)
+        columns = [array(typecode) for typecode in ("qd" if exact else "IId")]
+        for column in columns:
+            column.frombytes(data[offset:offset + column.itemsize * size])
+            offset += column.itemsize * size
+        if exact:
+            timestamps, amounts = columns
+            counter._events.extend(zip(map(from_micros, timestamps), amounts))
+        else:
+            buckets, counts, amounts = columns
+            for bucket, bucket_count, bucket_amount in zip(buckets, counts, amounts):
+                counter._counts[bucket] = bucket_count
+                counter._amounts[bucket] = bucket_amount
+            counter._latest_minute = None if latest == -1 else latest
+        counter._count = count
+        counter._amount = amount
+        return counter, offset
+
+    def __repr__(self) -> str:
+        return (f"VelocityCounter(window_minutes={self.window_minutes}, "
+                f"exact={self.exact}, count={self._count})")
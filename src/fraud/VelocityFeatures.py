@@ -0,0 +1,13 @@
+class VelocityFeatures:
+    def __init__(self, counts: dict[int, int], amounts: dict[int, float]):
+        self.counts = counts
+        self.amounts = amounts
+
+    def count(self, window_minutes: int) -> int:
+        return self.counts[window_minutes]
+
+    def amount(self, window_minutes: int) -> float:
+        return self.amounts[window_minutes]
+
+    def __repr__(self) -> str:
+        return f"VelocityFeatures(counts={self.counts}, amounts={self.amounts})"
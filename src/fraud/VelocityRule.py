@@ -0,0 +1,30 @@
+from typing import Optional
+
+
+class VelocityRule:
+    def __init__(
+        self,
+        window_minutes: int,
+        max_count: Optional[int] = None,
+        max_amount: Optional[float] = None,
+        risk_score: int = 20,
+        block: bool = False,
+    ):
+        if max_count is None and max_amount is None:
+            raise ValueError("A velocity rule needs max_count or max_amount")
+        self.window_minutes = window_minutes
+        self.max_count = max_count
+        self.max_amount = max_amount
+        self.risk_score = risk_score
+        self.block = block
+
+    def is_triggered(self, count: int, amount: float) -> bool:
+        return ((self.max_count is not None and count > self.max_count)
+                or (self.max_amount is not None and amount > self.max_amount))
+
+    def __repr__(self) -> str:
+        return (f"VelocityRule(window_minutes={self.window_minutes}, "
+                f"max_count={self.max_count}, "
+                f"max_amount={self.max_amount}, "
+                f"risk_score={self.risk_score}, "
+                f"block={self.block})")
@@ -0,0 +1,61 @@
+from datetime import datetime
+from src.fraud.CountMinSketch import CountMinSketch
+from src.fraud.VelocityCounter import minute_index
+
+
+class WindowedSketch:
+    def __init__(self, window_minutes: int = 60, bucket_minutes: int = 5,
+                 epsilon: float = 0.001, delta: float = 0.01):
+        if window_minutes % bucket_minutes:
+            raise ValueError("window_minutes must be a multiple of bucket_minutes")
+        self.window_minutes = window_minutes
+        self.bucket_minutes = bucket_minutes
+        # Um sketch por bucket de tempo mais o total acumulado dos buckets vivos
+        self.buckets = [CountMinSketch(epsilon, delta) for _ in range(window_minutes // bucket_minutes + 1)]
+        self.total = CountMinSketch(epsilon, delta)
+        self._latest_bucket = None
+
+    def add(self, key: str, timestamp: datetime, count: int = 1) -> None:
+        bucket_index = minute_index(timestamp) // self.bucket_minutes
+        self._advance(bucket_index)
+        if bucket_index <= self._latest_bucket - len(self.buckets):
+            return
+        positions = self.total.positions(key)
+        bucket_table = self.buckets[bucket_index % len(self.buckets)].table
+        total_table = self.total.table
+        for position in positions:
+            bucket_table[position] += count
+            total_table[position] += count
+
+    def estimate(self, key: str, now: datetime) -> int:
+        self._advance(minute_index(now) // self.bucket_minutes)
+        return self.total.estimate(key)
+
+    def _advance(self, bucket_index: int) -> None:
+        latest = self._latest_bucket
+        if latest is None or bucket_index - latest >= len(self.buckets):
+            for sketch in self.buckets:
+                sketch.clear()
+            self.total.clear()
+            self._latest_bucket = bucket_index
+            return
+
+        total_table = self.total.table
+        while latest < bucket_index:
+            latest += 1
+            expired = self.buckets[latest % len(self.buckets)]
+            # Subtrai só as células não nulas do bucket que sai da janela
+            for position, value in enumerate(expired.table):
+                if value:
+                    total_table[position] -= value
+            expired.clear()
+        self._latest_bucket = latest
+
+    @property
+    def nbytes(self) -> int:
+        return self.total.nbytes * (len(self.buckets) + 1)
+
+    def __repr__(self) -> str:
+        return (f"WindowedSketch(window_minutes={self.window_minutes}, "
+                f"bucket_minutes={self.bucket_minutes}, "
+                f"width={self.total.width}, depth={self.total.depth})")
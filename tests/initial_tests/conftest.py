@@ -0,0 +1,48 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+
+
+@pytest.fixture
+def now():
+    return datetime(2025, 10, 16, 12, 0, 0)
+
+
+def make_transaction_stream(
+    seed,
+    size,
+    start,
+    gaps=(5, 30, 90, 400, 1800, 4000),
+    amounts=(50.0, 900.0, 12000.0),
+    locations=("SP", "RJ", "BH"),
+    merchants=(None,),
+    channels=(None,),
+    accounts=0,
+    account_skew=None,
+):
+    # Fluxo ordenado de transações; com accounts, pares (conta, transação)
+    # e, com account_skew, poucas contas muito ativas (Pareto)
+    rng = random.Random(seed)
+    timestamp = start
+    stream = []
+    for _ in range(size):
+        timestamp += timedelta(seconds=rng.choice(gaps))
+        transaction = Transaction(rng.choice(amounts), timestamp, rng.choice(locations), rng.choice(merchants),
+                                  rng.choice(channels))
+        if not accounts:
+            stream.append(transaction)
+            continue
+        account = int(rng.paretovariate(account_skew)) if account_skew is not None else rng.randrange(accounts)
+        stream.append((f"conta-{account % accounts}", transaction))
+    return stream
+
+
+@pytest.fixture
+def transaction_stream():
+    return make_transaction_stream
+
+
+@pytest.fixture
+def result_tuple():
+    return lambda result: (result.is_fraudulent, result.is_blocked, result.verification_required, result.risk_score)
@@ -0,0 +1,135 @@
+import os
+import subprocess
+import sys
+import pytest
+from datetime import timedelta
+from src.fraud.AccountState import AccountState
+from src.fraud.AccountStore import AccountStore
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+@pytest.fixture
+def fraud_system():
+    return FraudDetectionSystem(velocity_rules=[VelocityRule(5, max_count=2)],
+                                amount_rule=AmountAnomalyRule(window=10, min_history=3))
+
+
+# Intervalos curtos e poucas contas muito ativas (Pareto)
+ACCOUNT_STREAM = dict(gaps=range(1, 121), amounts=(20.0, 80.0, 3000.0), locations=("SP", "RJ"), account_skew=1.0)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_account_state_round_trips_through_bytes(fraud_system, now, exact, transaction_stream, result_tuple):
+    """
+    O estado serializado deve continuar produzindo as mesmas decisões que o original.
+    """
+    original = fraud_system.new_account_state(exact)
+    for transaction in transaction_stream(1, 40, now, **ACCOUNT_STREAM):
+        fraud_system.check_account(transaction, original, [])
+
+    restored = AccountState.from_bytes(original.to_bytes())
+
+    assert restored.to_bytes() == original.to_bytes()
+    assert restored.last_location == original.last_location
+    for transaction in transaction_stream(2, 40, now + timedelta(hours=2), **ACCOUNT_STREAM):
+        expected = fraud_system.check_account(transaction, original, [])
+        result = fraud_system.check_account(transaction, restored, [])
+        assert result_tuple(result) == result_tuple(expected)
+
+
+def test_account_state_matches_full_history_with_amount_rule(fraud_system, now, transaction_stream, result_tuple):
+    """
+    Estado exato por conta e histórico completo passam pelo mesmo corpo de regras, inclusive
+    a regra de anomalia de valor.
+    """
+    state = fraud_system.new_account_state(exact=True)
+    stream = transaction_stream(4, 300, now, **ACCOUNT_STREAM)
+
+    for index, transaction in enumerate(stream):
+        expected = fraud_system.check_for_fraud(transaction, stream[:index], ["RJ"])
+        result = fraud_system.check_account(transaction, state, ["RJ"])
+        assert result_tuple(result) == result_tuple(expected)
+
+
+def test_core_module_does_not_import_storage():
+    """
+    Importar FraudDetectionSystem não deve carregar sqlite, mmap nem memória compartilhada.
+    """
+    modules = ("sqlite3", "mmap", "multiprocessing.shared_memory")
+    code = ("import sys; import src.fraud.FraudDetectionSystem; "
+            f"print([name for name in {modules!r} if name in sys.modules])")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+
+    assert output.stdout.strip() == "[]"
+
+
+def test_new_account_state_round_trips(fraud_system):
+    state = AccountState.from_bytes(fraud_system.new_account_state().to_bytes())
+
+    assert state.last_timestamp is None
+    assert list(state.velocity) == [5, 60]
+
+
+def test_lru_eviction_spills_and_reloads_transparently(fraud_system, now, transaction_stream, result_tuple):
+    """
+    Com limite de contas em memória, as decisões devem ser as mesmas de um estado ilimitado.
+    """
+    store = fraud_system.new_account_store(max_accounts=5)
+    unlimited = {}
+
+    for account_id, transaction in transaction_stream(3, 600, now, accounts=40, **ACCOUNT_STREAM):
+        state = unlimited.setdefault(account_id, fraud_system.new_account_state())
+        expected = fraud_system.check_account(transaction, state, [])
+        result = fraud_system.check_stored(account_id, transaction, store, [])
+        assert result_tuple(result) == result_tuple(expected)
+
+    assert len(store) == 5
+    # Cada conta está ou na memória ou no arquivo, nunca nos dois
+    assert len(store) + store.spilled_accounts == len(unlimited)
+    assert store.metrics.evictions > 0
+    assert store.metrics.reloads > 0
+    assert store.metrics.hits + store.metrics.created + store.metrics.reloads == 600
+    assert store.metrics.max_reload_seconds >= store.metrics.mean_reload_seconds > 0
+
+
+def test_idle_accounts_are_evicted(now):
+    store = AccountStore(max_accounts=100, max_idle=timedelta(minutes=30))
+    fraud_system = FraudDetectionSystem()
+
+    fraud_system.check_stored("conta-fria", Transaction(20, now, "SP"), store, [])
+    fraud_system.check_stored("conta-quente", Transaction(20, now + timedelta(minutes=20), "SP"), store, [])
+    fraud_system.check_stored("conta-quente", Transaction(20, now + timedelta(minutes=40), "SP"), store, [])
+
+    assert "conta-fria" not in store
+    assert "conta-quente" in store
+    assert store.metrics.idle_evictions == 1
+    assert store.spilled_accounts == 1
+    assert store.get("conta-fria").last_timestamp == now
+    assert store.spilled_accounts == 0
+
+
+def test_spilled_state_survives_reopening_the_file(tmp_path, now):
+    """
+    Contas gravadas no arquivo devem ser recarregadas por uma nova instância do armazenamento.
+    """
+    path = str(tmp_path / "contas.sqlite")
+    store = AccountStore(path=path)
+    FraudDetectionSystem().check_stored("conta-1", Transaction(20, now, "Recife"), store, [])
+    store.close()
+
+    reopened = AccountStore(path=path)
+    state = reopened.get("conta-1")
+
+    assert state.last_location == "Recife"
+    assert reopened.metrics.reloads == 1
+    assert reopened.metrics.spilled_bytes == 0
+
+
+def test_store_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        AccountStore(max_accounts=0)
@@ -0,0 +1,95 @@
+import random
+import statistics
+import pytest
+from datetime import timedelta
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.AmountStatistics import AmountStatistics
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.Transaction import Transaction
+
+
+def test_window_statistics_match_last_n_amounts():
+    """
+    Média e desvio padrão incrementais devem coincidir com o cálculo direto sobre as últimas N transações.
+    """
+    rng = random.Random(5)
+    amounts = [rng.lognormvariate(4, 1) for _ in range(500)]
+    rolling = AmountStatistics(window=30)
+
+    for index, amount in enumerate(amounts, start=1):
+        rolling.update(amount)
+        window = amounts[max(0, index - 30):index]
+        assert rolling.count == len(window)
+        assert rolling.mean == pytest.approx(statistics.fmean(window))
+        if len(window) > 1:
+            assert rolling.stddev == pytest.approx(statistics.stdev(window))
+    assert len(rolling._amounts) == 30
+
+
+def test_decayed_statistics_follow_recent_amounts():
+    decayed = AmountStatistics(alpha=0.2)
+    for _ in range(50):
+        decayed.update(100.0)
+    assert decayed.mean == pytest.approx(100.0)
+    assert decayed.variance == pytest.approx(0.0)
+
+    for _ in range(50):
+        decayed.update(20.0)
+    assert decayed.mean == pytest.approx(20.0, abs=0.01)
+    assert decayed.count == 100
+
+
+def test_statistics_validate_configuration():
+    with pytest.raises(ValueError):
+        AmountStatistics(window=0)
+    with pytest.raises(ValueError):
+        AmountStatistics(alpha=1.5)
+    with pytest.raises(ValueError):
+        AmountAnomalyRule(window=None)
+
+
+def test_anomaly_rule_needs_minimum_history():
+    """
+    A regra só dispara depois de um histórico mínimo e para valores muito acima da média.
+    """
+    rule = AmountAnomalyRule(z_threshold=3.0, window=20, min_history=5)
+    rolling = rule.new_statistics()
+    for amount in (50.0, 55.0, 45.0, 52.0):
+        rolling.update(amount)
+    assert not rule.is_triggered(rolling, 5000.0)
+
+    rolling.update(48.0)
+    assert rule.is_triggered(rolling, 5000.0)
+    assert not rule.is_triggered(rolling, 60.0)
+    assert not rule.is_triggered(rolling, 1.0)
+
+
+def test_amount_spike_requires_verification(now):
+    fraud_system = FraudDetectionSystem(amount_rule=AmountAnomalyRule(window=20, min_history=10, risk_score=35))
+    history = [Transaction(40.0 + index % 5, now - timedelta(hours=48 - index), "Campinas") for index in range(20)]
+
+    result = fraud_system.check_for_fraud(Transaction(900.0, now, "Campinas"), history, [])
+    usual = fraud_system.check_for_fraud(Transaction(42.0, now, "Campinas"), history, [])
+
+    assert result.verification_required
+    assert not result.is_fraudulent
+    assert result.risk_score == 35
+    assert not usual.verification_required
+
+
+@pytest.mark.parametrize("rule", [AmountAnomalyRule(window=15, min_history=5), AmountAnomalyRule(alpha=0.1, window=None)])
+def test_check_account_matches_check_for_fraud(now, rule):
+    """
+    O estado incremental por conta deve produzir as mesmas decisões que o recálculo sobre o histórico.
+    """
+    fraud_system = FraudDetectionSystem(amount_rule=rule)
+    state = fraud_system.new_account_state(exact=True)
+    rng = random.Random(9)
+    stream = [Transaction(rng.choice([30.0, 45.0, 60.0, 2500.0]), now + timedelta(hours=index), "Campinas")
+              for index in range(200)]
+
+    for index, transaction in enumerate(stream):
+        expected = fraud_system.check_for_fraud(transaction, stream[:index], [])
+        result = fraud_system.check_account(transaction, state, [])
+        assert (result.verification_required, result.risk_score) == \
+               (expected.verification_required, expected.risk_score)
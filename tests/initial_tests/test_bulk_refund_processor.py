@@ -0,0 +1,96 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.BookingBatch import BookingBatch
+from src.flight.BulkRefundProcessor import BulkRefundProcessor
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+
+def make_batch(size, seed=42):
+    """Gera um conjunto colunar de reservas sintéticas e reprodutíveis."""
+    rng = random.Random(seed)
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    columns = {
+        "passengers": [], "booking_times": [], "available_seats": [], "current_prices": [],
+        "previous_sales": [], "departure_times": [], "reward_points_available": [],
+    }
+    for _ in range(size):
+        columns["passengers"].append(rng.randint(1, 8))
+        columns["booking_times"].append(booking_time)
+        columns["available_seats"].append(rng.randint(0, 10))
+        columns["current_prices"].append(round(rng.uniform(1.0, 900.0), 2))
+        columns["previous_sales"].append(rng.randint(0, 200))
+        columns["departure_times"].append(booking_time + timedelta(minutes=rng.randint(0, 6000)))
+        columns["reward_points_available"].append(rng.choice([0, 0, 500, 20000]))
+    return BookingBatch(**columns)
+
+
+def test_refunds_match_book_flight_cancellation():
+    """
+    Cada reembolso calculado em lote deve ser idêntico ao de book_flight(..., is_cancellation=True).
+    """
+    batch = make_batch(500)
+    system = FlightBookingSystem()
+    chunks = list(BulkRefundProcessor(chunk_size=64).process_refunds(batch))
+
+    refunds = [amount for chunk in chunks for amount in chunk.refund_amounts]
+    assert len(refunds) == len(batch)
+
+    for i, row in enumerate(batch.rows()):
+        passengers, booking_time, seats, price, sales, departure, points = row
+        expected = system.book_flight(passengers, booking_time, seats, price, sales,
+                                      True, departure, points)
+        assert refunds[i] == expected.refund_amount
+
+
+def test_full_refund_flag_follows_48h_rule():
+    """
+    Reservas com 48h ou mais até a partida recebem reembolso total; as demais, 50%.
+    """
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    batch = BookingBatch(
+        passengers=[1, 1],
+        booking_times=[booking_time, booking_time],
+        available_seats=[10, 10],
+        current_prices=[100.0, 100.0],
+        previous_sales=[100, 100],
+        departure_times=[booking_time + timedelta(hours=48), booking_time + timedelta(hours=47)],
+        reward_points_available=[0, 0],
+    )
+
+    chunk, = BulkRefundProcessor().process_refunds(batch)
+
+    assert list(chunk.full_refund) == [1, 0]
+    assert list(chunk.refund_amounts) == [80.0, 40.0]
+
+
+def test_results_are_streamed_in_bounded_chunks():
+    """
+    O processamento deve ser entregue em blocos de no máximo chunk_size linhas.
+    """
+    batch = make_batch(250)
+    chunks = list(BulkRefundProcessor(chunk_size=100).process_refunds(batch))
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert [chunk.start for chunk in chunks] == [0, 100, 200]
+
+
+def test_insufficient_seats_yields_no_refund():
+    """
+    Assim como em book_flight, passageiros acima dos assentos disponíveis não geram reembolso.
+    """
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    batch = BookingBatch([10], [booking_time], [2], [100.0], [100],
+                         [booking_time + timedelta(days=3)], [0])
+
+    chunk, = BulkRefundProcessor().process_refunds(batch)
+
+    assert chunk.refund_amounts[0] == 0.0
+    assert chunk.full_refund[0] == 0
+
+
+def test_invalid_inputs_raise_value_error():
+    with pytest.raises(ValueError):
+        BulkRefundProcessor(chunk_size=0)
+    with pytest.raises(ValueError):
+        BookingBatch([1, 2], [], [], [], [], [], [])
@@ -0,0 +1,93 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedulePlanner import DeviceSchedulePlanner
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+@pytest.fixture
+def planner():
+    return DeviceSchedulePlanner()
+
+
+@pytest.fixture
+def start():
+    return datetime(2025, 10, 16, 0, 0, 0)
+
+
+def test_unconstrained_plan_uses_cheapest_slots(planner, start):
+    """
+    Sem limite de energia ativo, cada dispositivo deve ocupar exatamente os seus slots mais baratos.
+    """
+    prices = [0.30, 0.10, 0.25, 0.05, 0.40, 0.15, 0.20, 0.35]
+
+    plan = planner.plan(prices, start, {"Washer": 2, "Dryer": 3}, {"Washer": 2, "Dryer": 3},
+                        {"Washer": 1.0, "Dryer": 2.0}, 1000.0)
+
+    washer = [s.scheduled_time for s in plan.schedules if s.device_name == "Washer"]
+    dryer = [s.scheduled_time for s in plan.schedules if s.device_name == "Dryer"]
+    assert washer == [start + timedelta(minutes=15), start + timedelta(minutes=45)]
+    assert dryer == [start + timedelta(minutes=15), start + timedelta(minutes=45), start + timedelta(minutes=75)]
+    assert plan.total_cost == pytest.approx((0.10 + 0.05) * 1.0 + (0.10 + 0.05 + 0.15) * 2.0)
+    assert plan.unscheduled == []
+
+
+def test_daily_limit_is_respected_and_priority_wins(planner, start):
+    """
+    Com limite diário apertado, o dispositivo de prioridade 1 é planejado primeiro e o de menor
+    prioridade que não cabe por inteiro fica sem agenda (sem reservas parciais).
+    """
+    prices = [0.1] * 96 + [0.5] * 96
+
+    plan = planner.plan(prices, start, {"EVCharger": 2, "Heater": 1}, {"EVCharger": 10, "Heater": 8},
+                        {"EVCharger": 7.0, "Heater": 2.0}, 20.0)
+
+    energy_per_day = {}
+    for schedule in plan.schedules:
+        day = schedule.scheduled_time.date()
+        power = 7.0 if schedule.device_name == "EVCharger" else 2.0
+        energy_per_day[day] = energy_per_day.get(day, 0.0) + power
+    assert all(energy <= 20.0 for energy in energy_per_day.values())
+    assert plan.unscheduled == ["EVCharger"]
+    assert len(plan.schedules) == 8
+
+
+def test_plan_schedules_are_sorted_and_feed_manage_energy(planner, start):
+    prices = [0.2, 0.1, 0.3, 0.1]
+
+    plan = planner.plan(prices, start, {"Washer": 3}, {"Washer": 2}, {"Washer": 1.0}, 50.0)
+    index = plan.as_index()
+
+    times = [schedule.scheduled_time for schedule in plan.schedules]
+    assert times == sorted(times)
+    result = SmartEnergyManagementSystem().manage_energy(0.5, 0.2, {"Washer": 3}, times[0], 21.0, (18.0, 24.0),
+                                                         50.0, 10.0, index)
+    assert result.device_status["Washer"] is True
+
+
+class CountingPrices(list):
+    """Previsão de preços que conta quantas vezes cada slot é lido."""
+
+    reads = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return super().__getitem__(index)
+
+
+def test_hundreds_of_devices_share_a_single_price_ordering(planner, start):
+    """
+    Centenas de dispositivos em slots de 15 minutos ao longo de 5 dias: a previsão é ordenada uma única vez,
+    então os preços são lidos uma vez por slot na ordenação e uma vez por slot escolhido no custo,
+    independentemente do número de dispositivos.
+    """
+    rng = random.Random(37)
+    prices = CountingPrices(rng.uniform(0.05, 0.5) for _ in range(96 * 5))
+    devices = {f"Device{i}": rng.randint(1, 4) for i in range(300)}
+    durations = {device: rng.randint(1, 16) for device in devices}
+    power = {device: rng.uniform(0.1, 3.0) for device in devices}
+
+    plan = planner.plan(prices, start, devices, durations, power, 600.0)
+
+    assert prices.reads == len(prices) + len(plan.schedules)
+    assert len(plan.schedules) + sum(durations[device] for device in plan.unscheduled) == sum(durations.values())
@@ -0,0 +1,95 @@
+import pytest
+from datetime import datetime
+from src.energy.DeviceRegistry import DeviceRegistry
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.FleetEnergyManager import FleetEnergyManager
+
+
+@pytest.fixture
+def registry():
+    return DeviceRegistry(["Security", "Lights", "Heating", "Cooling"])
+
+
+def test_compact_status_reads_like_a_dict(registry):
+    """
+    O estado compacto deve ter o mesmo acesso de leitura que o dicionário original.
+    """
+    result = SmartEnergyManagementSystem().manage_energy(
+        current_price=0.30,
+        price_threshold=0.20,
+        device_priorities={"Security": 1, "Lights": 2, "Oven": 3},
+        current_time=datetime(2025, 10, 16, 14, 0, 0),
+        current_temperature=16.0,
+        desired_temperature_range=(20.0, 24.0),
+        energy_usage_limit=50.0,
+        total_energy_used_today=25.0,
+        scheduled_devices=[],
+    )
+
+    registry.register("Oven")
+    compact = registry.compact(result.device_status)
+
+    assert compact == result.device_status
+    assert compact["Heating"] is True
+    assert compact["Oven"] is False
+    assert "Cooling" not in compact
+    assert compact.get("Cooling") is None
+    assert len(compact) == len(result.device_status)
+    with pytest.raises(KeyError):
+        compact["Cooling"]
+
+
+def test_pack_and_unpack_roundtrip(registry):
+    statuses = [registry.compact({"Security": True, "Lights": False}),
+                registry.compact({"Heating": True, "Cooling": False, "Lights": True}),
+                registry.compact({})]
+
+    data = registry.pack(statuses)
+
+    # 2 bytes de cabeçalho + 3 registros de 2 bytes (presença + ligados)
+    assert len(data) == 2 + 3 * 2
+    assert [status.to_dict() for status in registry.unpack(data)] == [status.to_dict() for status in statuses]
+
+
+def test_compact_rejects_unregistered_devices(registry):
+    """
+    Compactar não registra dispositivos implicitamente: nomes desconhecidos levantam KeyError.
+    """
+    with pytest.raises(KeyError):
+        registry.compact({"Security": True, "Oven": False})
+
+    assert "Oven" not in registry
+    assert len(registry) == 4
+
+
+def test_empty_registry_unpacks_to_no_statuses():
+    empty = DeviceRegistry()
+
+    assert empty.unpack(empty.pack([])) == []
+    assert empty.unpack_fleet(b"") == []
+
+
+def test_unpack_rejects_wider_records(registry):
+    data = DeviceRegistry([f"Device{i}" for i in range(20)]).pack([])
+
+    with pytest.raises(ValueError):
+        registry.unpack(data)
+
+
+def test_fleet_results_pack_into_contiguous_bits():
+    """
+    Os estados da frota são empacotados em um único bloco contíguo de bits que decodifica
+    para as mesmas linhas da matriz.
+    """
+    names = [f"Device{i}" for i in range(10)]
+    manager = FleetEnergyManager(names)
+    result = manager.manage_fleet(
+        [0.1, 0.3, 0.1], [0.2, 0.2, 0.2], [12, 12, 2], [21.0, 15.0, 30.0], [18.0] * 3, [24.0] * 3,
+        [50.0] * 3, [10.0] * 3, [[1, 2, 3, None, 1, 2, 3, None, 1, 2]] * 3,
+    )
+
+    packed = result.pack_status()
+    decoded = DeviceRegistry(result.device_names).unpack_fleet(packed)
+
+    assert len(packed) == 3 * 2
+    assert [status.to_dict() for status in decoded] == [result.status_for(home) for home in range(3)]
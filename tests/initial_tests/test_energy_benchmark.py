@@ -0,0 +1,50 @@
+from benchmarks.energy_benchmark import (SCENARIOS, calls_for, make_arguments, make_calls, profile_scenario,
+                                         trace_scenario)
+from benchmarks.harness import time_calls
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+def test_shedding_scenario_exceeds_the_limit():
+    """
+    O cenário de excedente deve de fato acionar o desligamento por limite de energia.
+    """
+    arguments = make_arguments("shedding_overage", 1000)
+
+    result = SmartEnergyManagementSystem().manage_energy(**arguments)
+
+    assert arguments["total_energy_used_today"] >= arguments["energy_usage_limit"]
+    assert not any(result.device_status[device] for device in arguments["device_priorities"])
+
+
+def test_schedule_scenarios_activate_the_same_devices():
+    """
+    A agenda em lista e em índice devem produzir o mesmo resultado para o mesmo tamanho.
+    """
+    energy_system = SmartEnergyManagementSystem()
+
+    from_list = energy_system.manage_energy(**make_arguments("schedule_list", 1000))
+    from_index = energy_system.manage_energy(**make_arguments("schedule_index", 1000))
+
+    assert from_list.device_status == from_index.device_status
+    assert any(name.startswith("Device") and on for name, on in from_list.device_status.items())
+
+
+def test_every_scenario_size_runs():
+    for scenario, sizes in SCENARIOS.items():
+        metrics = time_calls(make_calls(scenario, sizes[0], 3))
+        assert metrics["throughput"] > 0
+
+
+def test_calls_for_scales_with_size():
+    assert calls_for(10, 2_000_000) == 2000
+    assert calls_for(100000, 2_000_000) == 20
+    assert calls_for(10**9, 2_000_000) == 5
+
+
+def test_profiling_reports(capsys):
+    profile_scenario("device_priorities", 10, 2, top=3)
+    trace_scenario("device_priorities", 10, top=3)
+
+    output = capsys.readouterr().out
+    assert "cProfile: device_priorities/10" in output
+    assert "tracemalloc: device_priorities/10" in output
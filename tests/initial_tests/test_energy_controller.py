@@ -0,0 +1,81 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyController import EnergyController
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+@pytest.fixture
+def device_priorities():
+    return {"Security": 1, "Refrigerator": 1, "Lights": 2, "Oven": 3, "Heating": 2, "TV": 2}
+
+
+def test_controller_matches_manage_energy_tick_by_tick(device_priorities):
+    """
+    Em uma sequência aleatória de ticks, o estado do controlador deve ser sempre igual ao de
+    manage_energy e aplicar os deltas emitidos ao estado anterior deve reproduzir o novo estado.
+    """
+    rng = random.Random(34)
+    start = datetime(2025, 10, 16, 0, 0, 0)
+    schedules = [DeviceSchedule("Washer", start + timedelta(minutes=15 * rng.randint(0, 200))) for _ in range(20)]
+    controller = EnergyController(device_priorities, 0.25, (18.0, 24.0), 40.0, schedules)
+    energy_system = SmartEnergyManagementSystem()
+
+    effective = {}
+    for tick in range(2000):
+        current_time = start + timedelta(minutes=15 * (tick % 200))
+        current_price = rng.choice([0.10, 0.20, 0.30])
+        current_temperature = rng.choice([15.0, 21.0, 21.5, 27.0])
+        total = rng.choice([10.0, 39.0, 40.0, 41.5, 400.0])
+
+        changes = controller.update(current_price, current_time, current_temperature, total)
+        expected = energy_system.manage_energy(current_price, 0.25, device_priorities, current_time,
+                                               current_temperature, (18.0, 24.0), 40.0, total, schedules)
+
+        result = controller.result
+        assert result.device_status == expected.device_status
+        assert result.energy_saving_mode == expected.energy_saving_mode
+        assert result.temperature_regulation_active == expected.temperature_regulation_active
+        assert result.total_energy_used == expected.total_energy_used
+
+        effective.update(changes)
+        assert {device: on for device, on in effective.items() if on} == \
+               {device: on for device, on in expected.device_status.items() if on}
+
+
+def test_unchanged_rule_inputs_emit_no_deltas(device_priorities):
+    """
+    Mudanças de preço ou temperatura que não alteram a saída de nenhuma regra não geram deltas.
+    """
+    controller = EnergyController(device_priorities, 0.25, (18.0, 24.0), 40.0)
+    noon = datetime(2025, 10, 16, 12, 0, 0)
+
+    first = controller.update(0.10, noon, 21.0, 10.0)
+    second = controller.update(0.12, noon + timedelta(minutes=5), 22.5, 11.0)
+
+    assert first["Lights"] is True
+    assert second == {}
+    assert controller.result.total_energy_used == 11.0
+
+
+def test_price_change_emits_only_affected_devices(device_priorities):
+    controller = EnergyController(device_priorities, 0.25, (18.0, 24.0), 40.0)
+    noon = datetime(2025, 10, 16, 12, 0, 0)
+    controller.update(0.10, noon, 21.0, 10.0)
+
+    changes = controller.update(0.30, noon, 21.0, 10.0)
+
+    assert changes == {"Lights": False, "Oven": False, "TV": False}
+    assert controller.result.energy_saving_mode is True
+
+
+def test_replacing_priorities_invalidates_cached_rules(device_priorities):
+    controller = EnergyController(device_priorities, 0.25, (18.0, 24.0), 40.0)
+    noon = datetime(2025, 10, 16, 12, 0, 0)
+    controller.update(0.30, noon, 21.0, 10.0)
+
+    controller.device_priorities = {**device_priorities, "Lights": 1}
+    changes = controller.update(0.30, noon, 21.0, 10.0)
+
+    assert changes == {"Lights": True}
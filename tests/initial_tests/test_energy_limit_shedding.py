@@ -0,0 +1,114 @@
+import random
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+def reference_shedding(device_priorities, device_status, total_energy_used_today, energy_usage_limit):
+    """Cópia do laço original de manage_energy, usada como oráculo."""
+    devices_were_on = True
+    while total_energy_used_today >= energy_usage_limit and devices_were_on:
+        devices_to_turn_off = [
+            device for device, priority in device_priorities.items()
+            if device_status.get(device, False) and priority > 1
+        ]
+
+        if not devices_to_turn_off:
+            devices_were_on = False
+            continue
+
+        for device in devices_to_turn_off:
+            if total_energy_used_today < energy_usage_limit:
+                break
+            device_status[device] = False
+            total_energy_used_today -= 1
+    return total_energy_used_today
+
+
+def random_case(rng):
+    names = ["Heating", "Cooling", "Security", "Refrigerator"] + [f"Device{i}" for i in range(rng.randint(0, 30))]
+    rng.shuffle(names)
+    device_priorities = {name: rng.randint(1, 4) for name in names[:rng.randint(0, len(names))]}
+    device_status = {name: rng.random() < 0.6 for name in names if rng.random() < 0.8}
+    energy_usage_limit = rng.choice([0.0, 10.0, 50.0, rng.uniform(0, 100), float("inf")])
+    total_energy_used_today = rng.choice([
+        energy_usage_limit,
+        energy_usage_limit + rng.randint(0, 5),
+        energy_usage_limit + rng.uniform(0, 5000),
+        rng.uniform(0, 100),
+        energy_usage_limit - 0.5,
+    ])
+    return device_priorities, device_status, total_energy_used_today, energy_usage_limit
+
+
+def test_shed_to_limit_matches_original_loop():
+    """
+    Teste de propriedade: para milhares de casos aleatórios (semente fixa), o desligamento em
+    passagem única produz o mesmo estado final e a mesma energia restante que o laço original.
+    """
+    rng = random.Random(2025)
+    energy_system = SmartEnergyManagementSystem()
+
+    for _ in range(5000):
+        device_priorities, device_status, total, limit = random_case(rng)
+        expected_status = dict(device_status)
+        expected_total = reference_shedding(device_priorities, expected_status, total, limit)
+
+        result_total = energy_system.shed_to_limit(device_priorities, device_status, total, limit)
+
+        assert device_status == expected_status
+        assert result_total == expected_total or (result_total != result_total and expected_total != expected_total)
+
+
+def test_manage_energy_matches_original_loop_end_to_end():
+    """
+    manage_energy completo comparado com uma composição que usa o laço original.
+    """
+    rng = random.Random(7)
+    energy_system = SmartEnergyManagementSystem()
+    base_time = datetime(2025, 10, 16, 0, 0, 0)
+
+    for _ in range(2000):
+        device_priorities, _, total, limit = random_case(rng)
+        current_time = base_time + timedelta(hours=rng.randint(0, 23))
+        schedules = [DeviceSchedule(name, current_time if rng.random() < 0.5 else base_time)
+                     for name in list(device_priorities)[:3]]
+        arguments = dict(
+            current_price=rng.uniform(0, 1),
+            price_threshold=0.5,
+            device_priorities=device_priorities,
+            current_time=current_time,
+            current_temperature=rng.uniform(10, 30),
+            desired_temperature_range=(18.0, 24.0),
+            energy_usage_limit=limit,
+            total_energy_used_today=total,
+            scheduled_devices=schedules,
+        )
+
+        result = energy_system.manage_energy(**arguments)
+
+        # Reaplica o laço original sobre o estado anterior ao desligamento
+        unshed = energy_system.manage_energy(**{**arguments, "energy_usage_limit": float("nan"),
+                                                "scheduled_devices": []})
+        expected_status = dict(unshed.device_status)
+        expected_total = reference_shedding(device_priorities, expected_status, total, limit)
+        for schedule in schedules:
+            if schedule.scheduled_time == current_time:
+                expected_status[schedule.device_name] = True
+
+        assert result.device_status == expected_status
+        assert result.total_energy_used == expected_total
+
+
+def test_large_overage_sheds_each_device_once():
+    """
+    Mesmo com excedente de milhares de unidades, cada dispositivo é desligado uma única vez.
+    """
+    energy_system = SmartEnergyManagementSystem()
+    device_priorities = {f"Device{i}": 2 for i in range(100)}
+    device_status = {device: True for device in device_priorities}
+
+    remaining = energy_system.shed_to_limit(device_priorities, device_status, 10000.0, 10.0)
+
+    assert remaining == 9900.0
+    assert not any(device_status.values())
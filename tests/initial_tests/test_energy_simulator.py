@@ -0,0 +1,71 @@
+import math
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.EnergySimulator import EnergySimulator
+from src.energy.HomeProfile import HomeProfile
+
+DEVICE_POWER = {"Security": 0.1, "Refrigerator": 0.2, "Lights": 0.5, "Oven": 2.0, "Heating": 3.0,
+                "Cooling": 2.5, "Washer": 1.2}
+
+
+@pytest.fixture
+def start():
+    return datetime(2025, 10, 16, 0, 0, 0)
+
+
+@pytest.fixture
+def home(start):
+    schedules = [DeviceSchedule("Washer", start + timedelta(hours=3)),
+                 DeviceSchedule("Oven", start + timedelta(days=1, hours=19))]
+    return HomeProfile({"Security": 1, "Refrigerator": 1, "Lights": 2, "Oven": 3},
+                       0.25, (18.0, 24.0), 12.0, schedules)
+
+
+def test_simulation_matches_manage_energy_step_by_step(home, start):
+    """
+    Em dois dias de séries horárias, cada passo deve reproduzir manage_energy usando o consumo
+    acumulado dos passos anteriores, com o total zerado à meia-noite.
+    """
+    rng = random.Random(36)
+    prices = [rng.choice([0.1, 0.2, 0.3, 0.4]) for _ in range(48)]
+    temperatures = [20 + 8 * math.sin(hour / 24 * 2 * math.pi) for hour in range(48)]
+    energy_system = SmartEnergyManagementSystem()
+
+    result = EnergySimulator(DEVICE_POWER).simulate(home, start, prices, temperatures)
+
+    total = 0.0
+    for step in range(48):
+        current_time = start + timedelta(hours=step)
+        if current_time.hour == 0:
+            total = 0.0
+        expected = energy_system.manage_energy(prices[step], 0.25, home.device_priorities, current_time,
+                                               temperatures[step], (18.0, 24.0), 12.0, total,
+                                               home.scheduled_devices)
+        status = result.status_at(step)
+        assert {device: status[device] for device in expected.device_status} == expected.device_status
+        assert bool(result.energy_saving_mode[step]) == expected.energy_saving_mode
+        assert bool(result.temperature_regulation_active[step]) == expected.temperature_regulation_active
+
+        consumption = sum(DEVICE_POWER[device] for device, on in expected.device_status.items() if on)
+        assert result.step_energy[step] == pytest.approx(consumption)
+        total += consumption
+        assert result.total_energy_used[step] == pytest.approx(total)
+
+
+def test_fleet_simulation_returns_one_result_per_home(home, start):
+    simulator = EnergySimulator(DEVICE_POWER)
+    prices = [0.1] * 24
+
+    results = simulator.simulate_fleet([home, home], start, prices, [[21.0] * 24, [15.0] * 24])
+
+    assert len(results) == 2
+    assert all(len(result) == 24 for result in results)
+    assert results[1].total_energy > results[0].total_energy
+
+
+def test_mismatched_series_raise(home, start):
+    with pytest.raises(ValueError):
+        EnergySimulator(DEVICE_POWER).simulate(home, start, [0.1, 0.2], [21.0])
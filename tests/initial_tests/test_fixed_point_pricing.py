@@ -0,0 +1,147 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.BookingBatch import BookingBatch
+from src.flight.BulkRefundProcessor import BulkRefundProcessor
+from src.flight.FlightBookingSystem import FlightBookingSystem, round_half_up
+
+
+@pytest.fixture
+def fixed_point_system():
+    """Instância do FlightBookingSystem operando em centavos inteiros."""
+    return FlightBookingSystem(fixed_point=True)
+
+
+def random_rows(size, seed=11):
+    rng = random.Random(seed)
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    return [
+        (rng.randint(1, 8), booking_time, rng.randint(0, 10), rng.randint(100, 90000),
+         rng.randint(0, 200), rng.random() < 0.3,
+         booking_time + timedelta(minutes=rng.randint(0, 6000)), rng.choice([0, 0, 777, 20000]))
+        for _ in range(size)
+    ]
+
+
+def make_batch(rows):
+    """Converte linhas na ordem de argumentos de book_flight para um BookingBatch colunar."""
+    return BookingBatch(
+        passengers=[row[0] for row in rows],
+        booking_times=[row[1] for row in rows],
+        available_seats=[row[2] for row in rows],
+        current_prices=[row[3] for row in rows],
+        previous_sales=[row[4] for row in rows],
+        departure_times=[row[6] for row in rows],
+        reward_points_available=[row[7] for row in rows],
+        is_cancellations=[row[5] for row in rows],
+    )
+
+
+def test_group_discount_last_minute_in_cents(fixed_point_system):
+    """
+    Mesmo cenário de C5, com o preço em centavos: 475.00 -> 47500 centavos.
+    """
+    result = fixed_point_system.book_flight(
+        passengers=5,
+        booking_time=datetime(2025, 10, 16, 12, 0, 0),
+        available_seats=10,
+        current_price=10000,
+        previous_sales=100,
+        is_cancellation=False,
+        departure_time=datetime(2025, 10, 16, 18, 0, 0),
+        reward_points_available=0
+    )
+
+    assert result.confirmation
+    assert result.total_price == 47500
+    assert isinstance(result.total_price, int)
+    assert not result.points_used
+
+
+def test_partial_refund_in_cents(fixed_point_system):
+    """
+    Mesmo cenário de C6: 47500 - 1000 pontos (1 ponto = 1 centavo) = 46500; reembolso de 50% = 23250.
+    """
+    result = fixed_point_system.book_flight(
+        passengers=5,
+        booking_time=datetime(2025, 10, 16, 12, 0, 0),
+        available_seats=10,
+        current_price=10000,
+        previous_sales=100,
+        is_cancellation=True,
+        departure_time=datetime(2025, 10, 16, 18, 0, 0),
+        reward_points_available=1000
+    )
+
+    assert not result.confirmation
+    assert result.total_price == 0
+    assert result.refund_amount == 23250
+
+
+def test_half_cents_round_up(fixed_point_system):
+    """
+    Frações de meio centavo são arredondadas para cima: 1 * 0.8 * 1 = 0.8 centavo -> 1 e
+    o reembolso de 50% de 10001 centavos é 5000.5 -> 5001.
+    """
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+
+    booking = fixed_point_system.book_flight(1, booking_time, 10, 1, 100, False,
+                                             booking_time + timedelta(days=3), 0)
+    refund = fixed_point_system.book_flight(1, booking_time, 10, 1, 100, True,
+                                            booking_time + timedelta(hours=10), 0)
+
+    assert booking.total_price == 1
+    assert refund.refund_amount == 5001
+    assert round_half_up(5, 10) == 1
+    assert round_half_up(4, 10) == 0
+
+
+def test_insufficient_seats_returns_integer_zeros(fixed_point_system):
+    result = fixed_point_system.book_flight(10, datetime(2025, 10, 16, 12, 0, 0), 2, 10000, 100, False,
+                                            datetime(2025, 10, 19, 12, 0, 0), 0)
+
+    assert not result.confirmation
+    assert result.total_price == 0 and isinstance(result.total_price, int)
+    assert result.refund_amount == 0 and isinstance(result.refund_amount, int)
+
+
+def test_batch_and_scalar_fixed_point_paths_agree(fixed_point_system):
+    """
+    O caminho em lote deve produzir os mesmos totais em centavos que o caminho escalar.
+    """
+    rows = random_rows(400)
+    batch = make_batch(rows)
+
+    results = fixed_point_system.book_flights(batch)
+
+    for result, row in zip(results, rows):
+        expected = fixed_point_system.book_flight(*row)
+        assert (result.confirmation, result.total_price, result.refund_amount, result.points_used) == \
+               (expected.confirmation, expected.total_price, expected.refund_amount, expected.points_used)
+
+
+def test_fixed_point_stays_within_a_cent_of_float_mode(fixed_point_system):
+    """
+    Para preços sem frações de centavo, o modo inteiro difere do modo float em no máximo 1 centavo
+    por etapa de arredondamento.
+    """
+    float_system = FlightBookingSystem()
+    for row in random_rows(400, seed=5):
+        passengers, booking_time, seats, price_cents, sales, cancel, departure, points = row
+        fixed = fixed_point_system.book_flight(*row)
+        floating = float_system.book_flight(passengers, booking_time, seats, price_cents / 100, sales,
+                                            cancel, departure, points)
+        assert abs(fixed.total_price - floating.total_price * 100) <= 3
+        assert abs(fixed.refund_amount - floating.refund_amount * 100) <= 3
+
+
+def test_bulk_refunds_in_fixed_point_match_book_flight(fixed_point_system):
+    rows = random_rows(300, seed=9)
+    batch = make_batch(rows)
+
+    chunks = BulkRefundProcessor(chunk_size=50, fixed_point=True).process_refunds(batch)
+    refunds = [amount for chunk in chunks for amount in chunk.refund_amounts]
+
+    for refund, row in zip(refunds, rows):
+        expected = fixed_point_system.book_flight(*row[:5], True, *row[6:])
+        assert refund == expected.refund_amount
@@ -0,0 +1,97 @@
+import random
+import pytest
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.FleetEnergyManager import FleetEnergyManager
+
+DEVICE_NAMES = ["Security", "Refrigerator", "Lights", "Heating", "Cooling", "Oven", "Washer", "TV", "Dryer"]
+
+
+def random_fleet(homes, seed, profiles=0):
+    """Gera colunas de entrada e a matriz de prioridades para uma frota sintética."""
+    rng = random.Random(seed)
+    shared = [[rng.choice([None, 1, 2, 3]) for _ in DEVICE_NAMES] for _ in range(profiles)]
+    fleet = {
+        "current_prices": [], "price_thresholds": [], "current_hours": [], "current_temperatures": [],
+        "min_temperatures": [], "max_temperatures": [], "energy_usage_limits": [],
+        "total_energy_used_today": [], "device_priorities": [],
+    }
+    for _ in range(homes):
+        fleet["current_prices"].append(rng.uniform(0.05, 0.5))
+        fleet["price_thresholds"].append(rng.choice([0.2, 0.25]))
+        fleet["current_hours"].append(rng.randint(0, 23))
+        fleet["current_temperatures"].append(rng.uniform(10.0, 32.0))
+        fleet["min_temperatures"].append(18.0)
+        fleet["max_temperatures"].append(24.0)
+        limit = rng.choice([20.0, 40.0, 50.0])
+        fleet["energy_usage_limits"].append(limit)
+        fleet["total_energy_used_today"].append(rng.choice([limit - 1, limit, limit + 2.5, limit + 1000]))
+        fleet["device_priorities"].append(list(rng.choice(shared)) if profiles
+                                          else [rng.choice([None, 1, 2, 3]) for _ in DEVICE_NAMES])
+    return fleet
+
+
+def assert_matches_scalar(fleet):
+    energy_system = SmartEnergyManagementSystem()
+    homes = len(fleet["current_prices"])
+
+    result = FleetEnergyManager(DEVICE_NAMES).manage_fleet(**fleet)
+
+    assert len(result) == homes
+    for home in range(homes):
+        device_priorities = {name: priority for name, priority in zip(DEVICE_NAMES, fleet["device_priorities"][home])
+                             if priority is not None}
+        expected = energy_system.manage_energy(
+            current_price=fleet["current_prices"][home],
+            price_threshold=fleet["price_thresholds"][home],
+            device_priorities=device_priorities,
+            current_time=datetime(2025, 10, 16, fleet["current_hours"][home], 30, 0),
+            current_temperature=fleet["current_temperatures"][home],
+            desired_temperature_range=(fleet["min_temperatures"][home], fleet["max_temperatures"][home]),
+            energy_usage_limit=fleet["energy_usage_limits"][home],
+            total_energy_used_today=fleet["total_energy_used_today"][home],
+            scheduled_devices=[],
+        )
+
+        status = result.status_for(home)
+        assert {device: status[device] for device in expected.device_status} == expected.device_status
+        assert not any(on for device, on in status.items() if device not in expected.device_status)
+        assert bool(result.energy_saving_mode[home]) == expected.energy_saving_mode
+        assert bool(result.temperature_regulation_active[home]) == expected.temperature_regulation_active
+        assert result.total_energy_used[home] == expected.total_energy_used
+
+
+def test_fleet_matches_scalar_manage_energy():
+    """
+    Cada casa da frota deve produzir o mesmo estado de dispositivos, modos e energia restante
+    que manage_energy chamado individualmente.
+    """
+    assert_matches_scalar(random_fleet(1500, seed=12))
+
+
+def test_shared_profiles_match_scalar_manage_energy():
+    """
+    Casas que compartilham linhas de prioridade são avaliadas por perfil e espalhadas para as casas,
+    com o mesmo resultado de manage_energy.
+    """
+    assert_matches_scalar(random_fleet(1500, seed=5, profiles=12))
+    assert_matches_scalar(random_fleet(1500, seed=6, profiles=400))
+
+
+def test_heating_and_cooling_columns_are_added():
+    """
+    Aquecimento e resfriamento sempre possuem coluna, mesmo fora da lista de dispositivos.
+    """
+    manager = FleetEnergyManager(["Lights"])
+
+    result = manager.manage_fleet([0.1], [0.2], [12], [15.0], [18.0], [24.0], [50.0], [10.0], [[2]])
+
+    assert result.device_names == ["Lights", "Heating", "Cooling"]
+    assert result.status_for(0) == {"Lights": True, "Heating": True, "Cooling": False}
+    assert result.temperature_regulation_active[0] == 1
+
+
+def test_mismatched_columns_raise():
+    with pytest.raises(ValueError):
+        FleetEnergyManager(["Lights"]).manage_fleet([0.1, 0.2], [0.2], [12], [20.0], [18.0], [24.0],
+                                                    [50.0], [10.0], [[1]])
@@ -0,0 +1,54 @@
+from benchmarks.flight_benchmark import PATHS, WORKLOADS, generate_workload, run_benchmarks
+from benchmarks.harness import find_regressions, percentile
+
+
+def test_workloads_are_reproducible():
+    """
+    A mesma semente deve gerar exatamente a mesma carga sintética.
+    """
+    first = generate_workload(200, 0.5, "groups", "last_minute", seed=7)
+    second = generate_workload(200, 0.5, "groups", "last_minute", seed=7)
+
+    assert list(first.booking_rows()) == list(second.booking_rows())
+
+
+def test_workload_respects_distributions():
+    """
+    A proporção de cancelamentos e a janela de partida devem seguir os parâmetros da carga.
+    """
+    batch = generate_workload(2000, 0.0, "solo", "advance", seed=1)
+
+    assert not any(batch.is_cancellations)
+    assert set(batch.passengers) <= {1, 2}
+    for booking_time, departure_time in zip(batch.booking_times, batch.departure_times):
+        assert (departure_time - booking_time).total_seconds() / 3600 >= 48
+
+
+def test_run_benchmarks_reports_every_path():
+    """
+    Execução reduzida: todos os caminhos de todas as cargas devem reportar vazão e p99.
+    """
+    results = run_benchmarks(size=64, seed=3, chunk_size=16, workers=2, repeat=1, allocations=False)
+
+    assert set(results) == {f"{workload}/{path}" for workload in WORKLOADS for path in PATHS}
+    for metrics in results.values():
+        assert metrics["throughput"] > 0
+        assert metrics["p99_us"] >= metrics["p50_us"]
+
+
+def test_find_regressions_flags_slower_results():
+    """
+    Vazão menor ou latência maior que o fator de tolerância deve ser reportada como regressão.
+    """
+    baseline = {"w/scalar": {"throughput": 1000.0, "p99_us": 10.0, "peak_kib": 100.0}}
+
+    ok = {"w/scalar": {"throughput": 800.0, "p99_us": 12.0, "peak_kib": 110.0}}
+    slow = {"w/scalar": {"throughput": 400.0, "p99_us": 25.0, "peak_kib": 100.0}}
+
+    assert find_regressions(ok, baseline, tolerance=1.0) == []
+    assert len(find_regressions(slow, baseline, tolerance=1.0)) == 2
+
+
+def test_percentile():
+    assert percentile(list(range(1, 101)), 0.99) == 99
+    assert percentile([], 0.99) == 0.0
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime
 from src.flight.FlightBookingSystem import FlightBookingSystem
 from src.flight.BookingResult import BookingResult
+from src.flight.BookingBatch import BookingBatch
 
 @pytest.fixture
 def flight_system():
@@ -168,4 +169,35 @@ def test_case_c6_cancellation_partial_refund(flight_system):
     assert not result.confirmation
     assert result.total_price == 0.0
     assert result.refund_amount == 232.5
-    assert not result.points_used
\ No newline at end of file
+    assert not result.points_used
+
+def test_book_flights_matches_book_flight(flight_system):
+    """
+    O caminho em lote (book_flights) deve produzir exatamente os mesmos resultados
+    que chamadas individuais de book_flight, incluindo cancelamentos.
+    """
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    batch = BookingBatch(
+        passengers=[10, 5, 5, 1, 5, 6],
+        booking_times=[booking_time] * 6,
+        available_seats=[2, 50, 50, 10, 10, 10],
+        current_prices=[100.0, 1.0, 10.0, 10.0, 100.0, 321.45],
+        previous_sales=[100, 1, 10, 10, 100, 77],
+        departure_times=[
+            datetime(2025, 10, 19, 12, 0, 0), datetime(2025, 10, 16, 20, 0, 0),
+            datetime(2025, 10, 19, 12, 0, 0), datetime(2025, 10, 16, 18, 0, 0),
+            datetime(2025, 10, 16, 18, 0, 0), datetime(2025, 10, 18, 11, 59, 59),
+        ],
+        reward_points_available=[0, 20000, 500, 20000, 1000, 1234],
+        is_cancellations=[False, False, True, False, True, True],
+    )
+
+    results = flight_system.book_flights(batch)
+
+    assert len(results) == len(batch)
+    for result, row in zip(results, batch.booking_rows()):
+        expected = flight_system.book_flight(*row)
+        assert result.confirmation == expected.confirmation
+        assert result.total_price == expected.total_price
+        assert result.refund_amount == expected.refund_amount
+        assert result.points_used == expected.points_used
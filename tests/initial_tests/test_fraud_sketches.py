@@ -0,0 +1,120 @@
+import random
+import pytest
+from datetime import timedelta
+from benchmarks.fraud_sketch_benchmark import main as sketch_benchmark
+from src.fraud.BlacklistScreen import BlacklistScreen
+from src.fraud.BloomFilter import BloomFilter
+from src.fraud.CountMinSketch import CountMinSketch
+from src.fraud.FleetVelocity import FleetVelocity
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.Transaction import Transaction
+from src.fraud.WindowedSketch import WindowedSketch
+
+
+def test_count_min_never_underestimates_and_respects_epsilon():
+    """
+    O count-min sketch nunca subestima e o erro fica dentro de epsilon * total para quase todas as chaves.
+    """
+    rng = random.Random(1)
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    exact = {}
+    for _ in range(20000):
+        key = f"merchant-{int(rng.paretovariate(1.2))}"
+        sketch.add(key)
+        exact[key] = exact.get(key, 0) + 1
+
+    errors = [sketch.estimate(key) - count for key, count in exact.items()]
+    assert min(errors) >= 0
+    assert sum(error > 0.01 * 20000 for error in errors) <= 0.01 * len(errors) + 1
+    assert sketch.nbytes == 4 * sketch.width * sketch.depth
+
+
+def test_windowed_sketch_expires_old_buckets(now):
+    sketch = WindowedSketch(window_minutes=60, bucket_minutes=5)
+    sketch.add("merchant-1", now - timedelta(minutes=70))
+    sketch.add("merchant-1", now - timedelta(minutes=30))
+    sketch.add("merchant-1", now, count=2)
+
+    assert sketch.estimate("merchant-1", now) == 3
+    assert sketch.estimate("merchant-1", now + timedelta(minutes=40)) == 2
+    assert sketch.estimate("merchant-1", now + timedelta(hours=2)) == 0
+
+
+def test_windowed_sketch_memory_is_fixed(now):
+    """
+    A memória do sketch não depende do número de chaves distintas.
+    """
+    sketch = WindowedSketch(window_minutes=60, bucket_minutes=5, epsilon=0.01)
+    size = sketch.nbytes
+    for index in range(5000):
+        sketch.add(f"merchant-{index}", now + timedelta(seconds=index))
+
+    assert sketch.nbytes == size
+    assert len(sketch.total.table) == sketch.total.width * sketch.total.depth
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    items = [f"location-{index}" for index in range(5000)]
+    bloom = BloomFilter.from_items(items, error_rate=0.01)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{index}" in bloom for index in range(20000))
+    assert false_positives < 0.02 * 20000
+
+
+def test_blacklist_screen_matches_exact_membership():
+    """
+    O pré-filtro só descarta locais fora da lista; os positivos são confirmados no conjunto exato.
+    """
+    screen = BlacklistScreen([f"location-{index}" for index in range(100)], error_rate=0.05)
+    queries = [f"location-{index}" for index in range(2000)]
+
+    assert [query in screen for query in queries] == [index < 100 for index in range(2000)]
+    assert screen.screened + screen.false_positives == 1900
+    assert len(screen) == 100
+
+
+def test_check_for_fraud_accepts_blacklist_screen(now):
+    fraud_system = FraudDetectionSystem()
+    transaction = Transaction(100, now, "Campinas")
+
+    from_list = fraud_system.check_for_fraud(transaction, [], ["Campinas", "Recife"])
+    from_screen = fraud_system.check_for_fraud(transaction, [], BlacklistScreen(["Campinas", "Recife"]))
+
+    assert from_screen.is_blocked == from_list.is_blocked is True
+    assert from_screen.risk_score == from_list.risk_score == 100
+
+
+def test_fleet_velocity_flags_card_testing_on_a_merchant(now):
+    """
+    Muitas transações de contas diferentes no mesmo lojista devem exigir verificação.
+    """
+    fleet = FleetVelocity(window_minutes=60, max_merchant_count=5, risk_score=25)
+    fraud_system = FraudDetectionSystem(fleet_velocity=fleet)
+
+    results = [
+        fraud_system.check_account(Transaction(1.0, now + timedelta(minutes=index), "Campinas", "loja-1"),
+                                   fraud_system.new_account_state(), [])
+        for index in range(7)
+    ]
+    other_merchant = fraud_system.check_for_fraud(
+        Transaction(1.0, now + timedelta(minutes=8), "Campinas", "loja-2"), [], [])
+    expired = fraud_system.check_for_fraud(Transaction(1.0, now + timedelta(hours=3), "Campinas", "loja-1"), [], [])
+
+    assert [result.verification_required for result in results] == [False] * 6 + [True]
+    assert results[-1].risk_score == 25
+    assert not other_merchant.verification_required
+    assert not expired.verification_required
+
+
+def test_fleet_velocity_requires_a_limit():
+    with pytest.raises(ValueError):
+        FleetVelocity()
+
+
+def test_sketch_benchmark_runs(capsys):
+    assert sketch_benchmark(["--events", "2000", "--keys", "500", "--blacklist", "300"]) == 0
+
+    output = capsys.readouterr().out
+    assert "count-min window" in output
+    assert "bloom only" in output
@@ -0,0 +1,126 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.ItineraryLeg import ItineraryLeg
+
+
+@pytest.fixture
+def flight_system():
+    return FlightBookingSystem()
+
+
+@pytest.fixture
+def booking_time():
+    return datetime(2025, 10, 16, 12, 0, 0)
+
+
+def test_single_leg_itinerary_matches_book_flight(flight_system, booking_time):
+    """
+    Um itinerário de uma perna deve reproduzir exatamente book_flight, inclusive cancelamentos.
+    """
+    rng = random.Random(3)
+    for _ in range(300):
+        passengers = rng.randint(1, 8)
+        seats = rng.randint(0, 10)
+        price = round(rng.uniform(1.0, 900.0), 2)
+        sales = rng.randint(0, 200)
+        departure = booking_time + timedelta(minutes=rng.randint(0, 6000))
+        points = rng.choice([0, 500, 20000])
+        cancellation = rng.random() < 0.3
+
+        expected = flight_system.book_flight(passengers, booking_time, seats, price, sales,
+                                             cancellation, departure, points)
+        result = flight_system.book_itinerary(passengers, booking_time,
+                                              [ItineraryLeg(seats, price, sales, departure)],
+                                              cancellation, points)
+
+        assert result.total.confirmation == expected.confirmation
+        assert result.total.total_price == expected.total_price
+        assert result.total.refund_amount == expected.refund_amount
+        assert result.total.points_used == expected.points_used
+
+
+def test_reward_points_are_applied_once_across_legs(flight_system, booking_time):
+    """
+    Duas pernas de 80.0 (sem taxa de última hora) e 10000 pontos (100.0): a primeira perna
+    absorve 80.0 e a segunda os 20.0 restantes, totalizando 60.0.
+    """
+    legs = [
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(days=3)),
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(days=3, hours=4)),
+    ]
+
+    result = flight_system.book_itinerary(1, booking_time, legs, False, 10000)
+
+    assert result.total.confirmation
+    assert [leg.total_price for leg in result.legs] == [0.0, 60.0]
+    assert [leg.points_used for leg in result.legs] == [True, True]
+    assert result.total.total_price == 60.0
+    assert result.total.points_used
+
+
+def test_legs_are_confirmed_atomically(flight_system, booking_time):
+    """
+    Se qualquer perna não tiver assentos, nenhuma é confirmada e o inventário não é alterado.
+    """
+    legs = [
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(days=3)),
+        ItineraryLeg(2, 100.0, 100, booking_time + timedelta(days=3, hours=4)),
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(days=4)),
+    ]
+
+    result = flight_system.book_itinerary(3, booking_time, legs, False, 0)
+
+    assert not result.total.confirmation
+    assert not any(leg.confirmation for leg in result.legs)
+    assert [leg.available_seats for leg in legs] == [10, 2, 10]
+
+
+def test_confirmed_itinerary_reserves_seats_on_every_leg(flight_system, booking_time):
+    legs = [
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(days=3)),
+        ItineraryLeg(4, 100.0, 100, booking_time + timedelta(days=3, hours=4)),
+    ]
+
+    result = flight_system.book_itinerary(3, booking_time, legs, False, 0)
+
+    assert result.total.confirmation
+    assert result.total.total_price == 480.0
+    assert [leg.available_seats for leg in legs] == [7, 1]
+
+
+def test_cancellation_refunds_each_leg_by_its_own_departure(flight_system, booking_time):
+    """
+    A perna com 48h ou mais recebe reembolso total; a de 30h recebe 50%.
+    """
+    legs = [
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(hours=30)),
+        ItineraryLeg(10, 100.0, 100, booking_time + timedelta(hours=50)),
+    ]
+
+    result = flight_system.book_itinerary(1, booking_time, legs, True, 0)
+
+    assert not result.total.confirmation
+    assert [leg.refund_amount for leg in result.legs] == [40.0, 80.0]
+    assert result.total.refund_amount == 120.0
+    assert [leg.available_seats for leg in legs] == [10, 10]
+
+
+def test_fixed_point_itinerary_in_cents(booking_time):
+    flight_system = FlightBookingSystem(fixed_point=True)
+    legs = [
+        ItineraryLeg(10, 10000, 100, booking_time + timedelta(hours=6)),
+        ItineraryLeg(10, 10000, 100, booking_time + timedelta(days=3)),
+    ]
+
+    result = flight_system.book_itinerary(5, booking_time, legs, False, 1000)
+
+    # Perna 1: (40000 + 10000) * 0.95 = 47500 - 1000 pontos = 46500; perna 2: 40000 * 0.95 = 38000
+    assert [leg.total_price for leg in result.legs] == [46500, 38000]
+    assert result.total.total_price == 84500
+
+
+def test_empty_itinerary_raises(flight_system, booking_time):
+    with pytest.raises(ValueError):
+        flight_system.book_itinerary(1, booking_time, [], False, 0)
@@ -0,0 +1,74 @@
+import random
+import pytest
+from datetime import timedelta
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.MultiWindowVelocity import MultiWindowVelocity
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+def test_single_pass_matches_one_scan_per_window(now):
+    """
+    As contagens e somas de todas as janelas, obtidas em uma única passada, devem ser iguais às
+    de uma varredura separada por janela com a mesma fronteira (<= janela).
+    """
+    rng = random.Random(41)
+    previous = [Transaction(rng.uniform(1, 500), now - timedelta(seconds=rng.randint(-600, 2 * 86400)), "SP")
+                for _ in range(2000)]
+    current = Transaction(100.0, now, "SP")
+
+    features = MultiWindowVelocity((1440, 5, 60)).extract(current, previous)
+
+    for window in (5, 60, 1440):
+        inside = [t for t in previous if (now - t.timestamp).total_seconds() / 60 <= window]
+        assert features.count(window) == len(inside)
+        assert features.amount(window) == pytest.approx(sum(t.amount for t in inside))
+
+
+def test_window_boundary_is_inclusive(now):
+    previous = [Transaction(10.0, now - timedelta(minutes=5), "SP"),
+                Transaction(20.0, now - timedelta(minutes=5, seconds=1), "SP"),
+                Transaction(30.0, now - timedelta(minutes=60), "SP")]
+
+    features = MultiWindowVelocity((5, 60)).extract(Transaction(1.0, now, "SP"), previous)
+
+    assert features.counts == {5: 1, 60: 3}
+    assert features.amounts == {5: 10.0, 60: 60.0}
+
+
+def test_new_window_rules_share_the_velocity_pass(now):
+    """
+    Uma regra de 5 minutos com mais de 3 transações exige verificação sem bloquear; a regra
+    de 24 horas por valor acumulado bloqueia.
+    """
+    fraud_system = FraudDetectionSystem(velocity_rules=[
+        VelocityRule(5, max_count=3, risk_score=15),
+        VelocityRule(1440, max_amount=5000.0, risk_score=25, block=True),
+    ])
+    burst = [Transaction(50.0, now - timedelta(minutes=2), "SP") for _ in range(4)]
+
+    result = fraud_system.check_for_fraud(Transaction(80.0, now, "SP"), burst, [])
+    assert result.verification_required
+    assert not result.is_blocked
+    assert result.risk_score == 15
+
+    daily = [Transaction(2000.0, now - timedelta(hours=hours), "SP") for hours in (3, 6, 9)]
+    result = fraud_system.check_for_fraud(Transaction(80.0, now, "SP"), daily, [])
+    assert result.is_blocked
+    assert result.risk_score == 25
+
+
+def test_default_system_keeps_the_original_velocity_rule(now):
+    previous = [Transaction(20.0, now - timedelta(minutes=59), "SP") for _ in range(11)]
+
+    result = FraudDetectionSystem().check_for_fraud(Transaction(80.0, now, "SP"), previous, [])
+
+    assert result.is_blocked
+    assert result.risk_score == 30
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        MultiWindowVelocity(())
+    with pytest.raises(ValueError):
+        VelocityRule(60)
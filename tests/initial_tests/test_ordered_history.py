@@ -0,0 +1,91 @@
+import random
+from datetime import timedelta
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.OrderedHistory import OrderedHistory
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+def late_arrivals(stream, seed, lateness_seconds):
+    # Cada evento chega com atraso aleatório limitado à tolerância
+    rng = random.Random(seed)
+    return sorted(stream, key=lambda transaction: transaction.timestamp
+                  + timedelta(seconds=rng.uniform(0, lateness_seconds)))
+
+
+def test_late_events_use_event_time_predecessors(now, transaction_stream):
+    """
+    Um evento atrasado deve ser avaliado contra as transações anteriores no horário do evento,
+    como se o histórico recebido até então estivesse ordenado.
+    """
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(10, max_count=3)],
+                                        amount_rule=AmountAnomalyRule(window=20, min_history=5))
+    history = fraud_system.new_ordered_history(timedelta(minutes=10))
+    arrived = []
+
+    stream = transaction_stream(11, 600, now, gaps=(20, 60, 240, 900, 2400), amounts=(30.0, 60.0, 15000.0),
+                                locations=("SP", "RJ"))
+    for transaction in late_arrivals(stream, 11, 590):
+        preceding = sorted((previous for previous in arrived if previous.timestamp <= transaction.timestamp),
+                           key=lambda previous: previous.timestamp)
+        expected = fraud_system.check_for_fraud(transaction, preceding, [])
+        result = fraud_system.check_ordered(transaction, history, [])
+        arrived.append(transaction)
+
+        assert (result.is_fraudulent, result.is_blocked, result.verification_required, result.risk_score) == \
+               (expected.is_fraudulent, expected.is_blocked, expected.verification_required, expected.risk_score)
+    assert history.late_events == 0
+
+
+def test_location_change_uses_the_event_time_neighbour(now):
+    fraud_system = FraudDetectionSystem()
+    history = fraud_system.new_ordered_history(timedelta(minutes=30))
+
+    fraud_system.check_ordered(Transaction(20, now - timedelta(minutes=40), "SP"), history, [])
+    fraud_system.check_ordered(Transaction(20, now, "RJ"), history, [])
+    late = fraud_system.check_ordered(Transaction(20, now - timedelta(minutes=10), "SP"), history, [])
+
+    arrival_order = fraud_system.check_for_fraud(Transaction(20, now - timedelta(minutes=10), "SP"),
+                                                 [Transaction(20, now, "RJ")], [])
+    assert arrival_order.is_fraudulent
+    assert not late.is_fraudulent
+    assert [transaction.location for transaction in history.transactions] == ["SP", "SP", "RJ"]
+
+
+def test_events_behind_the_watermark_are_rejected(now):
+    """
+    Eventos mais antigos que o watermark não são avaliados e ficam contabilizados.
+    """
+    fraud_system = FraudDetectionSystem()
+    history = fraud_system.new_ordered_history(timedelta(minutes=5))
+
+    fraud_system.check_ordered(Transaction(20, now, "SP"), history, [])
+    result = fraud_system.check_ordered(Transaction(20, now - timedelta(minutes=6), "SP"), history, [])
+
+    assert result is None
+    assert history.late_events == 1
+    assert history.watermark == now - timedelta(minutes=5)
+    assert len(history) == 1
+
+
+def test_history_is_pruned_behind_watermark_and_retention(now):
+    history = OrderedHistory(timedelta(minutes=5), timedelta(minutes=60))
+    for minute in range(0, 600, 2):
+        history.insert(Transaction(20, now + timedelta(minutes=minute), "SP"))
+
+    assert len(history) <= 34
+    assert history.transactions[0].timestamp >= history.watermark - timedelta(minutes=60)
+
+
+def test_history_keeps_min_events_for_the_amount_rule(now):
+    """
+    A regra de valores por últimas N transações exige manter N eventos mesmo fora da retenção.
+    """
+    fraud_system = FraudDetectionSystem(amount_rule=AmountAnomalyRule(window=40))
+    history = fraud_system.new_ordered_history()
+    for hour in range(100):
+        history.insert(Transaction(20, now + timedelta(hours=hour), "SP"))
+
+    assert len(history) == 40
+    assert len(history.before(len(history) - 1)) == 39
@@ -0,0 +1,165 @@
+import random
+import pytest
+from datetime import timedelta
+from benchmarks.fraud_partition_benchmark import main as partition_benchmark
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FleetVelocity import FleetVelocity
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.PartitionRules import PartitionRules
+from src.fraud.PartitionedRuleDispatcher import PartitionedRuleDispatcher
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+# Uma transação por minuto, em lojas e canais variados
+BATCH_STREAM = dict(gaps=(60,), amounts=(50.0, 3000.0, 12000.0), locations=("SP", "RJ", "Recife"),
+                    channels=("web", "pos"))
+
+
+def with_histories(stream, seed):
+    # Cada transação recebe um histórico ordenado de até 14 transações anteriores na mesma loja
+    rng = random.Random(seed)
+    items = []
+    for transaction in stream:
+        previous = sorted((Transaction(rng.choice([20.0, 700.0]),
+                                       transaction.timestamp - timedelta(minutes=rng.randint(1, 90)),
+                                       rng.choice(["SP", "RJ"]), transaction.merchant)
+                           for _ in range(rng.randint(0, 14))),
+                          key=lambda previous_transaction: previous_transaction.timestamp)
+        items.append((transaction, previous))
+    return items
+
+
+def test_default_rules_match_check_for_fraud(now, transaction_stream, result_tuple):
+    """
+    Sem regras por partição, o despacho em lote deve reproduzir check_for_fraud na ordem original.
+    """
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(15, max_amount=2000)])
+    dispatcher = PartitionedRuleDispatcher(default_rules=PartitionRules(velocity_rules=[VelocityRule(15, max_amount=2000)]))
+    stream = transaction_stream(1, 300, now, merchants=["loja-1", "loja-2", None], **BATCH_STREAM)
+    items = with_histories(stream, 1)
+
+    expected = [result_tuple(fraud_system.check_for_fraud(transaction, previous, ["Recife"]))
+                for transaction, previous in items]
+
+    assert [result_tuple(result) for result in dispatcher.check_batch(items, ["Recife"])] == expected
+    assert [result_tuple(dispatcher.check(transaction, previous, ["Recife"]))
+            for transaction, previous in items] == expected
+
+
+def test_amount_and_fleet_rules_match_check_for_fraud(now, transaction_stream, result_tuple):
+    """
+    Com amount_rule e fleet_velocity, o lote deve reproduzir check_for_fraud em sequência,
+    inclusive a contagem da frota, que depende da ordem das transações.
+    """
+    def rules():
+        return dict(amount_rule=AmountAnomalyRule(min_history=3, risk_score=25),
+                    fleet_velocity=FleetVelocity(max_location_count=20, max_merchant_count=12))
+
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(15, max_amount=2000)], **rules())
+    dispatcher = PartitionedRuleDispatcher(
+        {"loja-1": PartitionRules(velocity_rules=[VelocityRule(15, max_amount=2000)])},
+        default_rules=PartitionRules(velocity_rules=[VelocityRule(15, max_amount=2000)]), **rules())
+    plain = PartitionedRuleDispatcher(default_rules=PartitionRules(velocity_rules=[VelocityRule(15, max_amount=2000)]))
+    stream = transaction_stream(3, 300, now, merchants=["loja-1", "loja-2", None], **BATCH_STREAM)
+    items = with_histories(stream, 3)
+
+    expected = [result_tuple(fraud_system.check_for_fraud(transaction, previous, ["Recife"]))
+                for transaction, previous in items]
+    results = [result_tuple(result) for result in dispatcher.check_batch(items, ["Recife"])]
+
+    assert results == expected
+    # As duas regras de fato dispararam em parte do lote
+    assert results != [result_tuple(result) for result in plain.check_batch(items, ["Recife"])]
+    assert dispatcher.fleet_velocity.is_triggered(items[-1][0])
+
+
+def test_fleet_rule_keeps_input_order_across_partitions(now, transaction_stream, result_tuple):
+    rules = {f"loja-{index}": PartitionRules(large_amount=1000 * (index + 1)) for index in range(3)}
+    stream = transaction_stream(4, 200, now, merchants=["loja-0", "loja-1", "loja-2", "padaria"], **BATCH_STREAM)
+    items = with_histories(stream, 4)
+    batch = PartitionedRuleDispatcher(rules, fleet_velocity=FleetVelocity(max_location_count=15))
+    single = PartitionedRuleDispatcher(rules, fleet_velocity=FleetVelocity(max_location_count=15))
+
+    expected = [result_tuple(single.check(transaction, previous, [])) for transaction, previous in items]
+
+    assert [result_tuple(result) for result in batch.check_batch(items, [])] == expected
+
+
+def test_rules_changed_in_place_are_recompiled(now):
+    """
+    Alterar um PartitionRules no lugar, sem set_rules, não pode deixar o conjunto compilado desatualizado.
+    """
+    rules = {"loja-1": PartitionRules(large_amount=20000), "loja-2": PartitionRules(large_amount=20000)}
+    default_rules = PartitionRules()
+    dispatcher = PartitionedRuleDispatcher(rules, default_rules)
+    items = [(Transaction(15000.0, now, "SP", merchant), []) for merchant in ("loja-1", "loja-2", "padaria")]
+
+    assert [result.is_fraudulent for result in dispatcher.check_batch(items, [])] == [False, False, True]
+
+    rules["loja-1"].large_amount = 1000
+    default_rules.large_amount = 50000
+    del rules["loja-2"]
+
+    assert [result.is_fraudulent for result in dispatcher.check_batch(items, [])] == [True, False, False]
+    assert dispatcher.check(*items[0], []).is_fraudulent
+
+
+def test_merchant_specific_thresholds(now, result_tuple):
+    dispatcher = PartitionedRuleDispatcher({"joalheria": PartitionRules(large_amount=20000),
+                                            "farmacia": PartitionRules(large_amount=500, max_hourly_count=1)})
+    history = [Transaction(10.0, now - timedelta(minutes=minutes), "SP") for minutes in (50, 40)]
+    items = [(Transaction(15000.0, now, "SP", "joalheria"), []),
+             (Transaction(800.0, now, "SP", "farmacia"), history),
+             (Transaction(15000.0, now, "SP", "padaria"), [])]
+
+    jewelry, pharmacy, bakery = dispatcher.check_batch(items, [])
+
+    assert result_tuple(jewelry) == (False, False, False, 0)
+    assert result_tuple(pharmacy) == (True, True, True, 80)
+    assert result_tuple(bakery) == (True, False, True, 50)
+
+
+def test_partition_by_channel(now):
+    dispatcher = PartitionedRuleDispatcher({"pos": PartitionRules(large_amount=100)}, partition_by="channel")
+    items = [(Transaction(500.0, now, "SP", "loja-1", "pos"), []), (Transaction(500.0, now, "SP", "loja-1", "web"), [])]
+
+    pos, web = dispatcher.check_batch(items, [])
+
+    assert pos.is_fraudulent and not web.is_fraudulent
+
+
+def test_rule_sets_are_shared_and_evicted(now, transaction_stream):
+    """
+    Partições com limites iguais compartilham o conjunto compilado; o cache descarta as menos usadas.
+    """
+    rules = {f"loja-{index}": PartitionRules(large_amount=1000 * (index % 3 + 1)) for index in range(30)}
+    dispatcher = PartitionedRuleDispatcher(rules, max_compiled=10)
+    stream = transaction_stream(2, 200, now, merchants=[f"loja-{index}" for index in range(30)], **BATCH_STREAM)
+    items = with_histories(stream, 2)
+
+    dispatcher.check_batch(items, [])
+
+    assert len(dispatcher) == 10
+    assert dispatcher.evictions >= 20
+    assert dispatcher.compilations <= 3 + dispatcher.evictions
+    assert dispatcher.rule_set("loja-0") is dispatcher.rule_set("loja-3")
+
+    dispatcher.set_rules("loja-0", PartitionRules(large_amount=1))
+    assert dispatcher.rule_set("loja-0").evaluator.large_amount == 1
+    assert dispatcher.rule_set("loja-3").evaluator.large_amount == 1000
+
+
+def test_dispatcher_validates_configuration():
+    with pytest.raises(ValueError):
+        PartitionedRuleDispatcher(partition_by="location")
+    with pytest.raises(ValueError):
+        PartitionedRuleDispatcher(max_compiled=0)
+
+
+def test_partition_benchmark_runs(capsys):
+    assert partition_benchmark(["--transactions", "200", "--partitions", "5", "50", "--repeat", "1"]) == 0
+
+    output = capsys.readouterr().out
+    assert "check_batch, 50 partitions" in output
+    assert "check_for_fraud, global rules" in output
@@ -0,0 +1,93 @@
+import random
+import pytest
+from array import array
+from datetime import datetime, timedelta
+from src.flight.BookingBatch import BookingBatch
+from src.flight.ColumnarFile import read_columns, write_columns
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.RepricingJob import RepricingJob
+
+
+def make_batch(size, cancellation_ratio, seed, in_cents=False):
+    """Gera reservas sintéticas e reprodutíveis, com preços em reais ou em centavos."""
+    rng = random.Random(seed)
+    booking_time = datetime(2025, 10, 16, 12, 0, 0)
+    prices = [rng.choice((99.9, 149.9, 249.9, 499.9, 899.9)) for _ in range(size)]
+    return BookingBatch(
+        passengers=[rng.randint(1, 8) for _ in range(size)],
+        booking_times=[booking_time] * size,
+        available_seats=[rng.randint(0, 12) for _ in range(size)],
+        current_prices=[round(price * 100) for price in prices] if in_cents else prices,
+        previous_sales=[rng.randrange(0, 200, 10) for _ in range(size)],
+        departure_times=[booking_time + timedelta(minutes=rng.randint(0, 6000)) for _ in range(size)],
+        reward_points_available=[rng.choice((0, 0, 0, 1000, 5000)) for _ in range(size)],
+        is_cancellations=[rng.random() < cancellation_ratio for _ in range(size)],
+    )
+
+
+def assert_matches_book_flight(columns, batch, system):
+    for i, row in enumerate(batch.booking_rows()):
+        expected = system.book_flight(*row)
+        assert bool(columns["confirmation"][i]) == expected.confirmation
+        assert columns["total_price"][i] == expected.total_price
+        assert columns["refund_amount"][i] == expected.refund_amount
+        assert bool(columns["points_used"][i]) == expected.points_used
+
+
+def test_repricing_matches_book_flight(tmp_path):
+    """
+    O reprecificador com pool de processos deve gravar exatamente os valores de book_flight.
+    """
+    batch = make_batch(3000, 0.3, seed=21)
+    output_path = str(tmp_path / "repricing.cols")
+
+    summary = RepricingJob(workers=2, shard_size=500).run(batch, output_path)
+
+    assert summary.rows_done == summary.rows_total == len(batch)
+    assert_matches_book_flight(read_columns(output_path), batch, FlightBookingSystem())
+
+
+def test_repricing_in_fixed_point(tmp_path):
+    batch = make_batch(1000, 0.5, seed=4, in_cents=True)
+    output_path = str(tmp_path / "repricing.cols")
+
+    RepricingJob(workers=2, shard_size=300, fixed_point=True).run(batch, output_path)
+    columns = read_columns(output_path)
+
+    assert columns["total_price"].typecode == "q"
+    assert_matches_book_flight(columns, batch, FlightBookingSystem(fixed_point=True))
+
+
+def test_progress_is_reported_per_shard(tmp_path):
+    """
+    O callback de progresso recebe uma atualização por shard, com contagem crescente de linhas.
+    """
+    batch = make_batch(1000, 0.0, seed=8)
+    updates = []
+
+    RepricingJob(workers=2, shard_size=250).run(batch, str(tmp_path / "out.cols"), progress=updates.append)
+
+    assert [update.rows_done for update in updates] == [250, 500, 750, 1000]
+    assert all(update.rows_total == 1000 for update in updates)
+    assert updates[-1].rows_per_second > 0
+
+
+def test_empty_batch(tmp_path):
+    batch = BookingBatch([], [], [], [], [], [], [])
+    output_path = str(tmp_path / "empty.cols")
+
+    summary = RepricingJob(workers=1).run(batch, output_path)
+
+    assert summary.rows_done == 0
+    assert all(len(column) == 0 for column in read_columns(output_path).values())
+
+
+def test_columnar_file_roundtrip_and_column_selection(tmp_path):
+    path = str(tmp_path / "columns.cols")
+    write_columns(path, {"a": array("q", [1, 2, 3]), "b": array("d", [0.5, 1.5, 2.5])})
+
+    assert read_columns(path) == {"a": array("q", [1, 2, 3]), "b": array("d", [0.5, 1.5, 2.5])}
+    assert read_columns(path, names=["b"]) == {"b": array("d", [0.5, 1.5, 2.5])}
+
+    with pytest.raises(ValueError):
+        write_columns(path, {"a": array("q", [1]), "b": array("d", [])})
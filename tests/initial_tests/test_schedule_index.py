@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+@pytest.fixture
+def current_time():
+    return datetime(2025, 10, 16, 14, 0, 0)
+
+
+@pytest.fixture
+def year_schedule(current_time):
+    """Agenda de um ano inteiro, com um acionamento a cada 15 minutos."""
+    start = datetime(2025, 1, 1, 0, 0, 0)
+    return [DeviceSchedule(f"Device{i % 7}", start + timedelta(minutes=15 * i)) for i in range(35040)]
+
+
+def manage(scheduled_devices, current_time):
+    return SmartEnergyManagementSystem().manage_energy(
+        current_price=0.30,
+        price_threshold=0.20,
+        device_priorities={"Device1": 2, "Device3": 3, "Lights": 2},
+        current_time=current_time,
+        current_temperature=22.0,
+        desired_temperature_range=(20.0, 24.0),
+        energy_usage_limit=50.0,
+        total_energy_used_today=25.0,
+        scheduled_devices=scheduled_devices,
+    )
+
+
+def test_index_is_a_drop_in_replacement(year_schedule, current_time):
+    """
+    manage_energy deve produzir o mesmo resultado recebendo a lista ou o índice.
+    """
+    from_list = manage(year_schedule, current_time)
+    from_index = manage(ScheduleIndex(year_schedule), current_time)
+
+    assert from_index.device_status == from_list.device_status
+    assert from_index.total_energy_used == from_list.total_energy_used
+
+
+def test_lookup_returns_only_matching_schedules(year_schedule, current_time):
+    index = ScheduleIndex(year_schedule)
+    extra = DeviceSchedule("Lights", current_time)
+    index.add(extra)
+
+    matches = index.at(current_time)
+
+    assert len(index) == len(year_schedule) + 1
+    assert extra in matches
+    assert all(schedule.scheduled_time == current_time for schedule in matches)
+    assert len(matches) == 2
+    assert index.at(datetime(1999, 1, 1)) == []
+
+
+def test_incremental_insertion_and_deletion(current_time):
+    """
+    Inserções e remoções incrementais refletem imediatamente nas ativações de manage_energy.
+    """
+    index = ScheduleIndex()
+    schedule = DeviceSchedule("Lights", current_time)
+
+    index.add(schedule)
+    assert manage(index, current_time).device_status["Lights"] is True
+
+    index.remove(schedule)
+    assert schedule not in index
+    assert len(index) == 0
+    assert manage(index, current_time).device_status["Lights"] is False
+
+    with pytest.raises(ValueError):
+        index.remove(schedule)
+
+
+def test_iteration_yields_every_schedule(year_schedule):
+    index = ScheduleIndex(year_schedule[:100])
+
+    assert sorted(map(id, index)) == sorted(map(id, year_schedule[:100]))
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import pytest
+from datetime import timedelta
+from benchmarks.fraud_scoring_load_test import main as load_test
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.ScoringClient import ScoringClient
+from src.fraud.ScoringProtocol import (FRAME_HEADER, MAX_FRAME_SIZE, REQUEST_HEADER, decode_request,
+                                       decode_response, encode_request, encode_response)
+from src.fraud.ScoringServer import ScoringServer
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+def test_protocol_round_trip(now, result_tuple):
+    transaction = Transaction(123.45, now + timedelta(microseconds=7), "São Paulo", "padaria ção")
+    frame = encode_request(9, "conta-ç", transaction)
+
+    assert FRAME_HEADER.unpack_from(frame)[0] == len(frame) - FRAME_HEADER.size
+    request_id, account_id, decoded = decode_request(frame[FRAME_HEADER.size:])
+    assert (request_id, account_id) == (9, "conta-ç")
+    assert (decoded.amount, decoded.timestamp, decoded.location, decoded.merchant) == \
+           (123.45, transaction.timestamp, "São Paulo", "padaria ção")
+    assert decode_request(encode_request(1, "a", Transaction(1.0, now, "SP"))[FRAME_HEADER.size:])[2].merchant is None
+
+    response = encode_response(9, FraudCheckResult(True, False, True, 70))
+    assert len(response) == FRAME_HEADER.size + 7
+    assert result_tuple(decode_response(response[FRAME_HEADER.size:])[1]) == (True, False, True, 70)
+
+
+@pytest.mark.parametrize("workers, transport", [(0, "unix"), (2, "tcp")])
+def test_pipelined_scoring_matches_direct_checks(tmp_path, now, workers, transport, transaction_stream,
+                                                 result_tuple):
+    """
+    Pedidos em pipeline numa conexão persistente devem receber as mesmas decisões
+    que check_stored aplicado em sequência.
+    """
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(5, max_count=2)])
+    requests = transaction_stream(8, 400, now, gaps=(20,), amounts=(20.0, 300.0, 15000.0),
+                                  locations=("SP", "RJ", "Recife"), merchants=(None, "loja-1", "padaria ção"),
+                                  accounts=20)
+    store = fraud_system.new_account_store()
+    expected = [result_tuple(fraud_system.check_stored(account_id, transaction, store, ["Recife"]))
+                for account_id, transaction in requests]
+
+    async def scenario():
+        async with ScoringServer(FraudDetectionSystem(velocity_rules=[VelocityRule(5, max_count=2)]), ["Recife"],
+                                 workers=workers) as server:
+            if transport == "unix":
+                address = await server.start(path=str(tmp_path / "scoring.sock"))
+                client = await ScoringClient.connect(address)
+            else:
+                host, port = await server.start()
+                client = await ScoringClient.connect(host=host, port=port)
+            results = await asyncio.gather(*(client.score(account_id, transaction)
+                                             for account_id, transaction in requests))
+            await client.close()
+            return [result_tuple(result) for result in results], server.requests
+
+    results, served = asyncio.run(scenario())
+
+    assert results == expected
+    assert served == len(requests)
+    assert not os.path.exists(tmp_path / "scoring.sock")
+
+
+def test_oversized_frame_closes_the_connection(tmp_path):
+    async def scenario():
+        async with ScoringServer(FraudDetectionSystem(), workers=0) as server:
+            path = await server.start(path=str(tmp_path / "scoring.sock"))
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(FRAME_HEADER.pack(MAX_FRAME_SIZE + 1))
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return data
+
+    assert asyncio.run(scenario()) == b""
+
+
+class ExplodingBlacklist(list):
+    def __contains__(self, location):
+        if location == "Explode":
+            raise RuntimeError("blacklist indisponível")
+        return super().__contains__(location)
+
+
+def malformed_frames(now):
+    valid = encode_request(3, "conta-1", Transaction(10.0, now, "SP"))[FRAME_HEADER.size:]
+    invalid_utf8 = bytearray(valid)
+    invalid_utf8[REQUEST_HEADER.size] = 0xFF
+    truncated = valid[:-1]
+    short = valid[:6]
+    out_of_range = encode_request(3, "conta-1", Transaction(10.0, now, "SP"))[FRAME_HEADER.size:]
+    out_of_range = out_of_range[:12] + (2 ** 62).to_bytes(8, "little") + out_of_range[20:]
+    payloads = [bytes(invalid_utf8), truncated, short, out_of_range]
+    return [FRAME_HEADER.pack(len(payload)) + payload for payload in payloads]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_malformed_and_failing_requests_get_error_responses(tmp_path, now, workers, result_tuple):
+    """
+    UTF-8 inválido, payload curto ou truncado, horário fora do intervalo e falhas ao avaliar um pedido viram respostas
+    de erro; a conexão e os shards continuam servindo os pedidos seguintes.
+    """
+    async def scenario():
+        async with ScoringServer(FraudDetectionSystem(), ExplodingBlacklist(["Recife"]), workers=workers) as server:
+            path = await server.start(path=str(tmp_path / "scoring.sock"))
+            reader, writer = await asyncio.open_unix_connection(path)
+            for frame in malformed_frames(now):
+                writer.write(frame)
+            writer.write(encode_request(4, "conta-2", Transaction(10.0, now, "Explode")))
+            await writer.drain()
+            responses = {}
+            for _ in range(5):
+                size = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))[0]
+                request_id, result = decode_response(await reader.readexactly(size))
+                responses.setdefault(request_id, []).append(result)
+            writer.close()
+
+            client = await ScoringClient.connect(path)
+            with pytest.raises(ValueError):
+                await client.score("conta-3", Transaction(10.0, now, "Explode"))
+            results = await asyncio.gather(*(client.score(f"conta-{index}", Transaction(10.0, now, "Recife"))
+                                             for index in range(20)))
+            await client.close()
+            return responses, results
+
+    responses, results = asyncio.run(scenario())
+
+    # O id só é recuperável quando cabe no payload; o pedido curto de 6 bytes ainda o traz
+    assert responses == {3: [None, None, None, None], 4: [None]}
+    assert [result_tuple(result) for result in results] == [(False, True, False, 100)] * 20
+
+
+def test_decode_request_rejects_malformed_payloads(now):
+    for frame in malformed_frames(now):
+        with pytest.raises(ValueError):
+            decode_request(frame[FRAME_HEADER.size:])
+    with pytest.raises(ValueError):
+        decode_request(b"")
+
+
+def test_client_fails_pending_requests_when_server_closes(tmp_path, now):
+    """
+    Se o servidor encerra a conexão, os pedidos pendentes falham em vez de ficarem presos.
+    """
+    async def scenario():
+        server = ScoringServer(FraudDetectionSystem(), workers=0)
+        path = await server.start(path=str(tmp_path / "scoring.sock"))
+        client = await ScoringClient.connect(path)
+        await client.score("conta-1", Transaction(10.0, now, "SP"))
+        for writer in list(server._writers.values()):
+            writer.close()
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(client.score("conta-1", Transaction(10.0, now, "SP")), timeout=5)
+        await client.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_load_test_reports_tail_latency(capsys):
+    assert load_test(["--workers", "1", "--requests", "300", "--connections", "2", "--pipeline", "4"]) == 0
+
+    output = capsys.readouterr().out
+    assert "requests served:  300" in output
+    assert "latency p99:" in output
@@ -0,0 +1,66 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.HomeProfile import HomeProfile
+from src.energy.ShardedFleetExecutor import ShardedFleetExecutor
+
+
+@pytest.fixture
+def start():
+    return datetime(2025, 10, 16, 21, 0, 0)
+
+
+def make_homes(count, start, seed=39):
+    rng = random.Random(seed)
+    devices = ["Security", "Refrigerator", "Lights", "Oven", "TV", "Heating"]
+    return [
+        HomeProfile({device: rng.randint(1, 3) for device in devices if rng.random() < 0.8},
+                    rng.choice([0.2, 0.3]), (18.0, 24.0), rng.choice([5.0, 10.0]),
+                    [DeviceSchedule("Washer", start + timedelta(hours=rng.randint(0, 5)))])
+        for _ in range(count)
+    ]
+
+
+def test_sharded_ticks_match_manage_energy(start):
+    """
+    Com as casas particionadas entre 2 processos, cada tick deve reproduzir manage_energy por casa,
+    com o consumo acumulado mantido pelos workers e zerado na virada do dia.
+    """
+    homes = make_homes(40, start)
+    rng = random.Random(1)
+    energy_system = SmartEnergyManagementSystem()
+    usage = [0.0] * len(homes)
+
+    with ShardedFleetExecutor(homes, workers=2) as executor:
+        for tick in range(6):
+            current_time = start + timedelta(hours=tick)
+            if current_time.hour == 0:
+                usage = [0.0] * len(homes)
+            price = rng.choice([0.1, 0.25, 0.4])
+            temperatures = [rng.uniform(12.0, 30.0) for _ in homes]
+            deltas = [rng.uniform(0.0, 4.0) for _ in homes]
+
+            result = executor.tick(price, current_time, temperatures, deltas)
+
+            for home, profile in enumerate(homes):
+                usage[home] += deltas[home]
+                expected = energy_system.manage_energy(price, profile.price_threshold, profile.device_priorities,
+                                                       current_time, temperatures[home],
+                                                       profile.desired_temperature_range,
+                                                       profile.energy_usage_limit, usage[home],
+                                                       profile.scheduled_devices)
+                assert result.status_for(home) == expected.device_status
+                assert bool(result.energy_saving_mode[home]) == expected.energy_saving_mode
+                assert bool(result.temperature_regulation_active[home]) == expected.temperature_regulation_active
+                assert result.total_energy_used[home] == pytest.approx(expected.total_energy_used)
+
+        assert executor.ticks == 6
+        assert executor.ticks_per_second > 0
+
+
+def test_tick_validates_inputs(start):
+    with ShardedFleetExecutor(make_homes(3, start), workers=2) as executor:
+        with pytest.raises(ValueError):
+            executor.tick(0.1, start, [20.0], [0.0, 0.0, 0.0])
@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import uuid
+import pytest
+from datetime import datetime
+from multiprocessing import shared_memory
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.SharedBlacklist import SharedBlacklist
+from src.fraud.Transaction import Transaction
+
+
+@pytest.fixture
+def blacklist():
+    shared = SharedBlacklist(f"frbl_{os.getpid()}_{uuid.uuid4().hex[:8]}", create=True,
+                             locations=["Campinas", "Recife", "São José"])
+    yield shared
+    shared.unlink()
+
+
+def generation_locations(always, generation):
+    """Conteúdo publicado na geração: fixo, um marcador da geração e um bloco de tamanho variável."""
+    return always + [f"geracao-{generation}"] + [f"local-{generation}-{index}" for index in range(50 * (generation % 3))]
+
+
+def _worker_lookups(blacklist, always, never, generations_wanted, results):
+    # Cada passada fixa uma geração: todas as consultas dela devem concordar com o conteúdo daquela geração
+    errors = 0
+    generations = set()
+    passes = 0
+    while len(generations) < generations_wanted and passes < 500000:
+        passes += 1
+        with blacklist.pinned() as generation:
+            generations.add(generation)
+            errors += sum(location not in blacklist for location in always)
+            errors += sum(location in blacklist for location in never)
+            errors += f"geracao-{generation - 1}" in blacklist
+            errors += f"geracao-{generation + 1}" in blacklist
+            if generation > 1:
+                errors += f"geracao-{generation}" not in blacklist
+                errors += len(blacklist) != len(generation_locations(always, generation))
+    results.put((sorted(generations), errors))
+    blacklist.close()
+
+
+def test_membership_matches_a_set():
+    """
+    A tabela hash em memória compartilhada deve responder igual a um conjunto exato.
+    """
+    locations = {f"local-{index}" for index in range(3000)} | {"Ribeirão Preto", ""}
+    shared = SharedBlacklist(f"frbl_{os.getpid()}_{uuid.uuid4().hex[:8]}", create=True, locations=locations)
+    try:
+        queries = list(locations) + [f"outro-{index}" for index in range(3000)]
+        assert all((query in shared) == (query in locations) for query in queries)
+        assert len(shared) == len(locations)
+    finally:
+        shared.unlink()
+
+
+def test_publish_swaps_generation_for_attached_readers(blacklist):
+    reader = SharedBlacklist(blacklist.name)
+    assert "Recife" in reader
+    assert reader.generation == 1
+
+    generation = blacklist.publish(["Manaus"])
+
+    assert generation == reader.generation == 2
+    assert "Manaus" in reader
+    assert "Recife" not in reader
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=f"{blacklist.name}_1")
+    reader.close()
+
+
+def test_only_the_owner_publishes(blacklist):
+    reader = SharedBlacklist(blacklist.name)
+    with pytest.raises(PermissionError):
+        reader.publish(["Manaus"])
+    reader.close()
+
+
+def test_check_for_fraud_blocks_shared_blacklisted_location(blacklist):
+    fraud_system = FraudDetectionSystem()
+    now = datetime(2025, 10, 16, 12, 0, 0)
+
+    blocked = fraud_system.check_for_fraud(Transaction(100, now, "São José"), [], blacklist)
+    allowed = fraud_system.check_for_fraud(Transaction(100, now, "Manaus"), [], blacklist)
+
+    assert blocked.is_blocked and blocked.risk_score == 100
+    assert not allowed.is_blocked
+
+
+def test_worker_process_sees_reloads_without_copies(blacklist):
+    """
+    Um processo de trabalho recebe apenas o nome dos segmentos e acompanha as novas gerações
+    enquanto o dono publica; cada passada fixada lê uma única geração completa.
+    """
+    always = ["Campinas", "Recife"]
+    never = ["Manaus", "Belém"]
+    results = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_worker_lookups, args=(blacklist, always, never, 10, results))
+    worker.start()
+    # Publica sem parar até o leitor ter passado por várias gerações
+    while results.empty() and worker.is_alive():
+        blacklist.publish(generation_locations(always, blacklist.generation + 1))
+    generations, errors = results.get(timeout=30)
+    worker.join(timeout=30)
+
+    assert worker.exitcode == 0
+    assert errors == 0
+    assert len(generations) == 10
+    assert generations[-1] <= blacklist.generation
+
+
+def test_pinned_pass_ignores_concurrent_publish(blacklist):
+    reader = SharedBlacklist(blacklist.name)
+
+    with reader.pinned() as generation:
+        blacklist.publish(["Manaus"])
+        assert generation == 1
+        assert "Recife" in reader and "Manaus" not in reader
+        assert len(reader) == 3
+
+    assert "Manaus" in reader and "Recife" not in reader
+    reader.close()
+
+
+def test_independent_processes_attach_in_turn(blacklist):
+    """
+    Processos sem relação com o dono abrem a blacklist e terminam sem remover os segmentos:
+    o próximo processo ainda consegue abri-la e o dono a remove normalmente.
+    """
+    code = ("import sys; from src.fraud.SharedBlacklist import SharedBlacklist; "
+            "shared = SharedBlacklist(sys.argv[1]); print('Recife' in shared, shared.generation); shared.close()")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    for _ in range(2):
+        output = subprocess.run([sys.executable, "-c", code, blacklist.name], cwd=root, capture_output=True,
+                                text=True, timeout=30)
+        assert output.returncode == 0, output.stderr
+        assert output.stdout.split() == ["True", "1"]
+        assert "leaked" not in output.stderr
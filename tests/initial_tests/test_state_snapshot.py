@@ -0,0 +1,209 @@
+import itertools
+import multiprocessing
+import pytest
+from datetime import timedelta
+from src.fraud.AmountAnomalyRule import AmountAnomalyRule
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.StateSnapshot import StateSnapshot, write_snapshot
+from src.fraud.StateSnapshotter import StateSnapshotter
+from src.fraud.Transaction import Transaction
+from src.fraud.VelocityRule import VelocityRule
+
+
+@pytest.fixture
+def fraud_system():
+    return FraudDetectionSystem(velocity_rules=[VelocityRule(5, max_count=2)],
+                                amount_rule=AmountAnomalyRule(window=10, min_history=3))
+
+
+LOG_STREAM = dict(gaps=range(1, 91), amounts=(25.0, 70.0, 4000.0), locations=("SP", "RJ", "Recife"))
+
+
+def decisions(fraud_system, store, log):
+    return [(result.verification_required, result.is_blocked, result.risk_score)
+            for result in (fraud_system.check_stored(account_id, transaction, store, [])
+                           for account_id, transaction in log)]
+
+
+def test_write_and_read_snapshot_records(tmp_path):
+    path = str(tmp_path / "estado.snap")
+    count = write_snapshot(path, [("a", b"\x01"), ("b", b""), ("ção", b"\x02\x03")], log_offset=42)
+
+    snapshot = StateSnapshot(path)
+    assert count == len(snapshot) == 3
+    assert snapshot.log_offset == 42
+    assert snapshot.record("ção") == b"\x02\x03"
+    assert snapshot.record("b") == b""
+    assert snapshot.record("c") is None
+    assert "a" in snapshot and "z" not in snapshot
+    assert [account_id for account_id, _ in snapshot.items()] == ["a", "b", "ção"]
+    snapshot.close()
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "outro.bin"
+    path.write_bytes(bytes(64))
+
+    with pytest.raises(ValueError):
+        StateSnapshot(str(path))
+
+
+def test_restore_and_replay_matches_uninterrupted_run(fraud_system, now, tmp_path, transaction_stream):
+    """
+    Restaurar o snapshot e reprocessar o log a partir do offset gravado deve reproduzir
+    as decisões de um processamento sem reinício.
+    """
+    log = transaction_stream(4, 1500, now, accounts=120, **LOG_STREAM)
+    uninterrupted = decisions(fraud_system, fraud_system.new_account_store(), log)
+
+    path = str(tmp_path / "estado.snap")
+    store = fraud_system.new_account_store(max_accounts=30)
+    decisions(fraud_system, store, log[:900])
+    snapshotter = StateSnapshotter(store, path)
+    assert snapshotter.snapshot(900)
+    snapshotter.wait()
+
+    snapshot = StateSnapshot(path)
+    restored = fraud_system.new_account_store(max_accounts=30, snapshot=snapshot)
+    resumed = decisions(fraud_system, restored, log[snapshot.log_offset:])
+
+    assert resumed == uninterrupted[900:]
+    assert len(snapshot) == len({account_id for account_id, _ in log[:900]})
+    assert restored.metrics.restored > 0
+    snapshot.close()
+
+
+def test_snapshot_of_restored_store_keeps_untouched_accounts(fraud_system, now, tmp_path, transaction_stream):
+    log = transaction_stream(5, 400, now, accounts=50, **LOG_STREAM)
+    store = fraud_system.new_account_store(path=str(tmp_path / "frio.sqlite"), max_accounts=10)
+    decisions(fraud_system, store, log[:200])
+    first = StateSnapshotter(store, str(tmp_path / "primeiro.snap"))
+    first.snapshot(200)
+    first.wait()
+
+    snapshot = StateSnapshot(str(tmp_path / "primeiro.snap"))
+    restored = fraud_system.new_account_store(snapshot=snapshot)
+    decisions(fraud_system, restored, log[200:210])
+    second = StateSnapshotter(restored, str(tmp_path / "segundo.snap"))
+    second.snapshot(210)
+    second.wait()
+
+    again = StateSnapshot(str(tmp_path / "segundo.snap"))
+    touched = {account_id for account_id, _ in log[200:210]}
+    assert len(again) == len({account_id for account_id, _ in log[:210]})
+    for account_id, record in snapshot.items():
+        if account_id not in touched:
+            assert again.record(account_id) == record
+    again.close()
+    snapshot.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="snapshot em segundo plano usa fork")
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_spills_proceed_while_a_snapshot_is_reading(fraud_system, now, tmp_path, monkeypatch, in_memory, transaction_stream):
+    """
+    Enquanto o processo de snapshot mantém a varredura das contas frias aberta, o processamento
+    continua despejando contas sem esperar por lock, e o snapshot reflete o instante do fork.
+    """
+    log = transaction_stream(6, 1200, now, accounts=150, **LOG_STREAM)
+    uninterrupted = decisions(fraud_system, fraud_system.new_account_store(), log)
+    path = ":memory:" if in_memory else str(tmp_path / "frio.sqlite")
+    store = fraud_system.new_account_store(path=path, max_accounts=20)
+    decisions(fraud_system, store, log[:600])
+
+    context = multiprocessing.get_context("fork")
+    reading = context.Event()
+    spilled = context.Event()
+    write_snapshot_items = write_snapshot
+
+    def paused_write_snapshot(snapshot_path, items, log_offset):
+        # A mesclagem já abriu a varredura do sqlite ao produzir o primeiro item
+        items = iter(items)
+        first = next(items)
+        reading.set()
+        spilled.wait(10)
+        return write_snapshot_items(snapshot_path, itertools.chain([first], items), log_offset)
+
+    monkeypatch.setattr("src.fraud.StateSnapshotter.write_snapshot", paused_write_snapshot)
+    snapshotter = StateSnapshotter(store, str(tmp_path / "estado.snap"))
+    snapshotter.snapshot(600)
+    assert reading.wait(10)
+
+    evictions = store.metrics.evictions
+    assert decisions(fraud_system, store, log[600:]) == uninterrupted[600:]
+    assert store.metrics.evictions > evictions
+    spilled.set()
+    snapshotter.wait()
+
+    snapshot = StateSnapshot(str(tmp_path / "estado.snap"))
+    restored = fraud_system.new_account_store(snapshot=snapshot)
+    assert decisions(fraud_system, restored, log[600:]) == uninterrupted[600:]
+    snapshot.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="snapshot em segundo plano usa fork")
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_snapshot_ignores_spills_before_the_child_reads(fraud_system, now, tmp_path, monkeypatch, in_memory, transaction_stream):
+    """
+    Mesmo que o filho só comece a consumir as contas depois que o processamento despejou e recarregou
+    contas, o snapshot corresponde ao instante de snapshot(): a reexecução do log não conta nada duas vezes.
+    """
+    log = transaction_stream(6, 1200, now, accounts=150, **LOG_STREAM)
+    uninterrupted = decisions(fraud_system, fraud_system.new_account_store(), log)
+    path = ":memory:" if in_memory else str(tmp_path / "frio.sqlite")
+    store = fraud_system.new_account_store(path=path, max_accounts=20)
+    decisions(fraud_system, store, log[:600])
+
+    context = multiprocessing.get_context("fork")
+    processed = context.Event()
+    write_snapshot_items = write_snapshot
+
+    def delayed_write_snapshot(snapshot_path, items, log_offset):
+        processed.wait(10)
+        return write_snapshot_items(snapshot_path, items, log_offset)
+
+    monkeypatch.setattr("src.fraud.StateSnapshotter.write_snapshot", delayed_write_snapshot)
+    snapshotter = StateSnapshotter(store, str(tmp_path / "estado.snap"))
+    snapshotter.snapshot(600)
+
+    evictions, reloads = store.metrics.evictions, store.metrics.reloads
+    assert decisions(fraud_system, store, log[600:]) == uninterrupted[600:]
+    assert store.metrics.evictions > evictions and store.metrics.reloads > reloads
+    processed.set()
+    snapshotter.wait()
+
+    snapshot = StateSnapshot(str(tmp_path / "estado.snap"))
+    restored = fraud_system.new_account_store(snapshot=snapshot)
+    assert decisions(fraud_system, restored, log[600:]) == uninterrupted[600:]
+    snapshot.close()
+
+
+def test_maybe_snapshot_respects_interval(fraud_system, tmp_path):
+    """
+    O snapshot periódico só é disparado a cada every_events eventos do log.
+    """
+    snapshotter = StateSnapshotter(fraud_system.new_account_store(), str(tmp_path / "estado.snap"), every_events=100)
+
+    assert snapshotter.maybe_snapshot(0)
+    snapshotter.wait()
+    assert not snapshotter.maybe_snapshot(50)
+    assert snapshotter.maybe_snapshot(120)
+    snapshotter.wait()
+
+    snapshot = StateSnapshot(str(tmp_path / "estado.snap"))
+    assert snapshotter.snapshots == 2
+    assert snapshot.log_offset == 120
+    snapshot.close()
+
+
+def test_bucketed_state_serializes_only_used_buckets(fraud_system, now):
+    """
+    Contadores por minuto gravam só os buckets ocupados, mantendo o snapshot compacto.
+    """
+    state = fraud_system.new_account_state()
+    state.record(Transaction(30.0, now, "SP"))
+    one_transaction = len(state.to_bytes())
+    state.record(Transaction(30.0, now + timedelta(minutes=1), "SP"))
+
+    assert one_transaction < 300
+    assert len(state.to_bytes()) == one_transaction + 2 * 16
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.HomeProfile import HomeProfile
+from src.energy.TelemetryEvent import METER, PRICE, TEMPERATURE, TelemetryEvent
+from src.energy.TelemetryPipeline import TelemetryPipeline
+
+
+@pytest.fixture
+def profile():
+    return HomeProfile({"Security": 1, "Lights": 2, "Oven": 3}, 0.25, (18.0, 24.0), 30.0)
+
+
+@pytest.fixture
+def start():
+    return datetime(2025, 10, 16, 12, 0, 0)
+
+
+def test_pipeline_emits_manage_energy_results(profile, start):
+    """
+    Com resultados completos, cada evento avaliado deve gerar o mesmo resultado que manage_energy
+    com o consumo acumulado pelos medidores.
+    """
+    pipeline = TelemetryPipeline({"casa-1": profile}, full_results=True)
+    events = [
+        TelemetryEvent(PRICE, start, 0.10),
+        TelemetryEvent(TEMPERATURE, start, 21.0, "casa-1"),
+        TelemetryEvent(METER, start + timedelta(minutes=5), 12.0, "casa-1"),
+        TelemetryEvent(PRICE, start + timedelta(minutes=10), 0.40),
+        TelemetryEvent(METER, start + timedelta(minutes=15), 20.0, "casa-1"),
+    ]
+
+    updates = list(pipeline.process(events))
+
+    energy_system = SmartEnergyManagementSystem()
+    totals = [0.0, 12.0, 12.0, 32.0]
+    prices = [0.10, 0.10, 0.40, 0.40]
+    assert len(updates) == 4
+    for update, event, total, price in zip(updates, events[1:], totals, prices):
+        expected = energy_system.manage_energy(price, 0.25, profile.device_priorities, event.timestamp, 21.0,
+                                               (18.0, 24.0), 30.0, total, [])
+        assert update.home_id == "casa-1"
+        assert update.result.device_status == expected.device_status
+        assert update.result.total_energy_used == expected.total_energy_used
+
+
+def test_only_changes_are_emitted_by_default(profile, start):
+    pipeline = TelemetryPipeline({"casa-1": profile})
+    events = [
+        TelemetryEvent(PRICE, start, 0.10),
+        TelemetryEvent(TEMPERATURE, start, 21.0, "casa-1"),
+        TelemetryEvent(TEMPERATURE, start + timedelta(minutes=1), 21.5, "casa-1"),
+        TelemetryEvent(PRICE, start + timedelta(minutes=2), 0.40),
+    ]
+
+    updates = list(pipeline.process(events))
+
+    # A segunda leitura de temperatura não muda nenhuma regra e não gera atualização
+    assert [update.changes for update in updates] == [
+        {"Security": True, "Lights": True, "Oven": True},
+        {"Lights": False, "Oven": False},
+    ]
+    assert all(update.result is None for update in updates)
+
+
+def test_total_energy_resets_at_midnight(profile):
+    """
+    O consumo acumulado do dia é zerado na primeira leitura após a meia-noite; leituras atrasadas
+    do dia anterior são descartadas.
+    """
+    pipeline = TelemetryPipeline({"casa-1": profile})
+    late_evening = datetime(2025, 10, 16, 23, 50, 0)
+
+    list(pipeline.process([
+        TelemetryEvent(METER, late_evening, 25.0, "casa-1"),
+        TelemetryEvent(METER, late_evening + timedelta(minutes=20), 3.0, "casa-1"),
+        TelemetryEvent(METER, late_evening + timedelta(minutes=5), 7.0, "casa-1"),
+    ]))
+
+    assert pipeline.total_energy_used_today("casa-1") == 3.0
+    assert pipeline.dropped_events == 1
+
+
+def test_unknown_homes_are_dropped(profile, start):
+    pipeline = TelemetryPipeline({"casa-1": profile})
+
+    assert list(pipeline.process([TelemetryEvent(METER, start, 1.0, "casa-2")])) == []
+    assert pipeline.dropped_events == 1
+
+
+def test_async_pipeline_applies_back_pressure(profile, start):
+    """
+    Com uma fila limitada a 1 item, o produtor só avança quando o consumidor retira atualizações.
+    """
+    pipeline = TelemetryPipeline({"casa-1": profile}, full_results=True)
+    consumed_events = []
+
+    async def events():
+        for minute in range(5):
+            consumed_events.append(minute)
+            yield TelemetryEvent(PRICE if minute == 0 else TEMPERATURE, start + timedelta(minutes=minute),
+                                 0.10 if minute == 0 else 21.0, None if minute == 0 else "casa-1")
+
+    async def scenario():
+        queue = asyncio.Queue(maxsize=1)
+        producer = asyncio.create_task(pipeline.forward(events(), queue))
+        await asyncio.sleep(0.01)
+        read_before_consuming = len(consumed_events)
+        updates = [await queue.get() for _ in range(4)]
+        await producer
+        return read_before_consuming, updates
+
+    read_before_consuming, updates = asyncio.run(scenario())
+
+    assert read_before_consuming < 5
+    assert len(updates) == 4
+
+
+def test_invalid_event_kind():
+    with pytest.raises(ValueError):
+        TelemetryEvent("humidity", datetime(2025, 10, 16), 50.0, "casa-1")
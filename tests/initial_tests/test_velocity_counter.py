@@ -0,0 +1,94 @@
+import random
+import sys
+import pytest
+from datetime import timedelta
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.VelocityCounter import VelocityCounter
+from src.fraud.VelocityRule import VelocityRule
+
+
+def test_exact_mode_matches_check_for_fraud(now, transaction_stream, result_tuple):
+    """
+    No modo exato, o estado por conta deve reproduzir check_for_fraud com o histórico completo
+    para um fluxo ordenado de transações, incluindo regras de janelas adicionais.
+    """
+    fraud_system = FraudDetectionSystem(velocity_rules=[VelocityRule(5, max_count=2), VelocityRule(1440, max_amount=20000)])
+    state = fraud_system.new_account_state(exact=True)
+    stream = transaction_stream(42, 800, now)
+    blacklist = ["BH"]
+
+    for index, transaction in enumerate(stream):
+        expected = fraud_system.check_for_fraud(transaction, stream[:index], blacklist)
+        result = fraud_system.check_account(transaction, state, blacklist)
+        assert result_tuple(result) == result_tuple(expected)
+
+
+def test_exact_mode_keeps_the_sixty_minute_boundary(now):
+    counter = VelocityCounter(60, exact=True)
+    counter.add(now - timedelta(minutes=60), 10.0)
+    counter.add(now - timedelta(minutes=59), 5.0)
+    counter.add(now - timedelta(minutes=30), 1.0)
+
+    assert counter.count(now) == 3
+    assert counter.count(now + timedelta(seconds=1)) == 2
+    assert counter.amount(now + timedelta(seconds=1)) == 6.0
+
+
+def test_exact_mode_accepts_out_of_order_events(now, transaction_stream):
+    """
+    Eventos adicionados fora de ordem não podem ficar presos atrás de eventos mais novos:
+    a contagem segue a mesma fronteira de check_for_fraud sobre o histórico completo.
+    """
+    stream = transaction_stream(7, 300, now)
+    shuffled = stream[:]
+    random.Random(7).shuffle(shuffled)
+    counter = VelocityCounter(60, exact=True)
+    for transaction in shuffled:
+        counter.add(transaction.timestamp, transaction.amount)
+
+    for transaction in stream:
+        in_window = [previous for previous in stream
+                     if (transaction.timestamp - previous.timestamp).total_seconds() / 60 <= 60]
+        assert counter.count(transaction.timestamp) == len(in_window)
+        assert counter.amount(transaction.timestamp) == pytest.approx(sum(previous.amount for previous in in_window))
+
+
+def test_bucketed_mode_counts_by_minute(now):
+    """
+    No modo por buckets, a janela cobre os minutos [atual - 60, atual]: pode incluir até um minuto
+    a mais que o modo exato, nunca menos.
+    """
+    counter = VelocityCounter(60)
+    for minutes in (0, 10, 59, 60, 61, 200):
+        counter.add(now - timedelta(minutes=minutes, seconds=-30), 1.0)
+
+    assert counter.count(now) == 4
+    assert counter.count(now + timedelta(minutes=1)) == 3
+    assert counter.count(now + timedelta(hours=3)) == 0
+    assert counter.amount(now + timedelta(hours=3)) == 0.0
+
+
+def test_bucketed_mode_stays_within_one_minute_of_exact(now, transaction_stream):
+    exact = VelocityCounter(60, exact=True)
+    widened = VelocityCounter(61, exact=True)
+    bucketed = VelocityCounter(60)
+    for transaction in transaction_stream(3, 2000, now):
+        count = bucketed.count(transaction.timestamp)
+        assert exact.count(transaction.timestamp) <= count <= widened.count(transaction.timestamp)
+        for counter in (exact, widened, bucketed):
+            counter.add(transaction.timestamp)
+
+
+def test_bucketed_memory_is_constant(now):
+    """
+    A memória do contador por buckets não cresce com o número de transações.
+    """
+    counter = VelocityCounter(60)
+    counter.add(now)
+    size_before = sys.getsizeof(counter._counts)
+
+    for second in range(0, 100000, 3):
+        counter.add(now + timedelta(seconds=second))
+
+    assert sys.getsizeof(counter._counts) == size_before
+    assert counter.count(now + timedelta(seconds=99999)) > 10